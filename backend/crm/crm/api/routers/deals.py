@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Annotated
+import re
+from typing import Annotated, get_args
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import ValidationError
 
 from crm.app.dependencies import get_deal_service
@@ -12,6 +13,8 @@ from crm.domain.services import DealService
 
 router = APIRouter(prefix="/deals", tags=["deals"])
 
+_STAGE_CURSOR_PARAM = re.compile(r"stageCursor\[(\w+)\]")
+
 
 def _build_deal_filters(
     stage: str | None,
@@ -114,6 +117,47 @@ async def get_stage_metrics(
     return list(await service.get_stage_metrics(filters))
 
 
+@router.get("/pipeline", response_model=schemas.DealPipeline)
+async def get_pipeline(
+    request: Request,
+    service: Annotated[DealService, Depends(get_deal_service)],
+    per_stage: Annotated[
+        int, Query(alias="perStage", ge=1, le=schemas.DEAL_PIPELINE_MAX_PER_STAGE)
+    ] = 50,
+    manager: Annotated[list[str] | None, Query()] = None,
+    period: Annotated[str | None, Query()] = None,
+    search: Annotated[str | None, Query()] = None,
+) -> schemas.DealPipeline:
+    filters = _build_deal_filters(None, manager, period, search)
+    cursors = _parse_stage_cursors(request)
+    try:
+        return await service.get_pipeline(
+            per_stage=per_stage, cursors=cursors, filters=filters
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="invalid_cursor",
+        ) from exc
+
+
+def _parse_stage_cursors(request: Request) -> dict[schemas.DealStage, str]:
+    """Collect ``stageCursor[<stage>]=<cursor>`` query parameters."""
+    cursors: dict[schemas.DealStage, str] = {}
+    for key, value in request.query_params.items():
+        match = _STAGE_CURSOR_PARAM.fullmatch(key)
+        if match is None or not value:
+            continue
+        stage = match.group(1)
+        if stage not in get_args(schemas.DealStage):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="invalid_stage",
+            )
+        cursors[stage] = value  # type: ignore[index]
+    return cursors
+
+
 @router.get("/{deal_id}", response_model=schemas.DealRead)
 async def get_deal(
     deal_id: UUID,
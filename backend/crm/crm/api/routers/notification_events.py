@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 from typing import AsyncGenerator
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
 from sse_starlette.sse import EventSourceResponse
 
 from crm.app.dependencies import (
@@ -42,9 +42,12 @@ async def notifications_healthcheck() -> dict[str, str]:
 async def _stream_generator(
     request: Request,
     stream: services.NotificationStreamService,
+    last_event_id: str | None,
 ) -> AsyncGenerator[dict[str, object], None]:
-    queue = await stream.subscribe()
+    queue, missed = await stream.subscribe(last_event_id)
     try:
+        for message in missed:
+            yield message
         while True:
             if await request.is_disconnected():
                 break
@@ -55,6 +58,9 @@ async def _stream_generator(
             except asyncio.TimeoutError:
                 yield {"event": "heartbeat", "data": ""}
                 continue
+            if message is None:
+                # Disconnected as a slow consumer; the client reconnects with Last-Event-ID.
+                break
             yield message
     finally:
         await stream.unsubscribe(queue)
@@ -65,6 +71,7 @@ async def notifications_stream(
     request: Request,
     _: AuthenticatedUser = Depends(get_current_user),
     stream: services.NotificationStreamService = Depends(get_notification_stream),
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
 ) -> EventSourceResponse:
-    generator = _stream_generator(request, stream)
+    generator = _stream_generator(request, stream, last_event_id)
     return EventSourceResponse(generator, ping=None)
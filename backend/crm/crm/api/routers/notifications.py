@@ -22,11 +22,6 @@ async def enqueue_notification(
             status_code=status.HTTP_409_CONFLICT,
             detail="duplicate_notification",
         ) from exc
-    except services.NotificationDispatchError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="notification_dispatch_failed",
-        ) from exc
     return {"notification_id": str(notification.id)}
 
 router.add_api_route(
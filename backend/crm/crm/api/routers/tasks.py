@@ -116,6 +116,26 @@ router.add_api_route(
     include_in_schema=False,
 )
 
+@router.get("/board", response_model=schemas.TaskBoard)
+async def get_task_board(
+    service: Annotated[TaskService, Depends(get_task_service)],
+    assignee_id: Annotated[UUID | None, Query(alias="assigneeId")] = None,
+    limit: Annotated[int, Query(ge=1, le=100, alias="limit")] = 20,
+) -> schemas.TaskBoard:
+    return await service.get_board(assignee_id=assignee_id, limit=limit)
+
+
+@router.post(":bulk", response_model=schemas.TaskBulkResult)
+async def bulk_update_tasks(
+    payload: schemas.TaskBulkRequest,
+    service: Annotated[TaskService, Depends(get_task_service)],
+) -> schemas.TaskBulkResult:
+    try:
+        return await service.bulk_update(payload)
+    except TaskServiceError as exc:
+        _handle_task_error(exc)
+
+
 @router.get("/{task_id}", response_model=schemas.TaskRead)
 async def get_task(
     task_id: UUID,
@@ -4,6 +4,33 @@ from celery import Celery
 
 from crm.app.config import settings
 
+
+def _beat_schedule() -> dict[str, dict[str, object]]:
+    schedule: dict[str, dict[str, object]] = {
+        "promote-delayed-tasks": {
+            "task": "crm.app.tasks.promote_delayed_tasks",
+            "schedule": settings.tasks_delayed_poll_interval_ms / 1000,
+        },
+    }
+    # The in-process OutboxRelayScheduler is woken by each commit instead.
+    if settings.outbox_enabled and not settings.outbox_relay_in_process:
+        schedule["relay-outbox"] = {
+            "task": "crm.app.tasks.relay_outbox",
+            "schedule": settings.outbox_relay_poll_interval_ms / 1000,
+        }
+        schedule["purge-outbox"] = {
+            "task": "crm.app.tasks.purge_outbox",
+            "schedule": settings.outbox_purge_interval_ms / 1000,
+        }
+    # The in-process ReminderScheduler replaces polling when it is enabled.
+    if not settings.tasks_reminders_scheduler_enabled:
+        schedule["process-task-reminders"] = {
+            "task": "crm.app.tasks.process_task_reminders",
+            "schedule": settings.tasks_reminders_poll_interval_ms / 1000,
+        }
+    return schedule
+
+
 celery_app = Celery("crm.deals")
 celery_app.config_from_object(
     {
@@ -15,5 +42,6 @@ celery_app.config_from_object(
         "worker_prefetch_multiplier": 1,
         "task_default_retry_delay": settings.celery_retry_delay_seconds,
         "imports": ("crm.app.tasks",),
+        "beat_schedule": _beat_schedule(),
     }
 )
@@ -37,8 +37,14 @@ class Settings(BaseSettings):
 
     tasks_reminders_queue_key: str = Field(default="tasks:reminders")
     tasks_reminders_poll_interval_ms: int = Field(default=5000)
+    tasks_reminders_lease_ms: int = Field(default=60000)
+    tasks_reminders_publish_concurrency: int = Field(default=20)
+    tasks_reminders_scheduler_enabled: bool = Field(default=False)
+    tasks_reminders_scheduler_idle_ms: int = Field(default=60000)
     tasks_scheduling_batch_size: int = Field(default=100)
     tasks_delayed_queue_key: str = Field(default="tasks:delayed")
+    tasks_delayed_poll_interval_ms: int = Field(default=5000)
+    tasks_delayed_batch_size: int = Field(default=500)
 
     permissions_queue_name: str = Field(default="permissions:sync")
     permissions_queue_prefix: str = Field(default="bull")
@@ -58,10 +64,30 @@ class Settings(BaseSettings):
             "crm.app.tasks.sync_deal_status": {"queue": "crm.sync"},
             "crm.app.tasks.refresh_policy_state": {"queue": "crm.sync"},
             "crm.app.tasks.process_task_reminders": {"queue": "tasks.scheduler"},
+            "crm.app.tasks.promote_delayed_tasks": {"queue": "tasks.scheduler"},
+            "crm.app.tasks.relay_outbox": {"queue": "crm.outbox"},
+            "crm.app.tasks.purge_outbox": {"queue": "crm.outbox"},
         }
     )
 
     events_exchange: str = Field(default="crm.events")
+    amqp_publish_buffer_size: int = Field(default=10_000)
+    amqp_publish_batch_size: int = Field(default=100)
+    amqp_publish_flush_interval_ms: int = Field(default=5)
+    amqp_publish_max_in_flight_batches: int = Field(default=4)
+    amqp_publish_enqueue_timeout_ms: int = Field(default=1000)
+    amqp_channel_pool_size: int = Field(default=8)
+    events_stream_subscriber_queue_size: int = Field(default=256)
+    events_stream_slow_consumer_policy: str = Field(default="drop")
+    events_stream_prefetch_count: int = Field(default=100)
+    outbox_enabled: bool = Field(default=True)
+    outbox_relay_in_process: bool = Field(default=True)
+    outbox_relay_poll_interval_ms: int = Field(default=5000)
+    outbox_relay_batch_size: int = Field(default=200)
+    outbox_relay_retry_delay_ms: int = Field(default=5000)
+    outbox_retention_hours: int = Field(default=72)
+    outbox_purge_batch_size: int = Field(default=1000)
+    outbox_purge_interval_ms: int = Field(default=300_000)
     celery_retry_delay_seconds: int = Field(default=60)
 
     documents_base_url: AnyUrl = Field(
@@ -79,15 +105,43 @@ class Settings(BaseSettings):
     notifications_dispatch_redis_channel: str = Field(default="notifications:dispatch")
     notifications_dispatch_retry_attempts: int = Field(default=3)
     notifications_dispatch_retry_delay_ms: int = Field(default=60_000)
+    notifications_dispatch_retry_max_delay_ms: int = Field(default=900_000)
+    notifications_dispatch_batch_size: int = Field(default=50)
+    notifications_dispatch_poll_interval_ms: int = Field(default=1000)
+    notifications_dispatch_visibility_timeout_ms: int = Field(default=180_000)
+    notifications_dispatch_channel_concurrency: dict[str, int] = Field(
+        default_factory=lambda: {"rabbitmq": 32, "redis": 32, "events-service": 8}
+    )
     notifications_queue_name: str = Field(default="notifications.events")
     notifications_queue_routing_key: str = Field(default="notifications.*")
     notifications_queue_durable: bool = Field(default=True)
+    notifications_consumer_prefetch: int = Field(default=200)
+    notifications_consumer_workers: int = Field(default=16)
+    notifications_consumer_batch_size: int = Field(default=100)
+    notifications_consumer_batch_wait_ms: int = Field(default=20)
+    notifications_consumer_max_attempts: int = Field(default=5)
+    notifications_dlq_name: str = Field(default="notifications.events.dlq")
+    notifications_seen_events_cache_size: int = Field(default=10_000)
     notifications_sse_retry_ms: int = Field(default=5_000)
+    notifications_sse_queue_size: int = Field(default=256)
+    notifications_sse_history_size: int = Field(default=1000)
+    notifications_sse_overflow_policy: str = Field(default="drop")
+    notifications_stream_backend: str = Field(default="local")
+    notifications_stream_redis_key: str = Field(default="notifications:stream")
+    notifications_stream_redis_maxlen: int = Field(default=10_000)
     notifications_templates_default_locale: str = Field(default="ru-RU")
     notifications_telegram_enabled: bool = Field(default=False)
     notifications_telegram_mock: bool = Field(default=True)
     notifications_telegram_bot_token: Optional[str] = Field(default=None)
     notifications_telegram_default_chat_id: Optional[str] = Field(default=None)
+    notifications_telegram_api_base: str = Field(default="https://api.telegram.org")
+    notifications_telegram_rate_limit_per_second: float = Field(default=30.0)
+    notifications_telegram_chat_rate_limit_per_second: float = Field(default=1.0)
+    notifications_telegram_max_connections: int = Field(default=20)
+    notifications_telegram_max_retries: int = Field(default=3)
+    notifications_telegram_max_retry_after_s: float = Field(default=30.0)
+    notifications_telegram_global_pause_chats: int = Field(default=3)
+    notifications_telegram_global_pause_window_s: float = Field(default=1.0)
     notifications_telegram_webhook_enabled: bool = Field(default=False)
     notifications_telegram_webhook_secret: Optional[str] = Field(default=None)
     notifications_telegram_webhook_signature_header: str = Field(
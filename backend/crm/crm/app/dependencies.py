@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Annotated, AsyncIterator
+import functools
+from typing import Annotated, AsyncIterator, Callable
 from uuid import UUID
 
 import jwt
@@ -13,11 +14,17 @@ from redis.asyncio import Redis
 from crm.app.config import settings
 from crm.domain import services
 from crm.infrastructure import repositories
+from crm.infrastructure.amqp import AmqpConnectionManager
 from crm.app.events import EventsPublisher
+from crm.app.events_stream import EventStreamHub
+from crm.app.outbox_relay import OutboxRelayScheduler
+from crm.infrastructure.notification_stream import RedisNotificationStreamBackend
 from crm.infrastructure.notifications import NotificationDispatcher
 from crm.infrastructure.queues import DelayedTaskQueue, PermissionsQueue, TaskReminderQueue
-from crm.infrastructure.db import AsyncSessionFactory
+from crm.infrastructure.db import AsyncSessionFactory, run_after_commit, transactional_session
+from crm.infrastructure.outbox import OutboxEventsPublisher, OutboxTaskEventsPublisher
 from crm.infrastructure.task_events import TaskEventsPublisher
+from crm.infrastructure.telegram import TelegramBotClient
 
 
 AuthorizationHeader = Annotated[str | None, Header(alias="Authorization")]
@@ -150,6 +157,20 @@ async def get_db_session() -> AsyncIterator[AsyncSession]:
         yield session
 
 
+async def get_events_session() -> AsyncIterator[AsyncSession]:
+    """Session for services that emit domain events.
+
+    With the outbox enabled the whole request is one transaction, so the
+    outbox rows are committed together with the change they describe.
+    """
+    if not settings.outbox_enabled:
+        async with AsyncSessionFactory() as session:
+            yield session
+        return
+    async with transactional_session() as session:
+        yield session
+
+
 async def get_client_service(session: AsyncSession = Depends(get_db_session)) -> services.ClientService:
     return services.ClientService(repositories.ClientRepository(session))
 
@@ -160,9 +181,9 @@ async def get_deal_service(session: AsyncSession = Depends(get_db_session)) -> s
 
 async def get_deal_journal_service(
     request: Request,
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_events_session),
 ) -> services.DealJournalService:
-    publisher = await get_events_publisher(request)
+    publisher = await _domain_events_publisher(request, session)
     repository = repositories.DealJournalRepository(session)
     return services.DealJournalService(repository, publisher)
 
@@ -174,9 +195,9 @@ async def get_policy_service(session: AsyncSession = Depends(get_db_session)) ->
 
 async def get_calculation_service(
     request: Request,
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_events_session),
 ) -> services.CalculationService:
-    publisher = await get_events_publisher(request)
+    publisher = await _domain_events_publisher(request, session)
     calculation_repository = repositories.CalculationRepository(session)
     policy_repository = repositories.PolicyRepository(session)
     policy_service = services.PolicyService(policy_repository)
@@ -192,10 +213,44 @@ _task_queue_redis: Redis | None = None
 _task_reminder_queue: TaskReminderQueue | None = None
 _task_delayed_queue: DelayedTaskQueue | None = None
 
+_amqp_connections: AmqpConnectionManager | None = None
+_events_stream_hub: EventStreamHub | None = None
+
 _notifications_redis: Redis | None = None
 _notification_dispatcher: NotificationDispatcher | None = None
 _notification_stream: services.NotificationStreamService | None = None
 _telegram_service: services.TelegramService | None = None
+_notification_seen_events: services.SeenEventIds | None = None
+
+
+def get_amqp_connections() -> AmqpConnectionManager:
+    global _amqp_connections
+    if _amqp_connections is None:
+        _amqp_connections = AmqpConnectionManager.from_settings(settings)
+    return _amqp_connections
+
+
+def get_events_stream_hub() -> EventStreamHub:
+    global _events_stream_hub
+    if _events_stream_hub is None:
+        _events_stream_hub = EventStreamHub.from_settings(settings, get_amqp_connections())
+    return _events_stream_hub
+
+
+async def close_events_stream_hub() -> None:
+    global _events_stream_hub
+    hub = _events_stream_hub
+    _events_stream_hub = None
+    if hub is not None:
+        await hub.stop()
+
+
+async def close_amqp_connections() -> None:
+    global _amqp_connections
+    connections = _amqp_connections
+    _amqp_connections = None
+    if connections is not None:
+        await connections.close()
 
 
 def _get_task_queue_redis() -> Redis:
@@ -214,6 +269,7 @@ def get_task_reminder_queue() -> TaskReminderQueue:
         _task_reminder_queue = TaskReminderQueue(
             redis=redis,
             queue_key=settings.tasks_reminders_queue_key,
+            lease_ms=settings.tasks_reminders_lease_ms,
         )
     return _task_reminder_queue
 
@@ -263,15 +319,26 @@ def get_notification_dispatcher() -> NotificationDispatcher:
     global _notification_dispatcher
     if _notification_dispatcher is None:
         redis = _get_notifications_redis()
-        _notification_dispatcher = NotificationDispatcher(settings, redis)
+        _notification_dispatcher = NotificationDispatcher(
+            settings, redis, get_amqp_connections()
+        )
     return _notification_dispatcher
 
 
 def get_notification_stream() -> services.NotificationStreamService:
     global _notification_stream
     if _notification_stream is None:
+        backend: services.NotificationStreamBackend | None = None
+        if settings.notifications_stream_backend == "redis":
+            backend = RedisNotificationStreamBackend.from_settings(
+                settings, _get_notifications_redis()
+            )
         _notification_stream = services.NotificationStreamService(
-            settings.notifications_sse_retry_ms
+            settings.notifications_sse_retry_ms,
+            queue_size=settings.notifications_sse_queue_size,
+            history_size=settings.notifications_sse_history_size,
+            overflow_policy=settings.notifications_sse_overflow_policy,
+            backend=backend,
         )
     return _notification_stream
 
@@ -284,20 +351,35 @@ def get_telegram_service() -> services.TelegramService:
             mock=settings.notifications_telegram_mock,
             bot_token=settings.notifications_telegram_bot_token,
             default_chat_id=settings.notifications_telegram_default_chat_id,
+            client=TelegramBotClient.from_settings(settings),
         )
     return _telegram_service
 
 
+def get_notification_seen_events() -> services.SeenEventIds:
+    global _notification_seen_events
+    if _notification_seen_events is None:
+        _notification_seen_events = services.SeenEventIds(
+            settings.notifications_seen_events_cache_size
+        )
+    return _notification_seen_events
+
+
 async def close_notification_dependencies() -> None:
-    global _notification_dispatcher, _notifications_redis, _notification_stream
+    global _notification_dispatcher, _notifications_redis, _notification_stream, _telegram_service
     dispatcher = _notification_dispatcher
     _notification_dispatcher = None
     if dispatcher is not None:
         await dispatcher.close()
+    if _notification_stream is not None:
+        await _notification_stream.stop()
     if _notifications_redis is not None:
         await _notifications_redis.aclose()
         _notifications_redis = None
     _notification_stream = None
+    if _telegram_service is not None:
+        await _telegram_service.close()
+        _telegram_service = None
 
 
 def _build_notification_events_service(
@@ -306,7 +388,9 @@ def _build_notification_events_service(
     stream = get_notification_stream()
     telegram = get_telegram_service()
     repository = repositories.NotificationEventRepository(session)
-    return services.NotificationEventsService(repository, stream, telegram)
+    return services.NotificationEventsService(
+        repository, stream, telegram, get_notification_seen_events()
+    )
 
 
 async def get_notification_template_service(
@@ -326,6 +410,7 @@ async def get_notification_events_service(
 
 
 async def get_notification_service(
+    request: Request,
     session: AsyncSession = Depends(get_db_session),
 ) -> services.NotificationService:
     repository = repositories.NotificationRepository(session)
@@ -344,9 +429,16 @@ async def get_notification_service(
         redis_channel=settings.notifications_dispatch_redis_channel,
         retry_attempts=settings.notifications_dispatch_retry_attempts,
         retry_delay_ms=settings.notifications_dispatch_retry_delay_ms,
+        retry_max_delay_ms=settings.notifications_dispatch_retry_max_delay_ms,
+        wakeup=_notification_delivery_wakeup(request),
     )
 
 
+def _notification_delivery_wakeup(request: Request) -> Callable[[], None] | None:
+    scheduler = getattr(request.app.state, "notification_delivery", None)
+    return scheduler.wake if scheduler is not None else None
+
+
 class _NullTaskEventsPublisher:
     async def task_created(self, task: object) -> None:  # pragma: no cover - noop
         return None
@@ -354,6 +446,9 @@ class _NullTaskEventsPublisher:
     async def task_status_changed(self, task: object, previous_status: object) -> None:  # pragma: no cover - noop
         return None
 
+    async def tasks_status_changed(self, tasks: object, previous_status: object) -> None:  # pragma: no cover - noop
+        return None
+
     async def task_reminder(self, reminder: object) -> None:  # pragma: no cover - noop
         return None
 
@@ -369,14 +464,18 @@ async def get_task_events_publisher(
 
 async def get_task_service(
     request: Request,
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_events_session),
 ) -> services.TaskService:
     repository = repositories.TaskRepository(session)
     status_repository = repositories.TaskStatusRepository(session)
     reminder_repository = repositories.TaskReminderRepository(session)
     delayed_queue = get_delayed_task_queue()
     reminder_queue = get_task_reminder_queue()
-    events = await get_task_events_publisher(request)
+    events: TaskEventsPublisher | _NullTaskEventsPublisher
+    if settings.outbox_enabled:
+        events = OutboxTaskEventsPublisher(settings, _outbox_repository(request, session))
+    else:
+        events = await get_task_events_publisher(request)
     return services.TaskService(
         repository,
         status_repository,
@@ -384,6 +483,7 @@ async def get_task_service(
         delayed_queue,
         reminder_queue,
         events,
+        after_commit=functools.partial(run_after_commit, session),
     )
 
 
@@ -399,11 +499,26 @@ async def get_events_publisher(request: Request) -> EventsPublisher | _NullEvent
     return _NullEventsPublisher()
 
 
+def _outbox_repository(request: Request, session: AsyncSession) -> repositories.OutboxRepository:
+    relay = getattr(request.app.state, "outbox_relay", None)
+    return repositories.OutboxRepository(
+        session, on_added=relay.wake if isinstance(relay, OutboxRelayScheduler) else None
+    )
+
+
+async def _domain_events_publisher(
+    request: Request, session: AsyncSession
+) -> services.EventsPublisherProtocol:
+    if settings.outbox_enabled:
+        return OutboxEventsPublisher(_outbox_repository(request, session), settings.events_exchange)
+    return await get_events_publisher(request)
+
+
 async def get_payment_service(
     request: Request,
-    session: AsyncSession = Depends(get_db_session),
+    session: AsyncSession = Depends(get_events_session),
 ) -> services.PaymentService:
-    publisher = await get_events_publisher(request)
+    publisher = await _domain_events_publisher(request, session)
     payments_repository = repositories.PaymentRepository(session)
     incomes_repository = repositories.PaymentIncomeRepository(session)
     expenses_repository = repositories.PaymentExpenseRepository(session)
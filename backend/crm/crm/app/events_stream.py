@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from aio_pika.abc import AbstractIncomingMessage, AbstractQueue
+
+from crm.app.config import Settings
+from crm.infrastructure.amqp import AmqpConnectionManager
+
+
+logger = logging.getLogger(__name__)
+
+SLOW_CONSUMER_DROP = "drop"
+SLOW_CONSUMER_DISCONNECT = "disconnect"
+
+
+def compile_topic_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile an AMQP topic pattern (``*`` — one word, ``#`` — any number)."""
+    words = pattern.split(".")
+    if not pattern or any(not word for word in words):
+        raise ValueError(f"invalid topic pattern: {pattern!r}")
+    parts: list[str] = []
+    for word in words:
+        if word == "#":
+            parts.append(r"(?:\.[^.]+)*")
+        elif word == "*":
+            parts.append(r"\.[^.]+")
+        else:
+            parts.append(r"\." + re.escape(word))
+    # Matched against "." + routing key so that "#" may also match no words.
+    return re.compile("".join(parts))
+
+
+@dataclass
+class EventStreamStats:
+    received: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    disconnected: int = 0
+
+
+class EventSubscription:
+    """Bounded per-client queue of SSE payloads filtered by routing-key patterns."""
+
+    def __init__(self, patterns: Iterable[str], queue_size: int) -> None:
+        self.patterns = list(patterns) or ["#"]
+        self._compiled = [compile_topic_pattern(pattern) for pattern in self.patterns]
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(
+            maxsize=max(queue_size, 1)
+        )
+        self.closed = False
+        self.dropped = 0
+
+    def matches(self, routing_key: str) -> bool:
+        key = "." + routing_key
+        return any(pattern.fullmatch(key) for pattern in self._compiled)
+
+    async def get(self, timeout: float | None = None) -> dict[str, Any] | None:
+        """Next payload; ``None`` once the hub disconnected the subscriber.
+
+        Raises ``asyncio.TimeoutError`` when nothing arrived within ``timeout``.
+        """
+        if not self._queue.empty():
+            return self._queue.get_nowait()
+        if self.closed:
+            return None
+        return await asyncio.wait_for(self._queue.get(), timeout)
+
+    def offer(self, payload: dict[str, Any]) -> bool:
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def drop_oldest(self, payload: dict[str, Any]) -> None:
+        self._queue.get_nowait()
+        self._queue.put_nowait(payload)
+        self.dropped += 1
+
+    def close(self) -> None:
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+
+class EventStreamHub:
+    """Fans the domain and task events exchanges out to the SSE clients of one process.
+
+    A single exclusive queue bound to ``#`` on both exchanges is consumed
+    however many clients are connected; each client gets a bounded
+    in-memory queue and only the events matching its routing-key patterns. When a client falls behind,
+    its oldest events are dropped or it is disconnected, depending on
+    ``slow_consumer_policy``. The consumer starts with the first subscriber.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        connections: AmqpConnectionManager,
+        *,
+        subscriber_queue_size: int = 256,
+        slow_consumer_policy: str = SLOW_CONSUMER_DROP,
+        prefetch_count: int = 100,
+        report_interval_s: float = 60.0,
+    ) -> None:
+        if slow_consumer_policy not in (SLOW_CONSUMER_DROP, SLOW_CONSUMER_DISCONNECT):
+            raise ValueError(f"unknown slow consumer policy: {slow_consumer_policy!r}")
+        self._settings = settings
+        self._connections = connections
+        self.subscriber_queue_size = subscriber_queue_size
+        self.slow_consumer_policy = slow_consumer_policy
+        self.prefetch_count = prefetch_count
+        self.report_interval_s = report_interval_s
+        self.stats = EventStreamStats()
+        self._subscribers: set[EventSubscription] = set()
+        self._queue: AbstractQueue | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._ready = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._reported_at = time.perf_counter()
+        self._reported = EventStreamStats()
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings, connections: AmqpConnectionManager
+    ) -> "EventStreamHub":
+        return cls(
+            settings,
+            connections,
+            subscriber_queue_size=settings.events_stream_subscriber_queue_size,
+            slow_consumer_policy=settings.events_stream_slow_consumer_policy,
+            prefetch_count=settings.events_stream_prefetch_count,
+        )
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def snapshot(self) -> dict[str, int]:
+        """Current subscribers and counters since start, for ``GET /healthz``."""
+        return {"subscribers": self.subscribers, **asdict(self.stats)}
+
+    async def subscribe(
+        self, patterns: Iterable[str] = ("#",), *, ready_timeout: float = 5.0
+    ) -> EventSubscription:
+        """Register a client and wait until the shared queue is bound."""
+        subscription = EventSubscription(patterns, self.subscriber_queue_size)
+        self._subscribers.add(subscription)
+        await self.start()
+        try:
+            await asyncio.wait_for(self._ready.wait(), ready_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Events stream consumer is not ready yet; events may be delayed")
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        self._subscribers.discard(subscription)
+
+    async def start(self) -> None:
+        async with self._lock:
+            if self._task is None or self._task.done():
+                self._task = asyncio.create_task(self._run(), name="events-stream-hub")
+
+    async def stop(self) -> None:
+        async with self._lock:
+            task = self._task
+            self._task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        for subscription in list(self._subscribers):
+            subscription.close()
+        self._subscribers.clear()
+
+    def dispatch(self, routing_key: str, payload: dict[str, Any]) -> None:
+        """Hand ``payload`` to every matching subscriber without blocking."""
+        self.stats.received += 1
+        for subscription in list(self._subscribers):
+            if not subscription.matches(routing_key):
+                continue
+            if subscription.offer(payload):
+                self.stats.delivered += 1
+            elif self.slow_consumer_policy == SLOW_CONSUMER_DROP:
+                subscription.drop_oldest(payload)
+                self.stats.dropped += 1
+            else:
+                self._subscribers.discard(subscription)
+                subscription.close()
+                self.stats.disconnected += 1
+                logger.warning(
+                    "Disconnected slow SSE subscriber (%d events queued)",
+                    self.subscriber_queue_size,
+                )
+        self._maybe_report()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._consume_loop()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.exception("Events stream consumer crashed; retrying in 5 seconds")
+                await asyncio.sleep(5)
+            finally:
+                self._ready.clear()
+                self._queue = None
+
+    async def _consume_loop(self) -> None:
+        exchanges = [
+            await self._connections.exchange(name)
+            for name in dict.fromkeys(
+                [self._settings.events_exchange, self._settings.tasks_events_exchange]
+            )
+        ]
+        async with self._connections.channel(prefetch_count=self.prefetch_count) as channel:
+            self._queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+            for exchange in exchanges:
+                await self._queue.bind(exchange, routing_key="#")
+            self._ready.set()
+            async with self._queue.iterator() as iterator:
+                async for message in iterator:
+                    async with message.process(ignore_processed=True):
+                        self.dispatch(message.routing_key or "", self._payload(message))
+
+    @staticmethod
+    def _payload(message: AbstractIncomingMessage) -> dict[str, Any]:
+        event_name = str(
+            message.headers.get("event")
+            if message.headers and "event" in message.headers
+            else message.routing_key or "message"
+        )
+        payload: dict[str, Any] = {"event": event_name, "data": message.body.decode("utf-8")}
+        if message.message_id is not None:
+            payload["id"] = str(message.message_id)
+        return payload
+
+    def _maybe_report(self) -> None:
+        now = time.perf_counter()
+        if now - self._reported_at < self.report_interval_s:
+            return
+        stats, reported = self.stats, self._reported
+        logger.info(
+            "Events stream: %d subscribers, %d events received, %d delivered, "
+            "%d dropped, %d subscribers disconnected",
+            self.subscribers,
+            stats.received - reported.received,
+            stats.delivered - reported.delivered,
+            stats.dropped - reported.dropped,
+            stats.disconnected - reported.disconnected,
+        )
+        self._reported_at = now
+        self._reported = EventStreamStats(**vars(stats))
@@ -20,15 +20,27 @@ from crm.api.routers import notification_events
 from crm.api.streams import streams_endpoint
 from crm.app.config import settings
 from crm.app.dependencies import (
+    close_amqp_connections,
+    close_events_stream_hub,
     close_notification_dependencies,
     close_permissions_queue,
     close_task_queues,
+    get_amqp_connections,
+    get_events_stream_hub,
+    get_notification_dispatcher,
+    get_notification_seen_events,
     get_notification_stream,
+    get_task_reminder_queue,
     get_telegram_service,
 )
+from crm.app.notification_delivery import NotificationDeliveryScheduler
+from crm.app.outbox_relay import OutboxRelayScheduler
 from crm.app.notifications_consumer import NotificationQueueConsumer
+from crm.app.reminder_scheduler import ReminderScheduler
 from crm.app.events import EventsPublisher
+from crm.app.events_stream import EventStreamHub
 from crm.infrastructure.db import AsyncSessionFactory
+from crm.infrastructure.outbox import OutboxSender
 from crm.infrastructure.task_events import TaskEventsPublisher
 
 logger = logging.getLogger(__name__)
@@ -111,6 +123,10 @@ async def lifespan(app: FastAPI):
     app.state.events_publisher = None
     app.state.task_events_publisher = None
     app.state.notification_consumer = None
+    app.state.reminder_scheduler = None
+    app.state.amqp_connections = None
+    app.state.notification_delivery = None
+    app.state.outbox_relay = None
 
     migrations_ok, error_message = await _check_database_revision()
     app.state.migrations_ok = migrations_ok
@@ -129,8 +145,10 @@ async def lifespan(app: FastAPI):
     except Exception as exc:
         logger.warning("Failed to initialize some Redis connections: %s", exc)
 
-    publisher = EventsPublisher(settings)
-    task_publisher = TaskEventsPublisher(settings)
+    connections = get_amqp_connections()
+    app.state.amqp_connections = connections
+    publisher = EventsPublisher(settings, connections)
+    task_publisher = TaskEventsPublisher(settings, connections)
     try:
         await publisher.connect()
         app.state.events_publisher = publisher
@@ -148,16 +166,68 @@ async def lifespan(app: FastAPI):
     notification_consumer: NotificationQueueConsumer | None = None
     try:
         stream = get_notification_stream()
+        await stream.start()
         telegram = get_telegram_service()
-        notification_consumer = NotificationQueueConsumer(settings, stream, telegram)
+        notification_consumer = NotificationQueueConsumer(
+            settings,
+            stream,
+            telegram,
+            connections,
+            seen_events=get_notification_seen_events(),
+        )
         await notification_consumer.start()
         app.state.notification_consumer = notification_consumer
     except Exception as exc:  # noqa: BLE001
         logger.exception("Failed to start notification consumer: %s", exc)
         app.state.notification_consumer = None
+    try:
+        notification_delivery = NotificationDeliveryScheduler(
+            settings,
+            get_notification_dispatcher(),
+            get_notification_stream(),
+            get_telegram_service(),
+            seen_events=get_notification_seen_events(),
+        )
+        await notification_delivery.start()
+        app.state.notification_delivery = notification_delivery
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Failed to start notification delivery scheduler: %s", exc)
+        app.state.notification_delivery = None
+    if settings.outbox_enabled and settings.outbox_relay_in_process:
+        try:
+            outbox_relay = OutboxRelayScheduler(settings, OutboxSender(settings, connections))
+            await outbox_relay.start()
+            app.state.outbox_relay = outbox_relay
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Failed to start outbox relay: %s", exc)
+            app.state.outbox_relay = None
+    elif settings.outbox_enabled:
+        logger.warning(
+            "Outbox relay is not running in the API process; domain events reach RabbitMQ only "
+            "while Celery beat and a worker for the crm.outbox queue are running"
+        )
+    if settings.tasks_reminders_scheduler_enabled and app.state.task_events_publisher is not None:
+        try:
+            reminder_scheduler = ReminderScheduler(
+                settings, get_task_reminder_queue(), app.state.task_events_publisher
+            )
+            await reminder_scheduler.start()
+            app.state.reminder_scheduler = reminder_scheduler
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Failed to start reminder scheduler: %s", exc)
+            app.state.reminder_scheduler = None
     try:
         yield {"events_publisher": app.state.events_publisher}
     finally:
+        scheduler_instance = getattr(app.state, "reminder_scheduler", None)
+        if isinstance(scheduler_instance, ReminderScheduler):
+            await scheduler_instance.stop()
+        relay_instance = getattr(app.state, "outbox_relay", None)
+        if isinstance(relay_instance, OutboxRelayScheduler):
+            await relay_instance.stop()
+        delivery_instance = getattr(app.state, "notification_delivery", None)
+        if isinstance(delivery_instance, NotificationDeliveryScheduler):
+            await delivery_instance.stop()
         publisher_instance = app.state.events_publisher
         if isinstance(publisher_instance, EventsPublisher):
             await publisher_instance.close()
@@ -172,6 +242,8 @@ async def lifespan(app: FastAPI):
         await close_permissions_queue()
         await close_task_queues()
         await close_notification_dependencies()
+        await close_events_stream_hub()
+        await close_amqp_connections()
 
 
 def create_app() -> FastAPI:
@@ -199,8 +271,10 @@ def create_app() -> FastAPI:
     app.include_router(notification_events.router, prefix="/api")
 
     @app.get("/healthz")
-    async def healthcheck() -> dict[str, str]:
-        return {"status": "ok"}
+    async def healthcheck(
+        hub: EventStreamHub = Depends(get_events_stream_hub),
+    ) -> dict[str, object]:
+        return {"status": "ok", "events_stream": hub.snapshot()}
 
     @app.get("/streams", include_in_schema=False)
     async def streams_route(response=Depends(streams_endpoint)) -> EventSourceResponse:
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Collection
+from dataclasses import dataclass
+from uuid import UUID
+
+from crm.app.config import Settings
+from crm.domain import schemas, services
+from crm.infrastructure import models, repositories
+from crm.infrastructure.db import AsyncSessionFactory
+from crm.infrastructure.notifications import NotificationDispatcher
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class NotificationDeliveryStats:
+    claimed: int = 0
+    processed: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+class NotificationDeliveryScheduler:
+    """Dispatch accepted notifications from inside the API process.
+
+    ``POST /notifications`` only stores the notification and wakes the
+    scheduler; it then leases due notifications in batches (a lease lasts
+    ``notifications_dispatch_visibility_timeout_ms``, so a crashed replica
+    does not strand them) and delivers them concurrently, with at most
+    ``notifications_dispatch_channel_concurrency[channel]`` deliveries using
+    a channel at once. ``notifications_dispatch_poll_interval_ms`` bounds
+    the sleep so scheduled retries are picked up.
+
+    Leases of notifications still being delivered are extended every third
+    of the lease, so a slow batch (Telegram throttling, ``retry_after``
+    pauses) is never picked up by another replica mid-send.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        dispatcher: NotificationDispatcher,
+        stream: services.NotificationStreamService,
+        telegram: services.TelegramService,
+        *,
+        seen_events: services.SeenEventIds | None = None,
+    ) -> None:
+        self._settings = settings
+        self._dispatcher = dispatcher
+        self._stream = stream
+        self._telegram = telegram
+        self._seen_events = seen_events
+        self._limits = {
+            channel: asyncio.Semaphore(max(limit, 1))
+            for channel, limit in settings.notifications_dispatch_channel_concurrency.items()
+        }
+        self._lease_ms = self._lease_timeout_ms(settings)
+        self.last_run = NotificationDeliveryStats()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._running = False
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        async with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._task = asyncio.create_task(self._run())
+            logger.info("Notification delivery scheduler started")
+
+    async def stop(self) -> None:
+        async with self._lock:
+            self._running = False
+            task = self._task
+            self._task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Notification delivery scheduler stopped")
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        poll_interval = max(self._settings.notifications_dispatch_poll_interval_ms, 10) / 1000
+        while self._running:
+            # Cleared before claiming so a notification accepted meanwhile
+            # still interrupts the next sleep.
+            self._wakeup.clear()
+            try:
+                await self.process_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.exception("Notification delivery failed; retrying in 5 seconds")
+                await asyncio.sleep(5)
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def process_due(self) -> NotificationDeliveryStats:
+        """Deliver due notifications batch by batch until none is left."""
+        stats = NotificationDeliveryStats()
+        batch_size = max(self._settings.notifications_dispatch_batch_size, 1)
+        while True:
+            async with AsyncSessionFactory() as session:
+                batch = await repositories.NotificationRepository(session).claim_due(
+                    batch_size, visibility_timeout_ms=self._lease_ms
+                )
+            stats.claimed += len(batch)
+            in_flight = {entity.id for entity in batch}
+            heartbeat = asyncio.create_task(self._extend_leases(in_flight))
+            try:
+                results = await asyncio.gather(
+                    *(self._deliver_leased(entity, in_flight) for entity in batch),
+                    return_exceptions=True,
+                )
+            finally:
+                heartbeat.cancel()
+                try:
+                    await heartbeat
+                except asyncio.CancelledError:
+                    pass
+            for entity, result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    # The lease expires and the notification is picked up again.
+                    logger.error(
+                        "Failed to deliver notification %s", entity.id, exc_info=result
+                    )
+                elif result is schemas.NotificationStatus.PROCESSED:
+                    stats.processed += 1
+                elif result is schemas.NotificationStatus.FAILED:
+                    stats.failed += 1
+                else:
+                    stats.retried += 1
+            if len(batch) < batch_size:
+                break
+        self.last_run = stats
+        return stats
+
+    @staticmethod
+    def _lease_timeout_ms(settings: Settings) -> int:
+        """Lease that outlasts the slowest delivery of a batch.
+
+        A batch aimed at one chat waits ``batch_size / chat_rate`` seconds in
+        the Telegram limiter, and each message may sleep through
+        ``max_retries`` pauses of up to ``max_retry_after`` seconds; one
+        request timeout is added on top.
+        """
+        chat_rate = max(settings.notifications_telegram_chat_rate_limit_per_second, 0.001)
+        required_s = (
+            settings.notifications_dispatch_batch_size / chat_rate
+            + settings.notifications_telegram_max_retries
+            * settings.notifications_telegram_max_retry_after_s
+            + 10
+        )
+        required_ms = int(required_s * 1000)
+        configured_ms = settings.notifications_dispatch_visibility_timeout_ms
+        if configured_ms < required_ms:
+            logger.warning(
+                "Notification lease of %d ms is shorter than a throttled batch may take; using %d ms",
+                configured_ms,
+                required_ms,
+            )
+            return required_ms
+        return configured_ms
+
+    async def _deliver_leased(
+        self, entity: models.Notification, in_flight: set[UUID]
+    ) -> schemas.NotificationStatus | None:
+        try:
+            return await self._deliver(entity)
+        finally:
+            in_flight.discard(entity.id)
+
+    async def _extend_leases(self, in_flight: Collection[UUID]) -> None:
+        interval = self._lease_ms / 3 / 1000
+        while in_flight:
+            await asyncio.sleep(interval)
+            if not in_flight:
+                return
+            try:
+                async with AsyncSessionFactory() as session:
+                    await repositories.NotificationRepository(session).extend_leases(
+                        list(in_flight), visibility_timeout_ms=self._lease_ms
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.warning("Failed to extend notification leases", exc_info=True)
+
+    async def _deliver(self, entity: models.Notification) -> schemas.NotificationStatus | None:
+        async with AsyncSessionFactory() as session:
+            events_service = services.NotificationEventsService(
+                repositories.NotificationEventRepository(session),
+                self._stream,
+                self._telegram,
+                self._seen_events,
+            )
+            service = services.NotificationService(
+                repositories.NotificationRepository(session),
+                repositories.NotificationAttemptRepository(session),
+                repositories.NotificationEventRepository(session),
+                self._dispatcher,
+                events_service,
+                rabbit_exchange=self._settings.notifications_dispatch_exchange,
+                rabbit_routing_key=self._settings.notifications_dispatch_routing_key,
+                redis_channel=self._settings.notifications_dispatch_redis_channel,
+                retry_attempts=self._settings.notifications_dispatch_retry_attempts,
+                retry_delay_ms=self._settings.notifications_dispatch_retry_delay_ms,
+                retry_max_delay_ms=self._settings.notifications_dispatch_retry_max_delay_ms,
+            )
+            return await service.deliver(entity, self._limits)
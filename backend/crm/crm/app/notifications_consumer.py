@@ -3,37 +3,101 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Any
+from uuid import UUID
 
-import aio_pika
-from aio_pika import ExchangeType
-from aio_pika.abc import AbstractChannel, AbstractQueue, AbstractRobustConnection
+from aio_pika import DeliveryMode, Message
+from aio_pika.abc import AbstractIncomingMessage, AbstractQueue
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 
 from crm.app.config import Settings
 from crm.domain import schemas, services
+from crm.infrastructure.amqp import AmqpConnectionManager
 from crm.infrastructure.db import AsyncSessionFactory
 from crm.infrastructure import repositories
 
 
 logger = logging.getLogger(__name__)
 
+_EVENT_FIELDS = {"id", "type", "time", "data"}
+_ATTEMPT_HEADER = "x-attempt"
+
+_Lane = asyncio.Queue[tuple[AbstractIncomingMessage, schemas.NotificationEventIngest]]
+
+
+@dataclass
+class NotificationConsumerStats:
+    received: int = 0
+    processed: int = 0
+    duplicates: int = 0
+    skipped: int = 0
+    retried: int = 0
+    dead_lettered: int = 0
+    lag_ms_total: float = 0.0
+    lag_ms_max: float = 0.0
+    processing_ms_total: float = 0.0
+    processing_ms_max: float = 0.0
+
+    @property
+    def lag_ms_avg(self) -> float:
+        return self.lag_ms_total / self.processed if self.processed else 0.0
+
+    @property
+    def processing_ms_avg(self) -> float:
+        return self.processing_ms_total / self.processed if self.processed else 0.0
+
 
 class NotificationQueueConsumer:
+    """Consumes notification events with a pool of concurrent handlers.
+
+    Up to ``prefetch`` deliveries are in flight. They are taken in batches
+    of ``batch_size`` so that duplicates are found with one query per
+    batch, then spread over ``workers`` lanes by chat: events for the same
+    Telegram chat are handled one after another, in delivery order, while
+    different chats proceed concurrently. Messages that cannot be parsed or
+    validated are moved to the ``notifications_dlq_name`` queue straight
+    away. Other handler failures (database or broker outages) are retried:
+    the message goes back to the end of the queue with an ``x-attempt``
+    header and is dead-lettered only after
+    ``notifications_consumer_max_attempts`` deliveries.
+    """
+
     def __init__(
         self,
         settings: Settings,
         stream: services.NotificationStreamService,
         telegram: services.TelegramService,
+        connections: AmqpConnectionManager | None = None,
+        *,
+        seen_events: services.SeenEventIds | None = None,
+        report_interval_s: float = 60.0,
     ) -> None:
         self._settings = settings
         self._stream = stream
         self._telegram = telegram
-        self._connection: AbstractRobustConnection | None = None
-        self._channel: AbstractChannel | None = None
+        self._seen_events = seen_events if seen_events is not None else services.SeenEventIds(
+            settings.notifications_seen_events_cache_size
+        )
+        self._owns_connections = connections is None
+        self._connections = connections or AmqpConnectionManager.from_settings(settings)
+        self.prefetch = max(settings.notifications_consumer_prefetch, 1)
+        self.workers = max(settings.notifications_consumer_workers, 1)
+        self.batch_size = max(settings.notifications_consumer_batch_size, 1)
+        self.batch_wait = max(settings.notifications_consumer_batch_wait_ms, 0) / 1000
+        self.max_attempts = max(settings.notifications_consumer_max_attempts, 1)
+        self.report_interval_s = report_interval_s
+        self.stats = NotificationConsumerStats()
         self._queue: AbstractQueue | None = None
         self._task: asyncio.Task[None] | None = None
         self._running = False
         self._lock = asyncio.Lock()
+        self._reported_at = time.perf_counter()
+        self._reported = NotificationConsumerStats()
 
     async def start(self) -> None:
         async with self._lock:
@@ -41,7 +105,11 @@ class NotificationQueueConsumer:
                 return
             self._running = True
             self._task = asyncio.create_task(self._run())
-            logger.info("Notification queue consumer started")
+            logger.info(
+                "Notification queue consumer started (prefetch %d, %d workers)",
+                self.prefetch,
+                self.workers,
+            )
 
     async def stop(self) -> None:
         async with self._lock:
@@ -55,6 +123,8 @@ class NotificationQueueConsumer:
             except asyncio.CancelledError:
                 pass
         await self._cleanup()
+        if self._owns_connections:
+            await self._connections.close()
         logger.info("Notification queue consumer stopped")
 
     async def _run(self) -> None:
@@ -70,55 +140,252 @@ class NotificationQueueConsumer:
                 await self._cleanup()
 
     async def _consume_loop(self) -> None:
-        self._connection = await aio_pika.connect_robust(str(self._settings.rabbitmq_url))
-        self._channel = await self._connection.channel()
-        await self._channel.set_qos(prefetch_count=1)
-        exchange = await self._channel.declare_exchange(
-            self._settings.notifications_dispatch_exchange,
-            ExchangeType.TOPIC,
-            durable=True,
-        )
-        self._queue = await self._channel.declare_queue(
-            self._settings.notifications_queue_name,
-            durable=self._settings.notifications_queue_durable,
-        )
-        await self._queue.bind(
-            exchange,
-            routing_key=self._settings.notifications_queue_routing_key,
-        )
+        exchange = await self._connections.exchange(self._settings.notifications_dispatch_exchange)
+        async with self._connections.channel(prefetch_count=self.prefetch) as channel:
+            intake: asyncio.Queue[AbstractIncomingMessage] = asyncio.Queue()
+            lanes: list[_Lane] = [asyncio.Queue() for _ in range(self.workers)]
+            workers = [asyncio.create_task(self._work(lane)) for lane in lanes]
+            try:
+                await channel.declare_queue(self._settings.notifications_dlq_name, durable=True)
+                self._queue = await channel.declare_queue(
+                    self._settings.notifications_queue_name,
+                    durable=self._settings.notifications_queue_durable,
+                )
+                await self._queue.bind(
+                    exchange,
+                    routing_key=self._settings.notifications_queue_routing_key,
+                )
+                await self._queue.consume(intake.put)
+                while self._running:
+                    batch = await self._next_batch(intake)
+                    await self._dispatch(batch, lanes)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                # Closing the channel returns every unacknowledged delivery to the queue.
+                await channel.close()
+
+    async def _next_batch(
+        self, intake: asyncio.Queue[AbstractIncomingMessage]
+    ) -> list[AbstractIncomingMessage]:
+        batch = [await intake.get()]
+        deadline = time.perf_counter() + self.batch_wait
+        while len(batch) < self.batch_size:
+            if not intake.empty():
+                batch.append(intake.get_nowait())
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(intake.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _dispatch(
+        self,
+        batch: list[AbstractIncomingMessage],
+        lanes: list[_Lane],
+    ) -> None:
+        self.stats.received += len(batch)
+        events: dict[UUID, tuple[AbstractIncomingMessage, schemas.NotificationEventIngest]] = {}
+        for message in batch:
+            try:
+                payload = self._parse_payload(message.body)
+                if not _EVENT_FIELDS.issubset(payload):
+                    logger.debug(
+                        "Skipping notification payload without event fields: %s", payload.keys()
+                    )
+                    self.stats.skipped += 1
+                    await message.ack()
+                    continue
+                dto = schemas.NotificationEventIngest.model_validate(payload)
+            except (ValueError, ValidationError) as exc:
+                await self._dead_letter(message, exc)
+                continue
+            if dto.id in events or dto.id in self._seen_events:
+                self.stats.duplicates += 1
+                await message.ack()
+                continue
+            events[dto.id] = (message, dto)
 
-        assert self._queue is not None
-        async with self._queue.iterator() as iterator:
-            async for message in iterator:
-                if not self._running:
-                    break
-                async with message.process(ignore_processed=True):
-                    try:
-                        payload = self._parse_payload(message.body)
-                        await self._handle_payload(payload)
-                    except Exception:  # noqa: BLE001
-                        logger.exception("Failed to process notification message")
-                        continue
-
-    async def _handle_payload(self, payload: dict[str, Any]) -> None:
-        required_keys = {"id", "type", "time", "data"}
-        if not required_keys.issubset(payload):
-            logger.debug("Skipping notification payload without event fields: %s", payload.keys())
+        if not events:
             return
-        dto = schemas.NotificationEventIngest.model_validate(payload)
+        async with AsyncSessionFactory() as session:
+            repository = repositories.NotificationEventRepository(session)
+            existing = await repository.existing_event_ids(list(events))
+        for event_id, (message, dto) in events.items():
+            if event_id in existing:
+                self.stats.duplicates += 1
+                await message.ack()
+                continue
+            chat_id = services.NotificationEventsService.resolve_chat_id(dto) or str(dto.id)
+            lane = lanes[zlib.crc32(chat_id.encode("utf-8")) % len(lanes)]
+            await lane.put((message, dto))
+
+    async def _work(self, lane: _Lane) -> None:
+        while True:
+            message, dto = await lane.get()
+            try:
+                await self._process(message, dto)
+            except Exception:  # noqa: BLE001 - keep the lane alive
+                logger.exception("Failed to acknowledge notification event %s", dto.id)
+            self._maybe_report()
+
+    async def _process(
+        self, message: AbstractIncomingMessage, dto: schemas.NotificationEventIngest
+    ) -> None:
+        started = time.perf_counter()
+        try:
+            event = await self._handle_event(dto)
+        except IntegrityError:
+            # Inserted meanwhile by a redelivery or another consumer.
+            self.stats.duplicates += 1
+            await message.ack()
+        except services.NotificationDispatchError:
+            # The event is stored together with the failed delivery status.
+            await message.ack()
+            self._record(dto, started)
+        except (ValueError, ValidationError) as exc:
+            logger.exception("Notification event %s is invalid", dto.id)
+            await self._dead_letter(message, exc)
+        except Exception as exc:  # noqa: BLE001
+            await self._retry(message, dto, exc)
+        else:
+            await message.ack()
+            if event is None:
+                self.stats.duplicates += 1
+            else:
+                self._record(dto, started)
+
+    async def _handle_event(
+        self, dto: schemas.NotificationEventIngest
+    ) -> schemas.NotificationEvent | None:
         async with AsyncSessionFactory() as session:
             repository = repositories.NotificationEventRepository(session)
             service = services.NotificationEventsService(
                 repository,
                 self._stream,
                 self._telegram,
+                self._seen_events,
+            )
+            return await service.handle_incoming(dto)
+
+    async def _retry(
+        self,
+        message: AbstractIncomingMessage,
+        dto: schemas.NotificationEventIngest,
+        exc: BaseException,
+    ) -> None:
+        attempt = self._attempt(message)
+        if attempt >= self.max_attempts:
+            logger.error(
+                "Notification event %s failed %d times, giving up", dto.id, attempt, exc_info=exc
+            )
+            await self._dead_letter(message, exc)
+            return
+        logger.warning(
+            "Failed to process notification event %s (attempt %d of %d): %s",
+            dto.id,
+            attempt,
+            self.max_attempts,
+            exc,
+        )
+        try:
+            await self._republish(
+                message,
+                self._settings.notifications_queue_name,
+                {_ATTEMPT_HEADER: attempt + 1, "x-error": f"{type(exc).__name__}: {exc}"[:1000]},
             )
-            await service.handle_incoming(dto)
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to requeue notification message; returning it to the queue")
+            await message.nack(requeue=True)
+            return
+        self.stats.retried += 1
+        await message.ack()
+
+    async def _dead_letter(self, message: AbstractIncomingMessage, exc: BaseException) -> None:
+        try:
+            await self._republish(
+                message,
+                self._settings.notifications_dlq_name,
+                {"x-error": f"{type(exc).__name__}: {exc}"[:1000]},
+            )
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to dead-letter notification message; requeueing it")
+            await message.nack(requeue=True)
+            return
+        self.stats.dead_lettered += 1
+        logger.warning("Notification message moved to %s: %s", self._settings.notifications_dlq_name, exc)
+        await message.ack()
+
+    async def _republish(
+        self, message: AbstractIncomingMessage, queue_name: str, headers: dict[str, Any]
+    ) -> None:
+        original_headers = dict(message.headers or {})
+        original_headers.setdefault("x-original-routing-key", message.routing_key or "")
+        channel = await self._connections.publish_channel()
+        await channel.default_exchange.publish(
+            Message(
+                body=message.body,
+                content_type=message.content_type,
+                headers={**original_headers, **headers},
+                delivery_mode=DeliveryMode.PERSISTENT,
+            ),
+            routing_key=queue_name,
+        )
+
+    @staticmethod
+    def _attempt(message: AbstractIncomingMessage) -> int:
+        """1-based delivery attempt of ``message``; broker redeliveries count too."""
+        try:
+            attempt = int((message.headers or {}).get(_ATTEMPT_HEADER, 1))
+        except (TypeError, ValueError):
+            attempt = 1
+        return attempt + 1 if message.redelivered else attempt
+
+    def _record(self, dto: schemas.NotificationEventIngest, started: float) -> None:
+        finished = time.perf_counter()
+        processing_ms = (finished - started) * 1000
+        event_time = dto.time if dto.time.tzinfo else dto.time.replace(tzinfo=timezone.utc)
+        lag_ms = max((datetime.now(timezone.utc) - event_time).total_seconds() * 1000, 0.0)
+        stats = self.stats
+        stats.processed += 1
+        stats.processing_ms_total += processing_ms
+        stats.processing_ms_max = max(stats.processing_ms_max, processing_ms)
+        stats.lag_ms_total += lag_ms
+        stats.lag_ms_max = max(stats.lag_ms_max, lag_ms)
+
+    def _maybe_report(self) -> None:
+        now = time.perf_counter()
+        if now - self._reported_at < self.report_interval_s:
+            return
+        stats, reported = self.stats, self._reported
+        processed = stats.processed - reported.processed
+        logger.info(
+            "Notification consumer: %d processed, %d duplicates, %d retried, %d dead-lettered; "
+            "lag avg %.0f ms, processing avg %.1f ms",
+            processed,
+            stats.duplicates - reported.duplicates,
+            stats.retried - reported.retried,
+            stats.dead_lettered - reported.dead_lettered,
+            (stats.lag_ms_total - reported.lag_ms_total) / processed if processed else 0.0,
+            (stats.processing_ms_total - reported.processing_ms_total) / processed
+            if processed
+            else 0.0,
+        )
+        self._reported_at = now
+        self._reported = NotificationConsumerStats(**vars(stats))
 
     @staticmethod
     def _parse_payload(body: bytes) -> dict[str, Any]:
         decoded = body.decode("utf-8")
-        return json.loads(decoded)
+        payload = json.loads(decoded)
+        if not isinstance(payload, dict):
+            raise ValueError("notification payload must be a JSON object")
+        return payload
 
     async def _cleanup(self) -> None:
         if self._queue is not None:
@@ -129,16 +396,4 @@ class NotificationQueueConsumer:
                 )
             except Exception:  # noqa: BLE001
                 pass
-        if self._channel is not None:
-            try:
-                await self._channel.close()
-            except Exception:  # noqa: BLE001
-                pass
-        if self._connection is not None:
-            try:
-                await self._connection.close()
-            except Exception:  # noqa: BLE001
-                pass
-        self._connection = None
-        self._channel = None
         self._queue = None
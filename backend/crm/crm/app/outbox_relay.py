@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+
+from crm.app.config import Settings
+from crm.domain.services import OutboxRelay, OutboxRelayStats
+from crm.infrastructure.db import AsyncSessionFactory
+from crm.infrastructure.outbox import OutboxSender
+from crm.infrastructure.repositories import OutboxRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelayScheduler:
+    """Relay outbox rows from inside the API process instead of a polling task.
+
+    A request that wrote outbox rows wakes the scheduler once its
+    transaction has committed (``OutboxRepository`` registers ``wake`` with
+    ``run_after_commit``), so events reach RabbitMQ without waiting for a
+    poll. ``outbox_relay_poll_interval_ms`` bounds the sleep so postponed
+    messages and rows written by processes without a relay are picked up.
+    Every ``outbox_purge_interval_ms`` it also deletes messages sent more
+    than ``outbox_retention_hours`` ago.
+    """
+
+    def __init__(self, settings: Settings, sender: OutboxSender) -> None:
+        self._settings = settings
+        self._sender = sender
+        self.last_run = OutboxRelayStats()
+        self._purged_at: float | None = None
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._running = False
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        async with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._task = asyncio.create_task(self._run())
+            logger.info("Outbox relay started")
+
+    async def stop(self) -> None:
+        async with self._lock:
+            self._running = False
+            task = self._task
+            self._task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Outbox relay stopped")
+
+    async def wake(self) -> None:
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        poll_interval = max(self._settings.outbox_relay_poll_interval_ms, 10) / 1000
+        while self._running:
+            # Cleared before claiming so rows committed meanwhile still
+            # interrupt the next sleep.
+            self._wakeup.clear()
+            try:
+                await self.relay_pending()
+                await self._maybe_purge()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.exception("Outbox relay failed; retrying in 5 seconds")
+                await asyncio.sleep(5)
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def relay_pending(self) -> OutboxRelayStats:
+        async with AsyncSessionFactory() as session:
+            relay = OutboxRelay(
+                OutboxRepository(session),
+                self._sender,
+                batch_size=self._settings.outbox_relay_batch_size,
+                retry_delay_ms=self._settings.outbox_relay_retry_delay_ms,
+            )
+            self.last_run = await relay.relay_pending()
+        return self.last_run
+
+    async def purge_sent(self) -> int:
+        async with AsyncSessionFactory() as session:
+            relay = OutboxRelay(OutboxRepository(session), self._sender)
+            return await relay.purge_sent(
+                timedelta(hours=self._settings.outbox_retention_hours),
+                batch_size=self._settings.outbox_purge_batch_size,
+            )
+
+    async def _maybe_purge(self) -> None:
+        now = time.monotonic()
+        interval = self._settings.outbox_purge_interval_ms / 1000
+        if self._purged_at is not None and now - self._purged_at < interval:
+            return
+        self._purged_at = now
+        await self.purge_sent()
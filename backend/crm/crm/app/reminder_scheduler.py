@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from crm.app.config import Settings
+from crm.domain.services import TaskReminderProcessor
+from crm.infrastructure.db import AsyncSessionFactory
+from crm.infrastructure.queues import TaskReminderQueue
+from crm.infrastructure.repositories import TaskReminderRepository
+from crm.infrastructure.task_events import TaskEventsPublisher
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReminderScheduler:
+    """Deliver reminders from inside the API process instead of a polling task.
+
+    The scheduler sleeps until the earliest score in the reminder queue (or
+    the earliest lease deadline), wakes up early when ``TaskReminderQueue``
+    announces a newly scheduled reminder on its wake-up channel, and then
+    drains everything that is due. ``tasks_reminders_scheduler_idle_ms``
+    bounds the sleep so a missed notification is picked up eventually.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        queue: TaskReminderQueue,
+        events_publisher: TaskEventsPublisher,
+    ) -> None:
+        self._settings = settings
+        self._queue = queue
+        self._events = events_publisher
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._running = False
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        async with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._task = asyncio.create_task(self._run())
+            logger.info("Reminder scheduler started")
+
+    async def stop(self) -> None:
+        async with self._lock:
+            self._running = False
+            task = self._task
+            self._task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Reminder scheduler stopped")
+
+    async def _run(self) -> None:
+        while self._running:
+            try:
+                await self._schedule_loop()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.exception("Reminder scheduler crashed; retrying in 5 seconds")
+                await asyncio.sleep(5)
+
+    async def _schedule_loop(self) -> None:
+        pubsub = self._queue.redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self._queue.wakeup_channel)
+        listener = asyncio.create_task(self._listen(pubsub))
+        try:
+            while self._running:
+                # Cleared before reading the queue head so a reminder scheduled
+                # while a batch is processed still interrupts the next sleep.
+                self._wakeup.clear()
+                await self._process_due()
+                await self._sleep_until_next_due()
+                if listener.done():
+                    listener.result()
+        finally:
+            listener.cancel()
+            try:
+                await listener
+            except (asyncio.CancelledError, Exception):  # noqa: BLE001
+                pass
+            await pubsub.aclose()
+
+    async def _listen(self, pubsub) -> None:
+        async for message in pubsub.listen():
+            if message.get("type") == "message":
+                self._wakeup.set()
+
+    async def _process_due(self) -> None:
+        batch_size = self._settings.tasks_scheduling_batch_size
+        while self._running:
+            async with AsyncSessionFactory() as session:
+                processor = TaskReminderProcessor(
+                    self._queue,
+                    TaskReminderRepository(session),
+                    self._events,
+                    batch_size=batch_size,
+                    retry_delay_ms=self._settings.tasks_reminders_poll_interval_ms,
+                    publish_concurrency=self._settings.tasks_reminders_publish_concurrency,
+                )
+                await processor.process_due_reminders()
+            if processor.last_batch.claimed < batch_size:
+                return
+
+    async def _sleep_until_next_due(self) -> None:
+        timeout_ms = self._settings.tasks_reminders_scheduler_idle_ms
+        next_due = await self._queue.next_due_at()
+        if next_due is not None:
+            now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+            timeout_ms = min(max(next_due - now_ms, 0), timeout_ms)
+        if timeout_ms <= 0:
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            pass
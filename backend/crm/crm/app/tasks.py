@@ -1,18 +1,23 @@
 from __future__ import annotations
 
-import asyncio
+from datetime import timedelta
 from uuid import UUID
 
 
 from crm.app.celery_app import celery_app
-from redis.asyncio import Redis
 
 from crm.app.config import settings
+from crm.app.worker_runtime import runtime
 from crm.infrastructure.db import AsyncSessionFactory
-from crm.infrastructure.repositories import DealRepository, PolicyRepository, TaskReminderRepository
-from crm.infrastructure.queues import TaskReminderQueue
-from crm.infrastructure.task_events import TaskEventsPublisher
-from crm.domain.services import TaskReminderProcessor
+from crm.infrastructure.repositories import (
+    DealRepository,
+    OutboxRepository,
+    PolicyRepository,
+    TaskReminderRepository,
+    TaskRepository,
+)
+from crm.infrastructure.queues import DelayedTaskQueue, TaskReminderQueue
+from crm.domain.services import DelayedTaskPromoter, OutboxRelay, TaskReminderProcessor
 
 
 async def _update_deal_status(deal_id: UUID, status: str) -> None:
@@ -28,35 +33,68 @@ async def _refresh_policy_status(policy_id: UUID, status: str) -> None:
 
 
 async def _process_reminders() -> int:
-    redis = Redis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
-    queue = TaskReminderQueue(redis=redis, queue_key=settings.tasks_reminders_queue_key)
+    queue = TaskReminderQueue(
+        redis=runtime.redis(),
+        queue_key=settings.tasks_reminders_queue_key,
+        lease_ms=settings.tasks_reminders_lease_ms,
+    )
+    events = await runtime.task_events()
     async with AsyncSessionFactory() as session:
-        reminders = TaskReminderRepository(session)
-        events = TaskEventsPublisher(settings)
-        await events.connect()
         processor = TaskReminderProcessor(
             queue,
-            reminders,
+            TaskReminderRepository(session),
             events,
             batch_size=settings.tasks_scheduling_batch_size,
             retry_delay_ms=settings.tasks_reminders_poll_interval_ms,
+            publish_concurrency=settings.tasks_reminders_publish_concurrency,
+        )
+        return await processor.process_due_reminders()
+
+
+async def _promote_delayed_tasks() -> int:
+    queue = DelayedTaskQueue(redis=runtime.redis(), queue_key=settings.tasks_delayed_queue_key)
+    events = await runtime.task_events()
+    async with AsyncSessionFactory() as session:
+        promoter = DelayedTaskPromoter(
+            queue,
+            TaskRepository(session),
+            events,
+            batch_size=settings.tasks_delayed_batch_size,
+        )
+        return await promoter.promote_due_tasks()
+
+
+async def _relay_outbox() -> int:
+    sender = await runtime.outbox_sender()
+    async with AsyncSessionFactory() as session:
+        relay = OutboxRelay(
+            OutboxRepository(session),
+            sender,
+            batch_size=settings.outbox_relay_batch_size,
+            retry_delay_ms=settings.outbox_relay_retry_delay_ms,
+        )
+        stats = await relay.relay_pending()
+        return stats.sent
+
+
+async def _purge_outbox() -> int:
+    sender = await runtime.outbox_sender()
+    async with AsyncSessionFactory() as session:
+        relay = OutboxRelay(OutboxRepository(session), sender)
+        return await relay.purge_sent(
+            timedelta(hours=settings.outbox_retention_hours),
+            batch_size=settings.outbox_purge_batch_size,
         )
-        try:
-            processed = await processor.process_due_reminders()
-        finally:
-            await events.close()
-            await redis.aclose()
-    return processed
 
 
 @celery_app.task(bind=True, name="crm.app.tasks.sync_deal_status", autoretry_for=(Exception,), retry_backoff=True)
 def sync_deal_status(self, deal_id: str, status: str) -> None:
-    asyncio.run(_update_deal_status(UUID(deal_id), status))
+    runtime.run(_update_deal_status(UUID(deal_id), status))
 
 
 @celery_app.task(bind=True, name="crm.app.tasks.refresh_policy_state", autoretry_for=(Exception,), retry_backoff=True)
 def refresh_policy_state(self, policy_id: str, status: str) -> None:
-    asyncio.run(_refresh_policy_status(UUID(policy_id), status))
+    runtime.run(_refresh_policy_status(UUID(policy_id), status))
 
 
 @celery_app.task(
@@ -66,4 +104,34 @@ def refresh_policy_state(self, policy_id: str, status: str) -> None:
     retry_backoff=True,
 )
 def process_task_reminders(self) -> int:
-    return asyncio.run(_process_reminders())
+    return runtime.run(_process_reminders())
+
+
+@celery_app.task(
+    bind=True,
+    name="crm.app.tasks.promote_delayed_tasks",
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+)
+def promote_delayed_tasks(self) -> int:
+    return runtime.run(_promote_delayed_tasks())
+
+
+@celery_app.task(
+    bind=True,
+    name="crm.app.tasks.relay_outbox",
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+)
+def relay_outbox(self) -> int:
+    return runtime.run(_relay_outbox())
+
+
+@celery_app.task(
+    bind=True,
+    name="crm.app.tasks.purge_outbox",
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+)
+def purge_outbox(self) -> int:
+    return runtime.run(_purge_outbox())
@@ -0,0 +1,141 @@
+"""Persistent event loop shared by the Celery tasks of one worker process."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from celery.signals import worker_process_shutdown, worker_shutdown
+from redis.asyncio import Redis
+
+from crm.app.config import settings
+from crm.infrastructure.amqp import AmqpConnectionManager
+from crm.infrastructure.db import dispose_engine
+from crm.infrastructure.outbox import OutboxSender
+from crm.infrastructure.task_events import TaskEventsPublisher
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWorkerRuntime:
+    """Run task coroutines on one long-lived loop thread.
+
+    ``asyncio.run`` per task creates a new loop every time, so connections
+    bound to the previous loop (the SQLAlchemy pool, Redis, RabbitMQ) cannot
+    be reused. The runtime starts its loop lazily in the process that first
+    submits work, which keeps it safe with the prefork pool, and owns the
+    connections shared between tasks until ``shutdown``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._redis: Redis | None = None
+        self._amqp: AmqpConnectionManager | None = None
+        self._task_events: TaskEventsPublisher | None = None
+        self._outbox_sender: OutboxSender | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                self._start()
+            assert self._loop is not None
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Execute ``coro`` on the runtime loop and block until it finishes."""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return future.result(timeout)
+
+    def redis(self) -> Redis:
+        if self._redis is None:
+            self._redis = Redis.from_url(
+                str(settings.redis_url), encoding="utf-8", decode_responses=True
+            )
+        return self._redis
+
+    def amqp(self) -> AmqpConnectionManager:
+        if self._amqp is None:
+            self._amqp = AmqpConnectionManager.from_settings(settings)
+        return self._amqp
+
+    async def task_events(self) -> TaskEventsPublisher:
+        if self._task_events is None:
+            self._task_events = TaskEventsPublisher(settings, self.amqp())
+        await self._task_events.connect()
+        return self._task_events
+
+    async def outbox_sender(self) -> OutboxSender:
+        if self._outbox_sender is None:
+            self._outbox_sender = OutboxSender(settings, self.amqp())
+        await self._outbox_sender.connect()
+        return self._outbox_sender
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Close shared connections and stop the loop thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None or self._pid != os.getpid():
+                self._reset()
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._close_resources(), loop).result(timeout)
+            except Exception:  # noqa: BLE001 - shutdown is best effort
+                logger.warning("Failed to close worker runtime resources", exc_info=True)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            loop.close()
+            self._reset()
+
+    def _start(self) -> None:
+        # A forked child inherits the parent's state but not its loop thread.
+        self._reset()
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=self._run_loop, args=(loop,), name="crm-worker-loop", daemon=True
+        )
+        thread.start()
+        self._loop, self._thread, self._pid = loop, thread, os.getpid()
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    async def _close_resources(self) -> None:
+        if self._task_events is not None:
+            await self._task_events.close()
+        if self._outbox_sender is not None:
+            await self._outbox_sender.close()
+        if self._amqp is not None:
+            await self._amqp.close()
+        if self._redis is not None:
+            await self._redis.aclose()
+        await dispose_engine()
+
+    def _reset(self) -> None:
+        self._loop = None
+        self._thread = None
+        self._pid = None
+        self._redis = None
+        self._amqp = None
+        self._task_events = None
+        self._outbox_sender = None
+
+
+runtime = AsyncWorkerRuntime()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _shutdown_runtime(**_: Any) -> None:
+    runtime.shutdown()
@@ -167,6 +167,26 @@ class DealStageMetric(BaseModel):
         return float(value)
 
 
+DEAL_PIPELINE_MAX_PER_STAGE = 200
+
+
+class DealPipelineStage(BaseModel):
+    stage: DealStage
+    count: int
+    total_value: Decimal = Field(default=Decimal("0"))
+    deals: list[DealRead] = Field(default_factory=list)
+    next_cursor: str | None = None
+
+    @field_serializer("total_value")
+    def _serialize_total_value(self, value: Decimal) -> float:
+        return float(value)
+
+
+class DealPipeline(BaseModel):
+    per_stage: int
+    stages: list[DealPipelineStage]
+
+
 class DealJournalEntryBase(BaseModel):
     body: str = Field(min_length=1, max_length=5000)
 
@@ -500,6 +520,74 @@ class TaskCompleteRequest(BaseModel):
         return value
 
 
+TASK_BULK_MAX_ITEMS = 200
+
+
+class TaskBulkOperation(str, Enum):
+    REASSIGN = "reassign"
+    RESCHEDULE = "reschedule"
+    COMPLETE = "complete"
+    CANCEL = "cancel"
+
+
+class TaskBulkRequest(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    task_ids: list[UUID] = Field(
+        min_length=1,
+        max_length=TASK_BULK_MAX_ITEMS,
+        validation_alias=AliasChoices("task_ids", "taskIds"),
+    )
+    operation: TaskBulkOperation
+    assignee_id: UUID | None = Field(
+        default=None, validation_alias=AliasChoices("assignee_id", "assigneeId")
+    )
+    scheduled_for: datetime | None = Field(
+        default=None, validation_alias=AliasChoices("scheduled_for", "scheduledFor")
+    )
+    completed_at: datetime | None = Field(
+        default=None, validation_alias=AliasChoices("completed_at", "completedAt")
+    )
+    cancelled_reason: str | None = Field(
+        default=None,
+        validation_alias=AliasChoices("cancelled_reason", "cancelledReason"),
+        max_length=5000,
+    )
+
+    @field_validator("task_ids")
+    @classmethod
+    def _deduplicate(cls, value: list[UUID]) -> list[UUID]:
+        return list(dict.fromkeys(value))
+
+    @field_validator("scheduled_for", "completed_at", mode="before")
+    @classmethod
+    def _ensure_optional_datetime(cls, value: Any) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        if isinstance(value, date):
+            return datetime.combine(value, time.min, tzinfo=timezone.utc)
+        return value
+
+    @field_validator("cancelled_reason", mode="before")
+    @classmethod
+    def _strip_cancelled_reason(cls, value: Any) -> Any:
+        if isinstance(value, str):
+            return value.strip() or None
+        return value
+
+    @model_validator(mode="after")
+    def _require_operation_fields(self) -> "TaskBulkRequest":
+        if self.operation is TaskBulkOperation.REASSIGN and self.assignee_id is None:
+            raise ValueError("assigneeId is required for reassign")
+        if self.operation is TaskBulkOperation.RESCHEDULE and self.scheduled_for is None:
+            raise ValueError("scheduledFor is required for reschedule")
+        if self.operation is TaskBulkOperation.CANCEL and self.cancelled_reason is None:
+            raise ValueError("cancelledReason is required for cancel")
+        return self
+
+
 class TaskFilters(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
@@ -687,6 +775,35 @@ class TaskReminderRead(ORMModel):
     created_at: datetime = Field(serialization_alias="createdAt")
 
 
+class TaskBoardColumn(BaseModel):
+    status: TaskStatusCode
+    status_name: str | None = Field(default=None, serialization_alias="statusName")
+    total: int = 0
+    tasks: list[TaskRead] = Field(default_factory=list)
+
+
+class TaskBoard(BaseModel):
+    assignee_id: UUID | None = Field(default=None, serialization_alias="assigneeId")
+    limit: int
+    total: int = 0
+    columns: list[TaskBoardColumn] = Field(default_factory=list)
+
+
+class TaskBulkItemResult(BaseModel):
+    task_id: UUID = Field(serialization_alias="taskId")
+    status: Literal["updated", "unchanged", "failed"]
+    code: str | None = None
+    message: str | None = None
+    task: TaskRead | None = None
+
+
+class TaskBulkResult(BaseModel):
+    operation: TaskBulkOperation
+    updated: int = 0
+    failed: int = 0
+    items: list[TaskBulkItemResult] = Field(default_factory=list)
+
+
 def _normalize_currency(value: str | None) -> str | None:
     if value is None:
         return None
@@ -1002,6 +1119,7 @@ class NotificationStatusResponse(BaseModel):
     attempts: int
     channels: list[str]
     delivered_at: datetime | None = Field(default=None, alias="delivered_at")
+    next_attempt_at: datetime | None = None
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -1018,6 +1136,8 @@ class NotificationEvent(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    model_config = ConfigDict(from_attributes=True)
+
 
 class NotificationEventIngest(BaseModel):
     id: UUID
@@ -1042,3 +1162,4 @@ class TelegramDeliveryWebhook(BaseModel):
     occurred_at: datetime = Field(serialization_alias="occurredAt")
 
     model_config = ConfigDict(populate_by_name=True)
+
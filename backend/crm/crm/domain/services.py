@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+from collections import OrderedDict, deque
 import json
 from datetime import date, datetime, timedelta, timezone
 import logging
+import random
 import re
+import time
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any, Iterable, Protocol, Sequence
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Protocol, Sequence
 from uuid import UUID, uuid4
 
 try:  # pragma: no cover - optional dependency guard
@@ -31,9 +36,11 @@ from sqlalchemy.exc import IntegrityError
 
 from crm.domain import schemas
 from crm.infrastructure import models, repositories
+from crm.infrastructure.db import AfterCommitAction
 from crm.infrastructure.queues import DelayedTaskQueue, TaskReminderQueue
 from crm.infrastructure.repositories import RepositoryError
 from crm.infrastructure.task_events import TaskEventsPublisher
+from crm.infrastructure.telegram import TelegramBotClient
 
 
 logger = logging.getLogger(__name__)
@@ -115,6 +122,75 @@ class DealService:
         metrics = await self.repository.stage_metrics(filters)
         return [schemas.DealStageMetric(**item) for item in metrics]
 
+    async def get_pipeline(
+        self,
+        *,
+        per_stage: int,
+        cursors: dict[schemas.DealStage, str] | None = None,
+        filters: schemas.DealFilters | None = None,
+    ) -> schemas.DealPipeline:
+        """Kanban view: per-stage totals plus one page of deals per column.
+
+        ``cursors`` maps a stage to the ``next_cursor`` returned for it, so
+        every column scrolls independently of the others.
+        """
+        decoded = {
+            stage: self.decode_pipeline_cursor(cursor)
+            for stage, cursor in (cursors or {}).items()
+        }
+        rows = await self.repository.pipeline(
+            per_stage=per_stage, cursors=decoded, filters=filters
+        )
+
+        columns: dict[str, dict[str, Any]] = {}
+        for stage, count, total_value, deal in rows:
+            column = columns.setdefault(
+                stage, {"stage": stage, "count": count, "total_value": total_value, "deals": []}
+            )
+            if deal is not None:
+                column["deals"].append(deal)
+
+        stages: list[schemas.DealPipelineStage] = []
+        for column in columns.values():
+            deals = column.pop("deals")
+            next_cursor = None
+            if len(deals) > per_stage:
+                deals = deals[:per_stage]
+                next_cursor = self.encode_pipeline_cursor(deals[-1])
+            stages.append(
+                schemas.DealPipelineStage(
+                    **column,
+                    deals=[schemas.DealRead.model_validate(deal) for deal in deals],
+                    next_cursor=next_cursor,
+                )
+            )
+        return schemas.DealPipeline(per_stage=per_stage, stages=stages)
+
+    @staticmethod
+    def encode_pipeline_cursor(deal: Any) -> str:
+        raw = json.dumps(
+            [deal.next_review_at.isoformat(), deal.updated_at.isoformat(), str(deal.id)],
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_pipeline_cursor(cursor: str) -> tuple[date, datetime, UUID]:
+        """Parse a cursor produced by ``encode_pipeline_cursor``.
+
+        Raises ``ValueError`` for anything that was not issued by this service.
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            review_at, updated_at, deal_id = json.loads(base64.urlsafe_b64decode(padded))
+            return (
+                date.fromisoformat(review_at),
+                datetime.fromisoformat(updated_at),
+                UUID(deal_id),
+            )
+        except (TypeError, ValueError) as exc:
+            raise ValueError("invalid_cursor") from exc
+
     async def delete_deal(self, deal_id: UUID) -> None:
         await self.repository.delete(deal_id)
 
@@ -519,6 +595,12 @@ class TaskService:
         schemas.TaskStatusCode.CANCELLED: (),
     }
 
+    BULK_TARGET_STATUSES: dict[schemas.TaskBulkOperation, schemas.TaskStatusCode] = {
+        schemas.TaskBulkOperation.RESCHEDULE: schemas.TaskStatusCode.SCHEDULED,
+        schemas.TaskBulkOperation.COMPLETE: schemas.TaskStatusCode.COMPLETED,
+        schemas.TaskBulkOperation.CANCEL: schemas.TaskStatusCode.CANCELLED,
+    }
+
     def __init__(
         self,
         repository: repositories.TaskRepository,
@@ -527,6 +609,8 @@ class TaskService:
         delayed_queue: DelayedTaskQueue,
         reminder_queue: TaskReminderQueue,
         events_publisher: TaskEventsPublisher,
+        *,
+        after_commit: Callable[[AfterCommitAction], Awaitable[None]] | None = None,
     ) -> None:
         self.repository = repository
         self.statuses = status_repository
@@ -534,6 +618,7 @@ class TaskService:
         self.delayed_queue = delayed_queue
         self.reminder_queue = reminder_queue
         self.events = events_publisher
+        self.after_commit = after_commit
 
     async def list_tasks(
         self, filters: schemas.TaskFilters | None = None
@@ -541,6 +626,27 @@ class TaskService:
         tasks = await self.repository.list(filters)
         return [schemas.TaskRead.model_validate(task) for task in tasks]
 
+    async def get_board(
+        self, *, assignee_id: UUID | None = None, limit: int = 20
+    ) -> schemas.TaskBoard:
+        columns: dict[str, schemas.TaskBoardColumn] = {}
+        for status, total, task in await self.repository.board(assignee_id=assignee_id, limit=limit):
+            column = columns.get(status.code)
+            if column is None:
+                column = columns[status.code] = schemas.TaskBoardColumn(
+                    status=self._to_status(status.code), status_name=status.name, total=total
+                )
+            if task is not None:
+                column.tasks.append(schemas.TaskRead.model_validate(task))
+
+        ordered = [columns[code.value] for code in schemas.TaskStatusCode if code.value in columns]
+        return schemas.TaskBoard(
+            assignee_id=assignee_id,
+            limit=limit,
+            total=sum(column.total for column in ordered),
+            columns=ordered,
+        )
+
     async def create_task(self, payload: schemas.TaskCreate) -> schemas.TaskRead:
         status = payload.initial_status
         status_entity = await self.statuses.get(status.value)
@@ -565,7 +671,8 @@ class TaskService:
             raise TaskServiceError(str(exc), "Unable to create task") from exc
 
         if status is schemas.TaskStatusCode.SCHEDULED and payload.scheduled_for is not None:
-            await self.delayed_queue.schedule(task.id, payload.scheduled_for)
+            scheduled_for = payload.scheduled_for
+            await self._after_commit(lambda: self.delayed_queue.schedule(task.id, scheduled_for))
 
         await self.events.task_created(task)
         return schemas.TaskRead.model_validate(task)
@@ -664,13 +771,14 @@ class TaskService:
         saved = await self.repository.save(task)
 
         if should_remove_from_queue:
-            await self.delayed_queue.remove(saved.id)
+            await self._after_commit(lambda: self.delayed_queue.remove(saved.id))
         elif (
             next_status is schemas.TaskStatusCode.SCHEDULED
             and saved.scheduled_for is not None
             and (status_changed or payload.scheduled_for is not PydanticUndefined)
         ):
-            await self.delayed_queue.schedule(saved.id, saved.scheduled_for)
+            scheduled_for = saved.scheduled_for
+            await self._after_commit(lambda: self.delayed_queue.schedule(saved.id, scheduled_for))
 
         if status_changed:
             await self.events.task_status_changed(saved, current_status)
@@ -696,6 +804,168 @@ class TaskService:
         )
         return await self.update_task(task_id, update_payload)
 
+    async def bulk_update(self, request: schemas.TaskBulkRequest) -> schemas.TaskBulkResult:
+        """Apply one operation to many tasks with a single UPDATE.
+
+        Transitions are validated in memory against ``ALLOWED_TRANSITIONS``
+        and the UPDATE only matches tasks still in the status they were read
+        in; only RESCHEDULE keeps the status (a new date for a scheduled
+        task). Tasks that fail validation, do not exist or changed
+        concurrently are reported per item and do not stop the rest of the
+        batch.
+        """
+        operation = request.operation
+        tasks = {task.id: task for task in await self.repository.get_many(request.task_ids)}
+        results: dict[UUID, schemas.TaskBulkItemResult] = {}
+        eligible: list[UUID] = []
+
+        for task_id in request.task_ids:
+            task = tasks.get(task_id)
+            if task is None:
+                results[task_id] = schemas.TaskBulkItemResult(
+                    task_id=task_id, status="failed", code="task_not_found", message="Task not found"
+                )
+                continue
+            try:
+                changed = self._check_bulk_operation(task, request)
+            except TaskServiceError as exc:
+                results[task_id] = schemas.TaskBulkItemResult(
+                    task_id=task_id, status="failed", code=exc.code, message=str(exc)
+                )
+                continue
+            if changed:
+                eligible.append(task_id)
+            else:
+                results[task_id] = schemas.TaskBulkItemResult(
+                    task_id=task_id,
+                    status="unchanged",
+                    task=schemas.TaskRead.model_validate(task),
+                )
+
+        # The UPDATE only matches rows still in the status validated above, so
+        # these are the statuses the published events report as previous.
+        expected_statuses = {task_id: tasks[task_id].status_code for task_id in eligible}
+        previous_statuses = {
+            task_id: self._to_status(status) for task_id, status in expected_statuses.items()
+        }
+        values, payload_patch = self._bulk_values(request)
+        try:
+            updated = await self.repository.bulk_update(
+                expected_statuses, values, payload_patch=payload_patch
+            )
+        except RepositoryError as exc:
+            raise TaskServiceError(str(exc), "Unable to update tasks") from exc
+
+        updated_by_id = {task.id: task for task in updated}
+        for task_id in eligible:
+            saved = updated_by_id.get(task_id)
+            if saved is None:
+                results[task_id] = schemas.TaskBulkItemResult(
+                    task_id=task_id,
+                    status="failed",
+                    code="concurrent_update",
+                    message="Task was modified concurrently",
+                )
+            else:
+                results[task_id] = schemas.TaskBulkItemResult(
+                    task_id=task_id, status="updated", task=schemas.TaskRead.model_validate(saved)
+                )
+
+        if updated:
+            if operation is schemas.TaskBulkOperation.RESCHEDULE:
+                rescheduled = list(updated_by_id)
+                scheduled_for = request.scheduled_for
+                await self._after_commit(
+                    lambda: self.delayed_queue.schedule_many(rescheduled, scheduled_for)
+                )
+            elif operation in (schemas.TaskBulkOperation.COMPLETE, schemas.TaskBulkOperation.CANCEL):
+                unscheduled = [
+                    task_id
+                    for task_id in updated_by_id
+                    if previous_statuses[task_id] is schemas.TaskStatusCode.SCHEDULED
+                ]
+                await self._after_commit(lambda: self.delayed_queue.remove_many(unscheduled))
+            await self._publish_bulk_status_changes(updated, previous_statuses)
+
+        items = [results[task_id] for task_id in request.task_ids]
+        return schemas.TaskBulkResult(
+            operation=operation,
+            updated=sum(1 for item in items if item.status == "updated"),
+            failed=sum(1 for item in items if item.status == "failed"),
+            items=items,
+        )
+
+    def _check_bulk_operation(self, task: models.Task, request: schemas.TaskBulkRequest) -> bool:
+        """Validate ``request`` for ``task``; return False when it would change nothing."""
+        current = self._to_status(task.status_code)
+        operation = request.operation
+        if operation is schemas.TaskBulkOperation.REASSIGN:
+            if current in self.FINAL_STATUSES:
+                raise TaskServiceError(
+                    "invalid_status_transition",
+                    f"Task in status {current.value} cannot be reassigned",
+                    details={"current": current.value},
+                )
+            return task.assignee_id != request.assignee_id
+        target = self.BULK_TARGET_STATUSES[operation]
+        if current is target:
+            # Rescheduling a scheduled task only moves its date.
+            return (
+                operation is schemas.TaskBulkOperation.RESCHEDULE
+                and task.scheduled_for != request.scheduled_for
+            )
+        self._ensure_transition(current, target)
+        return True
+
+    def _bulk_values(
+        self, request: schemas.TaskBulkRequest
+    ) -> tuple[dict[str, Any], dict[str, Any] | None]:
+        operation = request.operation
+        if operation is schemas.TaskBulkOperation.REASSIGN:
+            assignee = str(request.assignee_id)
+            return (
+                {"assignee_id": request.assignee_id},
+                {"assigneeId": assignee, "assignee_id": assignee},
+            )
+        target = self.BULK_TARGET_STATUSES[operation]
+        if operation is schemas.TaskBulkOperation.RESCHEDULE:
+            values: dict[str, Any] = {
+                "status_code": target.value,
+                "scheduled_for": request.scheduled_for,
+                "cancelled_reason": None,
+            }
+        elif operation is schemas.TaskBulkOperation.COMPLETE:
+            values = {
+                "status_code": target.value,
+                "completed_at": request.completed_at or datetime.now(timezone.utc),
+                "scheduled_for": None,
+                "cancelled_reason": None,
+            }
+        else:
+            values = {
+                "status_code": target.value,
+                "cancelled_reason": request.cancelled_reason,
+                "scheduled_for": None,
+            }
+        return values, None
+
+    async def _publish_bulk_status_changes(
+        self,
+        tasks: Sequence[models.Task],
+        previous_statuses: dict[UUID, schemas.TaskStatusCode],
+    ) -> None:
+        grouped: dict[schemas.TaskStatusCode, list[models.Task]] = {}
+        for task in tasks:
+            previous = previous_statuses[task.id]
+            if previous.value != task.status_code:
+                grouped.setdefault(previous, []).append(task)
+        await asyncio.gather(
+            *(
+                self.events.tasks_status_changed(group, previous)
+                for previous, group in grouped.items()
+            )
+        )
+
     async def create_reminder(
         self, task_id: UUID, payload: schemas.TaskReminderCreate
     ) -> schemas.TaskReminderRead | None:
@@ -721,9 +991,22 @@ class TaskService:
                 message = "Unable to create reminder"
             raise TaskServiceError(code, message) from exc
 
-        await self.reminder_queue.schedule(reminder.id, reminder.remind_at)
+        await self._after_commit(
+            lambda: self.reminder_queue.schedule(reminder.id, reminder.remind_at)
+        )
         return schemas.TaskReminderRead.model_validate(reminder)
 
+    async def _after_commit(self, action: AfterCommitAction) -> None:
+        """Run a Redis queue write once the task rows are committed.
+
+        The delayed-task and reminder schedulers drop ids whose rows they
+        cannot see, so the queues must not be written ahead of the commit.
+        """
+        if self.after_commit is None:
+            await action()
+        else:
+            await self.after_commit(action)
+
     def _build_payload(self, payload: schemas.TaskCreate) -> dict[str, Any]:
         data: dict[str, Any] = dict(payload.payload or {})
         data["assigneeId"] = str(payload.assignee_id)
@@ -844,6 +1127,18 @@ class TaskService:
             )
 
 
+@dataclass
+class ReminderBatchStats:
+    """Outcome of one ``process_due_reminders`` run."""
+
+    claimed: int = 0
+    processed: int = 0
+    retried: int = 0
+    skipped: int = 0
+    # Delay between the earliest claimed due time and the claim, in milliseconds
+    lag_ms: int = 0
+
+
 class TaskReminderProcessor:
     def __init__(
         self,
@@ -853,55 +1148,290 @@ class TaskReminderProcessor:
         *,
         batch_size: int = 100,
         retry_delay_ms: int = 5000,
+        publish_concurrency: int = 20,
     ) -> None:
         self.queue = queue
         self.reminders = reminder_repository
         self.events = events_publisher
         self.batch_size = batch_size
         self.retry_delay_ms = max(retry_delay_ms, 1000)
+        self.publish_concurrency = max(publish_concurrency, 1)
+        self.last_batch = ReminderBatchStats()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     async def process_due_reminders(self) -> int:
         claimed = await self.queue.claim_due(limit=self.batch_size)
-        processed = 0
+        stats = ReminderBatchStats(claimed=len(claimed))
+        self.last_batch = stats
+        if not claimed:
+            return 0
 
-        for reminder_id, score in claimed:
-            try:
-                reminder_uuid = UUID(reminder_id)
-            except ValueError:
-                self.logger.warning("Invalid reminder id %s in queue", reminder_id)
-                continue
+        now_ms = self._now_ms()
+        stats.lag_ms = max(now_ms - min(score for _, score in claimed), 0)
+        scores = {reminder_id: int(score) for reminder_id, score in claimed}
+        completed: list[str] = []
+        failed: list[str] = []
+
+        try:
+            valid_ids: list[UUID] = []
+            for reminder_id in scores:
+                try:
+                    valid_ids.append(UUID(reminder_id))
+                except ValueError:
+                    self.logger.warning("Invalid reminder id %s in queue", reminder_id)
+                    completed.append(reminder_id)
+
+            reminders = await self.reminders.get_many(valid_ids)
+            found = {str(reminder.id) for reminder in reminders}
+            for reminder_uuid in valid_ids:
+                if str(reminder_uuid) not in found:
+                    self.logger.debug("Reminder %s no longer exists; skipping", reminder_uuid)
+                    completed.append(str(reminder_uuid))
+            stats.skipped = len(completed)
+
+            semaphore = asyncio.Semaphore(self.publish_concurrency)
+
+            async def publish(reminder: models.TaskReminder) -> None:
+                async with semaphore:
+                    try:
+                        await self.events.task_reminder(reminder)
+                    except Exception as exc:  # noqa: BLE001
+                        self.logger.error("Error while processing reminder %s: %s", reminder.id, exc)
+                        failed.append(str(reminder.id))
+                    else:
+                        completed.append(str(reminder.id))
+                        stats.processed += 1
+
+            await asyncio.gather(*(publish(reminder) for reminder in reminders))
+        finally:
+            # Anything neither acked nor rescheduled is claimed again once its lease expires.
+            if completed:
+                await self.queue.ack(*completed)
+            if failed:
+                await self._reschedule({reminder_id: scores[reminder_id] for reminder_id in failed})
+                stats.retried = len(failed)
+
+        self.logger.info(
+            "Reminders batch: claimed=%d processed=%d retried=%d skipped=%d lag=%dms",
+            stats.claimed,
+            stats.processed,
+            stats.retried,
+            stats.skipped,
+            stats.lag_ms,
+        )
+        return stats.processed
+
+    async def _reschedule(self, original_scores: dict[str, int]) -> None:
+        retry_at_ms = self._now_ms() + self.retry_delay_ms
+        scores = {
+            reminder_id: max(score, retry_at_ms) for reminder_id, score in original_scores.items()
+        }
+        try:
+            await self.queue.reschedule_many(scores)
+            self.logger.debug("Rescheduled %d reminders", len(scores))
+        except Exception as exc:  # noqa: BLE001
+            self.logger.error("Failed to reschedule reminders %s: %s", sorted(scores), exc)
+
+    @staticmethod
+    def _now_ms() -> int:
+        return int(datetime.now(timezone.utc).timestamp() * 1000)
 
-            reminder = await self.reminders.get(reminder_uuid)
-            if reminder is None:
-                self.logger.debug("Reminder %s no longer exists; skipping", reminder_id)
-                continue
 
+class DelayedTaskPromoter:
+    """Drains ``DelayedTaskQueue`` and moves due scheduled tasks to pending."""
+
+    def __init__(
+        self,
+        queue: DelayedTaskQueue,
+        task_repository: repositories.TaskRepository,
+        events_publisher: TaskEventsPublisher,
+        *,
+        batch_size: int = 500,
+        max_batches: int | None = None,
+    ) -> None:
+        self.queue = queue
+        self.tasks = task_repository
+        self.events = events_publisher
+        self.batch_size = max(batch_size, 1)
+        self.max_batches = max_batches
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def promote_due_tasks(self) -> int:
+        started = time.perf_counter()
+        promoted_total = 0
+        batches = 0
+
+        while self.max_batches is None or batches < self.max_batches:
+            task_ids = await self.queue.pull_due(limit=self.batch_size)
+            if not task_ids:
+                break
+            batches += 1
+            promoted_total += await self._promote_batch(task_ids)
+            if len(task_ids) < self.batch_size:
+                break
+
+        if promoted_total:
+            elapsed = time.perf_counter() - started
+            self.logger.info(
+                "Promoted %d scheduled tasks in %d batches (%.2f s, %.0f tasks/s)",
+                promoted_total,
+                batches,
+                elapsed,
+                promoted_total / elapsed if elapsed > 0 else float(promoted_total),
+            )
+        return promoted_total
+
+    async def _promote_batch(self, task_ids: list[str]) -> int:
+        task_uuids: list[UUID] = []
+        for task_id in task_ids:
             try:
-                await self.events.task_reminder(reminder)
-                processed += 1
-            except Exception as exc:  # noqa: BLE001
-                self.logger.error("Error while processing reminder %s: %s", reminder_id, exc)
-                await self._reschedule(reminder_id, int(score))
-
-        return processed
-
-    async def _reschedule(self, reminder_id: str, original_score: int) -> None:
-        next_attempt_ms = max(
-            original_score,
-            int(datetime.now(timezone.utc).timestamp() * 1000) + self.retry_delay_ms,
-        )
-        next_attempt = datetime.fromtimestamp(next_attempt_ms / 1000, tz=timezone.utc)
+                task_uuids.append(UUID(task_id))
+            except ValueError:
+                self.logger.warning("Invalid task id %s in delayed queue", task_id)
+
         try:
-            await self.queue.schedule(reminder_id, next_attempt)
-            self.logger.debug(
-                "Reminder %s rescheduled for %s", reminder_id, next_attempt.isoformat()
+            promoted = await self.tasks.promote_scheduled(task_uuids)
+        except Exception:
+            # Put the batch back so the next run retries it.
+            await self.queue.schedule_many(task_uuids, datetime.now(timezone.utc))
+            raise
+
+        await self.events.tasks_status_changed(promoted, schemas.TaskStatusCode.SCHEDULED)
+        return len(promoted)
+
+
+class OutboxSenderProtocol(Protocol):
+    async def send_many(
+        self, messages: Sequence[models.OutboxMessage]
+    ) -> list[BaseException | None]:  # pragma: no cover - interface definition
+        ...
+
+
+@dataclass
+class OutboxRelayStats:
+    """Outcome of one ``relay_pending`` run."""
+
+    claimed: int = 0
+    sent: int = 0
+    failed: int = 0
+    # Age of the oldest message relayed by the run, in milliseconds
+    lag_ms: int = 0
+    # Messages still waiting once the run finished
+    pending: int = 0
+    oldest_pending_ms: int = 0
+
+
+class OutboxRelay:
+    """Moves outbox rows to RabbitMQ in batches.
+
+    Every batch is one transaction: rows are locked with ``SKIP LOCKED``,
+    published with confirms awaited together, then marked as sent (or
+    postponed by ``retry_delay_ms`` on failure). Concurrent relays on other
+    replicas never see the same rows, and a crash before the commit leaves
+    the batch for the next run, so delivery is at least once.
+    """
+
+    def __init__(
+        self,
+        repository: repositories.OutboxRepository,
+        sender: OutboxSenderProtocol,
+        *,
+        batch_size: int = 200,
+        max_batches: int | None = None,
+        retry_delay_ms: int = 5000,
+    ) -> None:
+        self.repository = repository
+        self.sender = sender
+        self.batch_size = max(batch_size, 1)
+        self.max_batches = max_batches
+        self.retry_delay_ms = max(retry_delay_ms, 0)
+        self.last_run = OutboxRelayStats()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def relay_pending(self) -> OutboxRelayStats:
+        started = time.perf_counter()
+        stats = OutboxRelayStats()
+        batches = 0
+
+        while self.max_batches is None or batches < self.max_batches:
+            messages = await self.repository.claim_batch(self.batch_size)
+            if not messages:
+                break
+            batches += 1
+            delivered = await self._relay_batch(messages, stats)
+            # A short batch drained the table; a failed one means the broker is struggling.
+            if len(messages) < self.batch_size or not delivered:
+                break
+
+        stats.pending, oldest = await self.repository.pending_stats()
+        if oldest is not None:
+            stats.oldest_pending_ms = self._age_ms(oldest)
+        self.last_run = stats
+
+        if stats.claimed:
+            elapsed = time.perf_counter() - started
+            self.logger.info(
+                "Relayed %d/%d outbox messages in %d batches (%.2f s, %.0f msg/s, lag %d ms, %d pending)",
+                stats.sent,
+                stats.claimed,
+                batches,
+                elapsed,
+                stats.sent / elapsed if elapsed > 0 else float(stats.sent),
+                stats.lag_ms,
+                stats.pending,
             )
-        except Exception as exc:  # noqa: BLE001
-            self.logger.error(
-                "Failed to reschedule reminder %s: %s", reminder_id, exc
+        return stats
+
+    async def _relay_batch(
+        self, messages: list[models.OutboxMessage], stats: OutboxRelayStats
+    ) -> bool:
+        stats.claimed += len(messages)
+        stats.lag_ms = max(stats.lag_ms, max(self._age_ms(m.created_at) for m in messages))
+
+        try:
+            errors = await self.sender.send_many(messages)
+        except Exception as exc:  # noqa: BLE001 - broker unavailable, postpone the batch
+            errors = [exc] * len(messages)
+
+        sent_ids: list[UUID] = []
+        failed: dict[UUID, str] = {}
+        for message, error in zip(messages, errors):
+            if error is None:
+                sent_ids.append(message.id)
+            else:
+                failed[message.id] = f"{type(error).__name__}: {error}"[:1000]
+        if failed:
+            self.logger.warning(
+                "Failed to relay %d outbox messages, retrying in %d ms: %s",
+                len(failed),
+                self.retry_delay_ms,
+                next(iter(failed.values())),
             )
 
+        retry_at = datetime.now(timezone.utc) + timedelta(milliseconds=self.retry_delay_ms)
+        await self.repository.complete_batch(sent_ids, failed, retry_at=retry_at)
+        stats.sent += len(sent_ids)
+        stats.failed += len(failed)
+        return not failed
+
+    async def purge_sent(self, retention: timedelta, *, batch_size: int = 1000) -> int:
+        """Delete messages sent longer than ``retention`` ago, ``batch_size`` rows at a time."""
+        cutoff = datetime.now(timezone.utc) - retention
+        batch_size = max(batch_size, 1)
+        deleted = 0
+        while True:
+            removed = await self.repository.delete_sent_before(cutoff, batch_size)
+            deleted += removed
+            if removed < batch_size:
+                break
+        if deleted:
+            self.logger.info("Purged %d outbox messages sent before %s", deleted, cutoff.isoformat())
+        return deleted
+
+    @staticmethod
+    def _age_ms(created_at: datetime) -> int:
+        return max(int((datetime.now(timezone.utc) - created_at).total_seconds() * 1000), 0)
+
 
 
 class EventsPublisherProtocol(Protocol):
@@ -1552,32 +2082,147 @@ class NotificationTemplateService:
         return schemas.NotificationTemplateRead.model_validate(entity)
 
 
+class NotificationStreamBackend(Protocol):
+    async def publish(self, event_type: str, payload: dict[str, Any]) -> None:
+        ...
+
+    async def start(self, deliver: Callable[[str, dict[str, Any], str], None]) -> None:
+        ...
+
+    async def stop(self) -> None:
+        ...
+
+
+def _stream_event_order(event_id: str) -> tuple[int, int]:
+    head, _, tail = event_id.partition("-")
+    return int(head), int(tail or 0)
+
+
 class NotificationStreamService:
-    def __init__(self, retry_interval_ms: int) -> None:
+    """Fans notification events out to SSE subscribers.
+
+    Without a backend events are delivered within the process. With one
+    (see ``RedisNotificationStreamBackend``) ``publish`` goes through it
+    and its relay calls ``deliver`` in every process, so subscribers of
+    all workers and replicas see the same events.
+
+    Every event gets an ID of the form ``<ms>-<seq>``, like Redis stream
+    entries, so IDs keep increasing across restarts and processes. The last
+    ``history_size`` events are kept in a ring buffer, so a client
+    reconnecting with ``Last-Event-ID`` receives what it missed. Subscriber queues hold
+    at most ``queue_size`` events; when one is full, its oldest event is
+    dropped (``overflow_policy="drop"``) or the subscriber is disconnected
+    (``"disconnect"``) so that a stalled client never slows publishing.
+    """
+
+    OVERFLOW_DROP = "drop"
+    OVERFLOW_DISCONNECT = "disconnect"
+
+    def __init__(
+        self,
+        retry_interval_ms: int,
+        *,
+        queue_size: int = 256,
+        history_size: int = 1000,
+        overflow_policy: str = OVERFLOW_DROP,
+        backend: NotificationStreamBackend | None = None,
+    ) -> None:
+        if overflow_policy not in (self.OVERFLOW_DROP, self.OVERFLOW_DISCONNECT):
+            raise ValueError(f"unknown overflow policy: {overflow_policy!r}")
         self._retry_interval_ms = retry_interval_ms
-        self._subscribers: set[asyncio.Queue[dict[str, Any]]] = set()
-        self._lock = asyncio.Lock()
+        self.queue_size = max(queue_size, 1)
+        self.overflow_policy = overflow_policy
+        self._backend = backend
+        self._history: deque[dict[str, Any]] = deque(maxlen=max(history_size, 0))
+        self._last_order = (0, 0)
+        self._subscribers: set[asyncio.Queue[dict[str, Any] | None]] = set()
+        self.dropped = 0
+        self.disconnected = 0
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def start(self) -> None:
+        if self._backend is not None:
+            await self._backend.start(self.deliver)
+
+    async def stop(self) -> None:
+        if self._backend is not None:
+            await self._backend.stop()
 
     async def publish(self, event_type: str, payload: dict[str, Any]) -> None:
+        if self._backend is not None:
+            await self._backend.publish(event_type, payload)
+        else:
+            self.deliver(event_type, payload)
+
+    def deliver(
+        self, event_type: str, payload: dict[str, Any], event_id: str | None = None
+    ) -> None:
+        """Hand an event to the subscribers of this process."""
+        if event_id is None:
+            event_id = self._next_local_id()
         message = {
+            "id": event_id,
             "event": event_type,
             "data": {"eventType": event_type, "payload": payload},
             "retry": self._retry_interval_ms,
         }
-        async with self._lock:
-            subscribers = list(self._subscribers)
-        for queue in subscribers:
-            await queue.put(message)
+        self._history.append(message)
+        for queue in list(self._subscribers):
+            self._offer(queue, message)
+
+    async def subscribe(
+        self, last_event_id: str | None = None
+    ) -> tuple[asyncio.Queue[dict[str, Any] | None], list[dict[str, Any]]]:
+        """Register a subscriber; returns its queue and the events to replay.
+
+        A ``None`` item in the queue means the subscriber was disconnected.
+        """
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue, self._replay(last_event_id)
+
+    async def unsubscribe(self, queue: asyncio.Queue[dict[str, Any] | None]) -> None:
+        self._subscribers.discard(queue)
+
+    def _replay(self, last_event_id: str | None) -> list[dict[str, Any]]:
+        if not last_event_id or not self._history:
+            return []
+        try:
+            last_id = _stream_event_order(last_event_id)
+        except ValueError:
+            return []
+        return [
+            message for message in self._history if _stream_event_order(message["id"]) > last_id
+        ]
 
-    async def subscribe(self) -> asyncio.Queue[dict[str, Any]]:
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
-        async with self._lock:
-            self._subscribers.add(queue)
-        return queue
+    def _next_local_id(self) -> str:
+        millis, seq = int(time.time() * 1000), 0
+        if millis <= self._last_order[0]:
+            millis, seq = self._last_order[0], self._last_order[1] + 1
+        self._last_order = (millis, seq)
+        return f"{millis}-{seq}"
 
-    async def unsubscribe(self, queue: asyncio.Queue[dict[str, Any]]) -> None:
-        async with self._lock:
-            self._subscribers.discard(queue)
+    def _offer(
+        self, queue: asyncio.Queue[dict[str, Any] | None], message: dict[str, Any]
+    ) -> None:
+        try:
+            queue.put_nowait(message)
+            return
+        except asyncio.QueueFull:
+            pass
+        if self.overflow_policy == self.OVERFLOW_DROP:
+            queue.get_nowait()
+            queue.put_nowait(message)
+            self.dropped += 1
+            return
+        self._subscribers.discard(queue)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+        self.disconnected += 1
+        self.logger.warning(
+            "Disconnected slow notification subscriber (%d events queued)", self.queue_size
+        )
 
 
 class TelegramSendResult(Protocol):
@@ -1594,11 +2239,13 @@ class TelegramService:
         mock: bool,
         bot_token: str | None,
         default_chat_id: str | None,
+        client: TelegramBotClient | None = None,
     ) -> None:
         self.enabled = enabled
         self.mock = mock
         self.bot_token = bot_token
         self.default_chat_id = default_chat_id
+        self.client = client
 
     async def send(self, chat_id: str | None, message: str) -> dict[str, Any]:
         if not self.enabled:
@@ -1618,34 +2265,41 @@ class TelegramService:
             message_id = f"mock-{int(datetime.now(timezone.utc).timestamp() * 1000)}"
             return {"accepted": True, "messageId": message_id, "error": None}
 
-        import httpx
+        if self.client is None:
+            self.client = TelegramBotClient(self.bot_token)
+        return await self.client.send_message(target_chat, message)
 
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-        payload = {"chat_id": target_chat, "text": message}
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, timeout=10)
-            if response.status_code >= 400:
-                return {
-                    "accepted": False,
-                    "error": f"telegram_http_{response.status_code}",
-                    "messageId": None,
-                }
-            data = response.json()
-            if not data.get("ok", False):
-                return {
-                    "accepted": False,
-                    "error": "telegram_response_not_ok",
-                    "messageId": None,
-                }
-            message_id = data.get("result", {}).get("message_id")
-            return {
-                "accepted": True,
-                "messageId": str(message_id) if message_id is not None else None,
-                "error": None,
-            }
-        except Exception:  # noqa: BLE001
-            return {"accepted": False, "error": "telegram_request_failed", "messageId": None}
+    async def close(self) -> None:
+        if self.client is not None:
+            await self.client.close()
+
+
+class SeenEventIds:
+    """Bounded LRU of recently ingested event IDs.
+
+    Broker redeliveries usually arrive shortly after the original, so most of
+    them are recognised here without a database round trip. The unique
+    ``event_id`` constraint stays the source of truth for older events.
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self.max_size = max(max_size, 1)
+        self._ids: OrderedDict[UUID, None] = OrderedDict()
+
+    def __contains__(self, event_id: object) -> bool:
+        if event_id not in self._ids:
+            return False
+        self._ids.move_to_end(event_id)  # type: ignore[arg-type]
+        return True
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, event_id: UUID) -> None:
+        self._ids[event_id] = None
+        self._ids.move_to_end(event_id)
+        while len(self._ids) > self.max_size:
+            self._ids.popitem(last=False)
 
 
 class NotificationEventsService:
@@ -1654,43 +2308,43 @@ class NotificationEventsService:
         repository: repositories.NotificationEventRepository,
         stream: NotificationStreamService,
         telegram: TelegramService,
+        seen_events: SeenEventIds | None = None,
     ) -> None:
         self.repository = repository
         self.stream = stream
         self.telegram = telegram
+        self.seen_events = seen_events if seen_events is not None else SeenEventIds()
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    async def handle_incoming(self, dto: schemas.NotificationEventIngest) -> schemas.NotificationEvent:
-        existing = await self.repository.get_by_event_id(dto.id)
-        if existing is not None:
-            self.logger.debug("Event %s (%s) already processed", dto.id, dto.type)
-            return schemas.NotificationEvent.model_validate(existing)
+    async def handle_incoming(
+        self, dto: schemas.NotificationEventIngest
+    ) -> schemas.NotificationEvent | None:
+        """Store the event, publish it and send it to Telegram.
 
-        entity = await self.repository.create(
+        Returns ``None`` when the event was handled before.
+        """
+        if dto.id in self.seen_events:
+            self.logger.debug("Event %s (%s) already processed", dto.id, dto.type)
+            return None
+        entity = await self.repository.create_if_absent(
             {
                 "event_id": dto.id,
                 "event_type": dto.type,
                 "payload": dto.data,
             }
         )
+        self.seen_events.add(dto.id)
+        if entity is None:
+            self.logger.debug("Event %s (%s) already processed", dto.id, dto.type)
+            return None
 
         await self.stream.publish(dto.type, dto.data)
 
-        chat_id = dto.chat_id
-        if chat_id is None:
-            recipient = next(
-                (item for item in dto.data.get("recipients", []) if item.get("telegramId")),
-                None,
-            )
-            if recipient:
-                chat_id = str(recipient.get("telegramId"))
-
+        chat_id = self.resolve_chat_id(dto)
         message_body = self._compose_telegram_message(dto)
         send_result = await self.telegram.send(chat_id, message_body)
-        await self._handle_send_result(entity.id, send_result)
-
-        refreshed = await self.repository.get_by_event_id(dto.id)
-        return schemas.NotificationEvent.model_validate(refreshed or entity)
+        updated = await self._handle_send_result(entity.id, send_result)
+        return schemas.NotificationEvent.model_validate(updated or entity)
 
     async def handle_telegram_delivery_update(
         self, dto: schemas.TelegramDeliveryWebhook
@@ -1730,11 +2384,23 @@ class NotificationEventsService:
         )
         return schemas.NotificationEvent.model_validate(updated or entity)
 
+    @staticmethod
+    def resolve_chat_id(dto: schemas.NotificationEventIngest) -> str | None:
+        if dto.chat_id is not None:
+            return dto.chat_id
+        recipient = next(
+            (item for item in dto.data.get("recipients", []) if item.get("telegramId")),
+            None,
+        )
+        return str(recipient.get("telegramId")) if recipient else None
+
     def _compose_telegram_message(self, dto: schemas.NotificationEventIngest) -> str:
         payload_preview = json.dumps(dto.data, ensure_ascii=False, indent=2, default=str)
         return f"{dto.type}\n{dto.time.isoformat()}\n\n{payload_preview}"
 
-    async def _handle_send_result(self, notification_id: UUID, send_result: dict[str, Any]) -> None:
+    async def _handle_send_result(
+        self, notification_id: UUID, send_result: dict[str, Any]
+    ) -> models.NotificationEvent | None:
         skipped = bool(send_result.get("skipped"))
         accepted = bool(send_result.get("accepted")) or skipped
         message_id = send_result.get("messageId")
@@ -1742,7 +2408,7 @@ class NotificationEventsService:
         reason = send_result.get("reason") or (None if accepted else error)
         occurred_at = None if skipped else (datetime.now(timezone.utc) if accepted else None)
         status = "skipped" if skipped else ("sent" if accepted else "failed")
-        await self.repository.update(
+        updated = await self.repository.update(
             notification_id,
             {
                 "delivered_to_telegram": False,
@@ -1768,9 +2434,66 @@ class NotificationEventsService:
         )
         if not accepted:
             raise NotificationDispatchError("notification_dispatch_failed")
+        return updated
+
+
+_OPEN_NOTIFICATION_STATUSES = {
+    schemas.NotificationStatus.PENDING.value,
+    schemas.NotificationStatus.QUEUED.value,
+}
+
+
+@dataclass
+class _AttemptLog:
+    """Delivery attempts of one dispatch round, written when the round ends."""
+
+    notification_id: UUID
+    previous_attempts: int
+    records: list[dict[str, Any]] = field(default_factory=list)
+    last_attempt_at: datetime | None = None
+
+    @property
+    def attempts_count(self) -> int:
+        return self.previous_attempts + len(self.records)
+
+    def add(
+        self,
+        channel: str,
+        status: str,
+        metadata: dict[str, Any],
+        error: str | None = None,
+    ) -> None:
+        self.last_attempt_at = datetime.now(timezone.utc)
+        self.records.append(
+            {
+                "notification_id": self.notification_id,
+                "attempt_number": self.attempts_count + 1,
+                "channel": channel,
+                "status": status,
+                "delivery_metadata": metadata,
+                "error": error,
+            }
+        )
+
+    def succeeded(self, channel: str) -> bool:
+        return any(
+            record["channel"] == channel and record["status"] == "success"
+            for record in self.records
+        )
 
 
 class NotificationService:
+    """Accepts notifications and delivers them through every dispatch channel.
+
+    ``enqueue`` only stores the notification; ``deliver`` is called by the
+    background dispatcher and runs the channels that have not succeeded yet
+    (RabbitMQ, Redis, the internal events service) once. A failed round is
+    retried after an exponential, jittered delay until ``retry_attempts``
+    rounds have failed.
+    """
+
+    DISPATCH_CHANNELS = ("rabbitmq", "redis", "events-service")
+
     def __init__(
         self,
         repository: repositories.NotificationRepository,
@@ -1784,6 +2507,8 @@ class NotificationService:
         redis_channel: str,
         retry_attempts: int,
         retry_delay_ms: int,
+        retry_max_delay_ms: int = 900_000,
+        wakeup: Callable[[], None] | None = None,
     ) -> None:
         self.repository = repository
         self.attempts = attempts
@@ -1793,8 +2518,10 @@ class NotificationService:
         self.rabbit_exchange = rabbit_exchange
         self.rabbit_routing_key = rabbit_routing_key
         self.redis_channel = redis_channel
-        self.retry_attempts = retry_attempts
+        self.retry_attempts = max(retry_attempts, 1)
         self.retry_delay_ms = retry_delay_ms
+        self.retry_max_delay_ms = retry_max_delay_ms
+        self.wakeup = wakeup
         self.logger = logging.getLogger(self.__class__.__name__)
 
     async def enqueue(self, payload: schemas.NotificationCreate) -> schemas.NotificationRead:
@@ -1805,57 +2532,91 @@ class NotificationService:
             "recipients": recipients,
             "channel_overrides": payload.channel_overrides or None,
             "deduplication_key": payload.deduplication_key,
+            "status": schemas.NotificationStatus.PENDING.value,
         }
         try:
             entity = await self.repository.create(data)
         except IntegrityError as exc:
             raise DuplicateNotificationError("duplicate_notification") from exc
+        if self.wakeup is not None:
+            self.wakeup()
+        refreshed = await self.repository.get_with_attempts(entity.id)
+        return schemas.NotificationRead.model_validate(refreshed or entity)
 
-        message = {
-            "notificationId": str(entity.id),
-            "eventKey": entity.event_key,
-            "payload": entity.payload,
-            "recipients": recipients,
-            "channelOverrides": entity.channel_overrides or [],
-            "deduplicationKey": entity.deduplication_key,
+    async def deliver(
+        self,
+        entity: models.Notification,
+        limits: Mapping[str, asyncio.Semaphore] | None = None,
+    ) -> schemas.NotificationStatus | None:
+        """Run one dispatch round for a claimed notification.
+
+        Returns the final status, or ``None`` when another round is scheduled.
+        ``limits`` caps how many notifications use each channel at once. The
+        attempts of the round are written together with the new status in a
+        single statement once the round is over.
+        """
+        attempts = list(entity.attempts or [])
+        done = {attempt.channel for attempt in attempts if attempt.status == "success"}
+        log = _AttemptLog(entity.id, len(attempts))
+        message = self._dispatch_message(entity)
+        operations = {
+            "rabbitmq": lambda: self._publish_rabbit(message, log),
+            "redis": lambda: self._publish_redis(message, log),
+            "events-service": lambda: self._dispatch_internal(entity, message, log),
         }
-
-        attempt_counter = {"value": 0}
-
         try:
-            await self._execute_with_retry(
-                "rabbitmq",
-                lambda: self._publish_rabbit(entity.id, message, attempt_counter),
-            )
-            await self._execute_with_retry(
-                "redis",
-                lambda: self._publish_redis(entity.id, message, attempt_counter),
-            )
-            await self._execute_with_retry(
-                "events-service",
-                lambda: self._dispatch_internal(payload, entity.id, message, attempt_counter),
-            )
-            await self.repository.update(
-                entity.id,
-                {
-                    "status": schemas.NotificationStatus.PROCESSED.value,
-                    "last_error": None,
-                },
-            )
+            for channel in self.DISPATCH_CHANNELS:
+                if channel in done:
+                    continue
+                limit = (limits or {}).get(channel)
+                if limit is None:
+                    await operations[channel]()
+                    continue
+                async with limit:
+                    await operations[channel]()
         except Exception as exc:  # noqa: BLE001
             error_message = str(exc)
-            await self.repository.update(
+            failed_rounds = sum(attempt.status == "failure" for attempt in attempts) + 1
+            if failed_rounds >= self.retry_attempts:
+                await self._finish_round(
+                    log,
+                    {
+                        "status": schemas.NotificationStatus.FAILED.value,
+                        "last_error": error_message,
+                        "next_attempt_at": None,
+                        "locked_until": None,
+                    },
+                )
+                self.logger.error("Failed to dispatch notification %s: %s", entity.id, error_message)
+                return schemas.NotificationStatus.FAILED
+            delay = self._retry_delay(failed_rounds)
+            values: dict[str, Any] = {
+                "last_error": error_message,
+                "next_attempt_at": datetime.now(timezone.utc) + delay,
+                "locked_until": None,
+            }
+            if log.succeeded("rabbitmq"):
+                values["status"] = schemas.NotificationStatus.QUEUED.value
+            await self._finish_round(log, values)
+            self.logger.warning(
+                "Dispatch round %s of notification %s failed, retrying in %.0f s: %s",
+                failed_rounds,
                 entity.id,
-                {
-                    "status": schemas.NotificationStatus.FAILED.value,
-                    "last_error": error_message,
-                },
+                delay.total_seconds(),
+                error_message,
             )
-            self.logger.error("Failed to dispatch notification %s: %s", entity.id, error_message)
-            raise NotificationDispatchError("notification_dispatch_failed") from exc
+            return None
 
-        refreshed = await self.repository.get_with_attempts(entity.id)
-        return schemas.NotificationRead.model_validate(refreshed or entity)
+        await self._finish_round(
+            log,
+            {
+                "status": schemas.NotificationStatus.PROCESSED.value,
+                "last_error": None,
+                "next_attempt_at": None,
+                "locked_until": None,
+            },
+        )
+        return schemas.NotificationStatus.PROCESSED
 
     async def get_status(
         self, notification_id: UUID
@@ -1885,170 +2646,89 @@ class NotificationService:
             attempts=len(attempts),
             channels=channels,
             delivered_at=delivered_at,
+            next_attempt_at=entity.next_attempt_at if status in _OPEN_NOTIFICATION_STATUSES else None,
         )
 
-    async def _publish_rabbit(
-        self,
-        notification_id: UUID,
-        message: dict[str, Any],
-        counter: dict[str, int],
-    ) -> None:
-        counter["value"] += 1
-        attempt_number = counter["value"]
+    def _dispatch_message(self, entity: models.Notification) -> dict[str, Any]:
+        return {
+            "notificationId": str(entity.id),
+            "eventKey": entity.event_key,
+            "payload": entity.payload,
+            "recipients": entity.recipients,
+            "channelOverrides": entity.channel_overrides or [],
+            "deduplicationKey": entity.deduplication_key,
+        }
+
+    def _retry_delay(self, failed_rounds: int) -> timedelta:
+        base_ms = min(
+            max(self.retry_delay_ms, 0) * 2 ** (failed_rounds - 1), self.retry_max_delay_ms
+        )
+        # Equal jitter: half of the delay is fixed, the other half random.
+        return timedelta(milliseconds=base_ms / 2 + random.uniform(0, base_ms / 2))
+
+    async def _publish_rabbit(self, message: dict[str, Any], log: _AttemptLog) -> None:
+        metadata = {"exchange": self.rabbit_exchange, "routingKey": self.rabbit_routing_key}
         try:
             await self.dispatcher.publish_rabbit(
                 self.rabbit_exchange, self.rabbit_routing_key, message
             )
-            await self._record_attempt(
-                notification_id,
-                attempt_number,
-                "rabbitmq",
-                "success",
-                {"exchange": self.rabbit_exchange, "routingKey": self.rabbit_routing_key},
-            )
-            await self.repository.update(
-                notification_id,
-                {"status": schemas.NotificationStatus.QUEUED.value},
-            )
         except Exception as exc:  # noqa: BLE001
-            await self._record_attempt(
-                notification_id,
-                attempt_number,
-                "rabbitmq",
-                "failure",
-                {"exchange": self.rabbit_exchange, "routingKey": self.rabbit_routing_key},
-                str(exc),
-            )
+            log.add("rabbitmq", "failure", metadata, str(exc))
             raise
+        log.add("rabbitmq", "success", metadata)
 
-    async def _publish_redis(
-        self,
-        notification_id: UUID,
-        message: dict[str, Any],
-        counter: dict[str, int],
-    ) -> None:
-        counter["value"] += 1
-        attempt_number = counter["value"]
+    async def _publish_redis(self, message: dict[str, Any], log: _AttemptLog) -> None:
+        metadata = {"channel": self.redis_channel}
         try:
             await self.dispatcher.publish_redis(self.redis_channel, message)
-            await self._record_attempt(
-                notification_id,
-                attempt_number,
-                "redis",
-                "success",
-                {"channel": self.redis_channel},
-            )
         except Exception as exc:  # noqa: BLE001
-            await self._record_attempt(
-                notification_id,
-                attempt_number,
-                "redis",
-                "failure",
-                {"channel": self.redis_channel},
-                str(exc),
-            )
+            log.add("redis", "failure", metadata, str(exc))
             raise
+        log.add("redis", "success", metadata)
 
     async def _dispatch_internal(
         self,
-        payload: schemas.NotificationCreate,
-        notification_id: UUID,
+        entity: models.Notification,
         message: dict[str, Any],
-        counter: dict[str, int],
+        log: _AttemptLog,
     ) -> None:
-        counter["value"] += 1
-        attempt_number = counter["value"]
+        notification_id = entity.id
         chat_id = next(
-            (recipient.telegram_id for recipient in payload.recipients if recipient.telegram_id),
+            (
+                str(recipient["telegramId"])
+                for recipient in entity.recipients
+                if recipient.get("telegramId")
+            ),
             None,
         )
         event_payload = dict(message["payload"])
         event_payload.update(
             {
                 "notificationId": str(notification_id),
-                "recipients": [r.model_dump(by_alias=True) for r in payload.recipients],
-                "channelOverrides": payload.channel_overrides or [],
+                "recipients": entity.recipients,
+                "channelOverrides": entity.channel_overrides or [],
             }
         )
         dto = schemas.NotificationEventIngest(
             id=uuid4(),
             source="crm.notifications",
-            type=payload.event_key,
+            type=entity.event_key,
             time=datetime.now(timezone.utc),
             data=event_payload,
             chat_id=chat_id,
         )
         try:
             await self.events_service.handle_incoming(dto)
-            await self._record_attempt(
-                notification_id,
-                attempt_number,
-                "events-service",
-                "success",
-                {"chatId": chat_id},
-            )
         except Exception as exc:  # noqa: BLE001
-            await self._record_attempt(
-                notification_id,
-                attempt_number,
-                "events-service",
-                "failure",
-                {"chatId": chat_id},
-                str(exc),
-            )
+            log.add("events-service", "failure", {"chatId": chat_id}, str(exc))
             raise
-
-    async def _record_attempt(
-        self,
-        notification_id: UUID,
-        attempt_number: int,
-        channel: str,
-        status: str,
-        metadata: dict[str, Any],
-        error: str | None = None,
-    ) -> None:
-        await self.attempts.create(
-            {
-                "notification_id": notification_id,
-                "attempt_number": attempt_number,
-                "channel": channel,
-                "status": status,
-                "delivery_metadata": metadata,
-                "error": error,
+        log.add("events-service", "success", {"chatId": chat_id})
+
+    async def _finish_round(self, log: _AttemptLog, values: dict[str, Any]) -> None:
+        if log.records:
+            values = {
+                **values,
+                "attempts_count": log.attempts_count,
+                "last_attempt_at": log.last_attempt_at,
             }
-        )
-        update_payload: dict[str, Any] = {
-            "attempts_count": attempt_number,
-            "last_attempt_at": datetime.now(timezone.utc),
-        }
-        if status == "failure":
-            update_payload["last_error"] = error
-        else:
-            update_payload["last_error"] = None
-        await self.repository.update(notification_id, update_payload)
-
-    async def _execute_with_retry(
-        self,
-        channel: str,
-        operation: callable,
-    ) -> None:
-        attempt = 0
-        last_error: Exception | None = None
-        while attempt < self.retry_attempts:
-            attempt += 1
-            try:
-                await operation()
-                return
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc if isinstance(exc, Exception) else Exception(str(exc))
-                if attempt >= self.retry_attempts:
-                    break
-                delay = max(self.retry_delay_ms, 0) / 1000.0
-                if delay:
-                    await asyncio.sleep(delay)
-                self.logger.warning(
-                    "Channel %s attempt %s failed: %s", channel, attempt, exc
-                )
-        if last_error is None:
-            last_error = NotificationDispatchError("operation_failed")
-        raise last_error
+        await self.attempts.record(log.notification_id, log.records, values)
@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import aio_pika
+from aio_pika import ExchangeType, Message
+from aio_pika.abc import AbstractChannel, AbstractExchange, AbstractRobustConnection
+
+from crm.app.config import Settings
+
+ExchangeFactory = Callable[[str], Awaitable[AbstractExchange]]
+
+
+class PublishBufferFull(RuntimeError):
+    """The publish buffer stayed full for longer than the enqueue timeout."""
+
+
+@dataclass
+class PublisherStats:
+    published: int = 0
+    failed: int = 0
+    batches: int = 0
+    confirm_latency_ms_total: float = 0.0
+    confirm_latency_ms_max: float = 0.0
+
+    @property
+    def confirm_latency_ms_avg(self) -> float:
+        return self.confirm_latency_ms_total / self.batches if self.batches else 0.0
+
+
+@dataclass
+class _PendingMessage:
+    exchange: str
+    routing_key: str
+    message: Message
+    future: asyncio.Future[None]
+
+
+class BatchingPublisher:
+    """Publishes buffered messages in pipelined batches on a confirm-mode channel.
+
+    A background flusher takes up to ``batch_size`` messages, or whatever
+    arrived within ``flush_interval_ms``, sends them back to back and awaits
+    their confirms together; up to ``max_in_flight_batches`` batches overlap.
+    ``publish`` still returns only after the broker confirmed the message.
+    When ``buffer_size`` messages are waiting, callers block for at most
+    ``enqueue_timeout_ms`` and then get ``PublishBufferFull``.
+    """
+
+    def __init__(
+        self,
+        exchange_factory: ExchangeFactory,
+        *,
+        buffer_size: int = 10_000,
+        batch_size: int = 100,
+        flush_interval_ms: int = 5,
+        max_in_flight_batches: int = 4,
+        enqueue_timeout_ms: int = 1000,
+        report_interval_s: float = 60.0,
+        name: str = "amqp",
+    ) -> None:
+        self._exchange_factory = exchange_factory
+        self.buffer_size = max(buffer_size, 1)
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = max(flush_interval_ms, 0) / 1000
+        self.max_in_flight_batches = max(max_in_flight_batches, 1)
+        self.enqueue_timeout = max(enqueue_timeout_ms, 0) / 1000
+        self.report_interval_s = report_interval_s
+        self.name = name
+        self.stats = PublisherStats()
+        self._queue: asyncio.Queue[_PendingMessage] | None = None
+        self._batch_ready: asyncio.Event | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._flusher: asyncio.Task[None] | None = None
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._collecting: list[_PendingMessage] = []
+        self._reported_at = time.perf_counter()
+        self._reported_published = 0
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings, exchange_factory: ExchangeFactory, *, name: str
+    ) -> "BatchingPublisher":
+        return cls(
+            exchange_factory,
+            buffer_size=settings.amqp_publish_buffer_size,
+            batch_size=settings.amqp_publish_batch_size,
+            flush_interval_ms=settings.amqp_publish_flush_interval_ms,
+            max_in_flight_batches=settings.amqp_publish_max_in_flight_batches,
+            enqueue_timeout_ms=settings.amqp_publish_enqueue_timeout_ms,
+            name=name,
+        )
+
+    @property
+    def buffered(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def publish(self, exchange: str, routing_key: str, message: Message) -> None:
+        """Buffer ``message`` and wait for its broker confirm."""
+        await (await self.enqueue(exchange, routing_key, message))
+
+    async def enqueue(
+        self, exchange: str, routing_key: str, message: Message
+    ) -> asyncio.Future[None]:
+        """Buffer ``message`` and return a future resolved by its confirm.
+
+        Waits for free buffer space, which is how back-pressure reaches callers.
+        """
+        queue = self._ensure_started()
+        pending = _PendingMessage(
+            exchange, routing_key, message, asyncio.get_running_loop().create_future()
+        )
+        try:
+            await asyncio.wait_for(queue.put(pending), self.enqueue_timeout)
+        except asyncio.TimeoutError as exc:
+            raise PublishBufferFull(
+                f"{self.name} publish buffer is full ({self.buffer_size} messages)"
+            ) from exc
+        # The flusher already holds one message of the batch it is collecting.
+        if queue.qsize() >= self.batch_size - 1:
+            assert self._batch_ready is not None
+            self._batch_ready.set()
+        return pending.future
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Flush what is buffered, then stop the flusher."""
+        if self._flusher is None or self._queue is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            self._logger.warning(
+                "%s publisher closed with %d messages unsent", self.name, self._queue.qsize()
+            )
+        self._flusher.cancel()
+        await asyncio.gather(self._flusher, *self._in_flight, return_exceptions=True)
+        unsent = list(self._collecting)
+        while not self._queue.empty():
+            unsent.append(self._queue.get_nowait())
+        for pending in unsent:
+            if not pending.future.done():
+                pending.future.set_exception(RuntimeError(f"{self.name} publisher closed"))
+        self._collecting = []
+        self._flusher = None
+        self._queue = None
+
+    def _ensure_started(self) -> asyncio.Queue[_PendingMessage]:
+        if self._flusher is None or self._flusher.done():
+            self._queue = asyncio.Queue(maxsize=self.buffer_size)
+            self._batch_ready = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.max_in_flight_batches)
+            self._flusher = asyncio.create_task(self._run(), name=f"{self.name}-publisher")
+        assert self._queue is not None
+        return self._queue
+
+    async def _run(self) -> None:
+        assert self._queue is not None and self._batch_ready is not None
+        assert self._slots is not None
+        queue = self._queue
+        while True:
+            batch = self._collecting = [await queue.get()]
+            if queue.qsize() + 1 < self.batch_size and self.flush_interval > 0:
+                self._batch_ready.clear()
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            await self._slots.acquire()
+            task = asyncio.create_task(self._flush(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+            self._collecting = []
+
+    async def _flush(self, batch: list[_PendingMessage]) -> None:
+        assert self._queue is not None and self._slots is not None
+        queue = self._queue
+        started = time.perf_counter()
+        try:
+            results: list[object]
+            try:
+                exchanges = {
+                    name: await self._exchange_factory(name)
+                    for name in {pending.exchange for pending in batch}
+                }
+            except Exception as exc:  # noqa: BLE001 - fail the whole batch
+                results = [exc] * len(batch)
+            else:
+                results = await asyncio.gather(
+                    *(
+                        exchanges[pending.exchange].publish(
+                            pending.message, routing_key=pending.routing_key
+                        )
+                        for pending in batch
+                    ),
+                    return_exceptions=True,
+                )
+
+            latency_ms = (time.perf_counter() - started) * 1000
+            self.stats.batches += 1
+            self.stats.confirm_latency_ms_total += latency_ms
+            self.stats.confirm_latency_ms_max = max(self.stats.confirm_latency_ms_max, latency_ms)
+            for pending, result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    self.stats.failed += 1
+                    if not pending.future.done():
+                        pending.future.set_exception(result)
+                else:
+                    self.stats.published += 1
+                    if not pending.future.done():
+                        pending.future.set_result(None)
+            self._maybe_report()
+        finally:
+            for _ in batch:
+                queue.task_done()
+            self._slots.release()
+
+    def _maybe_report(self) -> None:
+        now = time.perf_counter()
+        elapsed = now - self._reported_at
+        if elapsed < self.report_interval_s:
+            return
+        published = self.stats.published - self._reported_published
+        self._logger.info(
+            "%s publisher: %d messages in %.0f s (%.0f msg/s), %d failed, "
+            "confirm latency avg %.1f ms max %.1f ms, %d buffered",
+            self.name,
+            published,
+            elapsed,
+            published / elapsed,
+            self.stats.failed,
+            self.stats.confirm_latency_ms_avg,
+            self.stats.confirm_latency_ms_max,
+            self.buffered,
+        )
+        self._reported_at = now
+        self._reported_published = self.stats.published
+
+
+class AmqpConnectionManager:
+    """RabbitMQ connection shared by every publisher and consumer of a process.
+
+    Owns one robust connection, which aio-pika restores after a broker outage
+    together with its channels, exchanges and consumers, so reconnects are
+    not handled component by component. Publishers share one confirm-mode
+    channel and its cache of declared exchanges; consumers borrow plain
+    channels from a small pool. The broker sees a constant number of
+    connections however many requests or SSE clients are served.
+    """
+
+    def __init__(self, url: str, *, channel_pool_size: int = 8) -> None:
+        self._url = url
+        self.channel_pool_size = max(channel_pool_size, 0)
+        self._connection: AbstractRobustConnection | None = None
+        self._publish_channel: AbstractChannel | None = None
+        self._exchanges: dict[str, AbstractExchange] = {}
+        self._idle_channels: list[AbstractChannel] = []
+        self._lock = asyncio.Lock()
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "AmqpConnectionManager":
+        return cls(
+            str(settings.rabbitmq_url),
+            channel_pool_size=settings.amqp_channel_pool_size,
+        )
+
+    async def connection(self) -> AbstractRobustConnection:
+        if self._connection is not None:
+            return self._connection
+        async with self._lock:
+            if self._connection is None:
+                self._connection = await aio_pika.connect_robust(self._url)
+                self._logger.info("RabbitMQ connection opened")
+            return self._connection
+
+    async def publish_channel(self) -> AbstractChannel:
+        """Confirm-mode channel shared by all publishers."""
+        channel = self._publish_channel
+        if channel is not None and not channel.is_closed:
+            return channel
+        connection = await self.connection()
+        async with self._lock:
+            if self._publish_channel is None or self._publish_channel.is_closed:
+                self._publish_channel = await connection.channel(publisher_confirms=True)
+                self._exchanges.clear()
+            return self._publish_channel
+
+    async def exchange(
+        self, name: str, type_: ExchangeType = ExchangeType.TOPIC
+    ) -> AbstractExchange:
+        """Durable exchange declared once on the publish channel."""
+        channel = await self.publish_channel()
+        exchange = self._exchanges.get(name)
+        if exchange is None:
+            exchange = await channel.declare_exchange(name, type_, durable=True)
+            self._exchanges[name] = exchange
+        return exchange
+
+    @asynccontextmanager
+    async def channel(self, *, prefetch_count: int | None = None) -> AsyncIterator[AbstractChannel]:
+        """Borrow a channel for consuming; it is returned to the pool on exit."""
+        channel = await self._acquire_channel()
+        if prefetch_count is not None:
+            await channel.set_qos(prefetch_count=prefetch_count)
+        try:
+            yield channel
+        finally:
+            await self._release_channel(channel)
+
+    async def close(self) -> None:
+        async with self._lock:
+            channels = [*self._idle_channels]
+            if self._publish_channel is not None:
+                channels.append(self._publish_channel)
+            connection = self._connection
+            self._idle_channels = []
+            self._exchanges = {}
+            self._publish_channel = None
+            self._connection = None
+        for channel in channels:
+            try:
+                await channel.close()
+            except Exception:  # noqa: BLE001
+                continue
+        if connection is not None:
+            try:
+                await connection.close()
+            except Exception:  # noqa: BLE001
+                pass
+            self._logger.info("RabbitMQ connection closed")
+
+    async def _acquire_channel(self) -> AbstractChannel:
+        while self._idle_channels:
+            channel = self._idle_channels.pop()
+            if not channel.is_closed:
+                return channel
+        connection = await self.connection()
+        return await connection.channel()
+
+    async def _release_channel(self, channel: AbstractChannel) -> None:
+        if channel.is_closed:
+            return
+        if self._connection is not None and len(self._idle_channels) < self.channel_pool_size:
+            self._idle_channels.append(channel)
+            return
+        try:
+            await channel.close()
+        except Exception:  # noqa: BLE001
+            pass
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import logging
 import shlex
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from importlib import import_module
 from typing import Any
 
@@ -9,6 +11,13 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.engine import URL, make_url
 
 
+logger = logging.getLogger(__name__)
+
+AfterCommitAction = Callable[[], Awaitable[object]]
+
+_AFTER_COMMIT_KEY = "crm_after_commit"
+
+
 def _build_async_url(raw_url: str) -> tuple[URL, dict[str, Any]]:
     url = make_url(raw_url)
     query = dict(url.query)
@@ -114,8 +123,67 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _ensure_session_factory()
 
 
+async def dispose_engine() -> None:
+    """Close pooled connections; the engine is recreated on next use."""
+    global _engine, _session_factory
+
+    engine = _engine
+    _engine = None
+    _session_factory = None
+    if engine is not None:
+        await engine.dispose()
+
+
+@asynccontextmanager
+async def transactional_session() -> AsyncIterator[AsyncSession]:
+    """Session whose repository commits join one outer transaction.
+
+    Repositories commit after every write. Inside this scope those commits
+    only release savepoints, so rows written later in the same request (the
+    event outbox) become visible together with the domain change when the
+    scope exits cleanly, and are discarded together on error. Side effects
+    registered with ``run_after_commit`` run only once the outer transaction
+    has committed.
+    """
+
+    _ensure_session_factory()
+    assert _engine is not None
+    pending: list[AfterCommitAction] = []
+    async with _engine.connect() as connection:
+        async with connection.begin():
+            async with AsyncSession(
+                bind=connection,
+                expire_on_commit=False,
+                autoflush=False,
+                join_transaction_mode="create_savepoint",
+            ) as session:
+                session.info[_AFTER_COMMIT_KEY] = pending
+                yield session
+    for action in pending:
+        try:
+            await action()
+        except Exception:  # noqa: BLE001 - the transaction is already committed
+            logger.exception("After-commit action failed")
+
+
+async def run_after_commit(session: AsyncSession, action: AfterCommitAction) -> None:
+    """Run ``action`` once the data written through ``session`` is committed.
+
+    Within ``transactional_session`` the action waits for the outer commit
+    and is dropped on rollback; a plain session commits on every repository
+    write, so the action runs right away.
+    """
+
+    pending = session.info.get(_AFTER_COMMIT_KEY)
+    if pending is None:
+        await action()
+    else:
+        pending.append(action)
+
+
 try:  # pragma: no cover - best effort eager initialisation
     _ensure_session_factory()
 except ValueError:
     # Некорректный DSN. Инициализация произойдёт позже, когда окружение будет настроено.
     pass
+
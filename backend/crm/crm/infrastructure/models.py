@@ -19,6 +19,7 @@ from sqlalchemy import (
     func,
     Integer,
     JSON,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, DATERANGE, JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -479,6 +480,10 @@ class Notification(CRMBase, TimestampMixin):
     attempts_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     last_attempt_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    next_attempt_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, server_default=text("timezone('utc', now())")
+    )
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     attempts: Mapped[list["NotificationDeliveryAttempt"]] = relationship(
         back_populates="notification",
@@ -489,6 +494,11 @@ class Notification(CRMBase, TimestampMixin):
     __table_args__ = (
         Index("ix_notifications_event_key", "event_key"),
         Index("ix_notifications_status", "status"),
+        Index(
+            "ix_notifications_due",
+            "next_attempt_at",
+            postgresql_where=text("status IN ('pending', 'queued')"),
+        ),
     )
 
 
@@ -537,3 +547,33 @@ class NotificationEvent(CRMBase, TimestampMixin):
         Index("ix_notification_events_event_type", "event_type"),
         Index("ix_notification_events_telegram_message_id", "telegram_message_id"),
     )
+
+
+class OutboxMessage(CRMBase):
+    __tablename__ = "outbox"
+
+    id: Mapped[UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+    exchange: Mapped[str] = mapped_column(String(255), nullable=False)
+    routing_key: Mapped[str] = mapped_column(String(255), nullable=False)
+    body: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    content_type: Mapped[str] = mapped_column(String(128), nullable=False)
+    headers: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index(
+            "ix_outbox_pending",
+            "available_at",
+            "created_at",
+            postgresql_where=text("sent_at IS NULL"),
+        ),
+        Index("ix_outbox_sent", "sent_at", postgresql_where=text("sent_at IS NOT NULL")),
+    )
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from redis.asyncio import Redis
+
+from crm.app.config import Settings
+
+Deliver = Callable[[str, dict[str, Any], str], None]
+
+
+class RedisNotificationStreamBackend:
+    """Shares notification events between CRM processes through a Redis stream.
+
+    ``publish`` appends to the stream; every process runs a relay that reads
+    new entries and hands them to its local subscribers, so a client sees
+    events handled by any worker or replica. Stream entry IDs are global and
+    ordered, which keeps ``Last-Event-ID`` meaningful across processes, and
+    the relay resumes from the last entry it read after a Redis outage.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        stream_key: str,
+        *,
+        maxlen: int = 10_000,
+        block_ms: int = 5_000,
+        read_count: int = 500,
+    ) -> None:
+        self._redis = redis
+        self.stream_key = stream_key
+        self.maxlen = maxlen
+        self.block_ms = block_ms
+        self.read_count = read_count
+        self._task: asyncio.Task[None] | None = None
+        self._last_id = "$"
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def from_settings(cls, settings: Settings, redis: Redis) -> "RedisNotificationStreamBackend":
+        return cls(
+            redis,
+            settings.notifications_stream_redis_key,
+            maxlen=settings.notifications_stream_redis_maxlen,
+        )
+
+    async def publish(self, event_type: str, payload: dict[str, Any]) -> None:
+        await self._redis.xadd(
+            self.stream_key,
+            {"event": event_type, "payload": json.dumps(payload, ensure_ascii=False, default=str)},
+            maxlen=self.maxlen,
+            approximate=True,
+        )
+
+    async def start(self, deliver: Deliver) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._relay(deliver), name="notification-stream-relay")
+
+    async def stop(self) -> None:
+        task = self._task
+        self._task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _relay(self, deliver: Deliver) -> None:
+        while True:
+            try:
+                response = await self._redis.xread(
+                    {self.stream_key: self._last_id}, count=self.read_count, block=self.block_ms
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                self._logger.exception("Notification stream relay failed; retrying in 1 second")
+                await asyncio.sleep(1)
+                continue
+            for _, entries in response or ():
+                for entry_id, fields in entries:
+                    self._last_id = entry_id
+                    try:
+                        payload = json.loads(fields["payload"])
+                        deliver(fields["event"], payload, entry_id)
+                    except Exception:  # noqa: BLE001
+                        self._logger.exception("Skipping malformed notification stream entry %s", entry_id)
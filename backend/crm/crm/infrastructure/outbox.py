@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from aio_pika import Message
+from aio_pika.abc import AbstractExchange
+
+from crm.app.config import Settings
+from crm.domain import schemas
+from crm.infrastructure import models
+from crm.infrastructure.amqp import AmqpConnectionManager
+from crm.infrastructure.repositories import OutboxRepository
+from crm.infrastructure.task_events import TaskEventsPublisher
+
+
+def _outbox_message(
+    exchange: str,
+    routing_key: str,
+    body: dict[str, Any],
+    *,
+    content_type: str,
+    headers: dict[str, Any],
+) -> dict[str, Any]:
+    # Round-trip through JSON so the JSONB column gets exactly what the broker would.
+    normalized = json.loads(json.dumps(body, ensure_ascii=False, default=str))
+    return {
+        "exchange": exchange,
+        "routing_key": routing_key,
+        "body": normalized,
+        "content_type": content_type,
+        "headers": headers,
+    }
+
+
+class OutboxEventsPublisher:
+    """``EventsPublisher`` counterpart that writes to the outbox table."""
+
+    def __init__(self, repository: OutboxRepository, exchange: str) -> None:
+        self._repository = repository
+        self._exchange = exchange
+
+    async def publish(self, routing_key: str, payload: dict[str, Any]) -> None:
+        await self._repository.add_many(
+            [
+                _outbox_message(
+                    self._exchange,
+                    routing_key,
+                    payload,
+                    content_type="application/json",
+                    headers={"event": routing_key},
+                )
+            ]
+        )
+
+
+class OutboxTaskEventsPublisher(TaskEventsPublisher):
+    """Task events (CloudEvents envelopes) written to the outbox table.
+
+    Never connects to RabbitMQ itself; a failed insert propagates so the
+    request transaction is rolled back instead of losing the event.
+    """
+
+    def __init__(self, settings: Settings, repository: OutboxRepository) -> None:
+        super().__init__(settings)
+        self._repository = repository
+
+    async def tasks_status_changed(
+        self, tasks: list[models.Task], previous_status: schemas.TaskStatusCode
+    ) -> None:
+        routing_key = self._routing_keys.get("task_status_changed", "task.status.changed")
+        await self._repository.add_many(
+            [
+                self._outbox_message(
+                    routing_key,
+                    self._create_event(
+                        "tasks.task.status_changed",
+                        self._map_task_status_changed(task, previous_status),
+                    ),
+                )
+                for task in tasks
+                if previous_status.value != task.status_code
+            ]
+        )
+
+    async def _publish(
+        self,
+        routing_key: str,
+        event_type: str,
+        data: dict[str, Any],
+        *,
+        suppress_errors: bool = True,
+    ) -> None:
+        await self._repository.add_many(
+            [self._outbox_message(routing_key, self._create_event(event_type, data))]
+        )
+
+    def _outbox_message(self, routing_key: str, event: dict[str, Any]) -> dict[str, Any]:
+        return _outbox_message(
+            self._settings.tasks_events_exchange,
+            routing_key,
+            event,
+            content_type="application/cloudevents+json",
+            headers={"ce-specversion": "1.0"},
+        )
+
+
+class OutboxSender:
+    """Publishes outbox rows to RabbitMQ with publisher confirms.
+
+    A batch is published without waiting for each confirm in turn: all
+    messages are sent and their confirms awaited together.
+    """
+
+    def __init__(
+        self, settings: Settings, connections: AmqpConnectionManager | None = None
+    ) -> None:
+        self._owns_connections = connections is None
+        self._connections = connections or AmqpConnectionManager.from_settings(settings)
+
+    async def connect(self) -> None:
+        await self._connections.publish_channel()
+
+    async def close(self) -> None:
+        if self._owns_connections:
+            await self._connections.close()
+
+    async def send_many(
+        self, messages: Sequence[models.OutboxMessage]
+    ) -> list[BaseException | None]:
+        """Publish ``messages``; the result holds the error of each message, if any."""
+        exchanges: dict[str, AbstractExchange] = {}
+        for name in {message.exchange for message in messages}:
+            exchanges[name] = await self._connections.exchange(name)
+        results = await asyncio.gather(
+            *(
+                exchanges[message.exchange].publish(
+                    self._build_message(message), routing_key=message.routing_key
+                )
+                for message in messages
+            ),
+            return_exceptions=True,
+        )
+        return [result if isinstance(result, BaseException) else None for result in results]
+
+    @staticmethod
+    def _build_message(message: models.OutboxMessage) -> Message:
+        return Message(
+            body=json.dumps(message.body, ensure_ascii=False).encode("utf-8"),
+            content_type=message.content_type,
+            headers=dict(message.headers or {}),
+            message_id=str(message.id),
+            timestamp=message.created_at,
+        )
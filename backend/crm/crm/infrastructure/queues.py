@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from uuid import UUID
@@ -62,37 +63,123 @@ class PermissionsQueue:
         await self.redis.aclose()
 
 
+# Moves leases that expired before ARGV[1] back to the queue, due immediately.
+# KEYS: queue, in-flight set. ARGV: now_ms, limit.
+_REQUEUE_EXPIRED_STEP = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], 0, ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, member in ipairs(expired) do
+    redis.call('ZADD', KEYS[1], 'NX', ARGV[1], member)
+    redis.call('ZREM', KEYS[2], member)
+end
+"""
+
+_REQUEUE_EXPIRED_LUA = _REQUEUE_EXPIRED_STEP + "return #expired\n"
+
+# Requeues expired leases, then moves up to ARGV[2] due members into the
+# in-flight set scored by their lease deadline (ARGV[3]).
+# Returns a flat [member, score, member, score, ...] list.
+_CLAIM_DUE_LUA = _REQUEUE_EXPIRED_STEP + """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], 0, ARGV[1], 'WITHSCORES', 'LIMIT', 0, tonumber(ARGV[2]))
+for i = 1, #due, 2 do
+    redis.call('ZREM', KEYS[1], due[i])
+    redis.call('ZADD', KEYS[2], ARGV[3], due[i])
+end
+return due
+"""
+
+
 @dataclass
 class TaskReminderQueue:
+    """Sorted set of reminders scored by their due time in milliseconds.
+
+    ``claim_due`` leases due reminders into ``<queue_key>:inflight`` instead
+    of deleting them: a consumer must ``ack`` (or ``schedule`` again) every
+    claimed reminder before ``lease_ms`` runs out, otherwise the lease
+    expires and the reminder is claimed again (at-least-once delivery).
+
+    ``schedule`` also announces the new due time on ``<queue_key>:wakeup`` so
+    a sleeping ``ReminderScheduler`` can wake up early.
+    """
+
     redis: Redis
     queue_key: str
+    lease_ms: int = 60_000
+
+    def __post_init__(self) -> None:
+        self._claim_script = self.redis.register_script(_CLAIM_DUE_LUA)
+        self._requeue_script = self.redis.register_script(_REQUEUE_EXPIRED_LUA)
+
+    @property
+    def inflight_key(self) -> str:
+        return f"{self.queue_key}:inflight"
+
+    @property
+    def wakeup_channel(self) -> str:
+        return f"{self.queue_key}:wakeup"
 
     async def schedule(self, reminder_id: UUID | str, run_at: datetime) -> None:
         timestamp = int(run_at.astimezone(timezone.utc).timestamp() * 1000)
-        await self.redis.zadd(self.queue_key, {str(reminder_id): timestamp})
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(self.queue_key, {str(reminder_id): timestamp})
+            pipe.zrem(self.inflight_key, str(reminder_id))
+            pipe.publish(self.wakeup_channel, timestamp)
+            await pipe.execute()
+
+    async def next_due_at(self) -> int | None:
+        """Earliest due time or lease deadline in milliseconds, if any."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zrange(self.queue_key, 0, 0, withscores=True)
+            pipe.zrange(self.inflight_key, 0, 0, withscores=True)
+            heads = await pipe.execute()
+        scores = [int(entries[0][1]) for entries in heads if entries]
+        return min(scores) if scores else None
 
     async def remove(self, reminder_id: UUID | str) -> None:
-        await self.redis.zrem(self.queue_key, str(reminder_id))
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(self.queue_key, str(reminder_id))
+            pipe.zrem(self.inflight_key, str(reminder_id))
+            await pipe.execute()
 
     async def claim_due(
         self, now: datetime | None = None, limit: int = 100
     ) -> list[tuple[str, int]]:
-        current = int((now or datetime.now(timezone.utc)).timestamp() * 1000)
-        entries = await self.redis.zrangebyscore(
-            self.queue_key,
-            min=0,
-            max=current,
-            start=0,
-            num=limit,
-            withscores=True,
+        current = self._to_ms(now)
+        entries = await self._claim_script(
+            keys=[self.queue_key, self.inflight_key],
+            args=[current, limit, current + self.lease_ms],
         )
-        claimed: list[tuple[str, int]] = []
-        for raw_id, score in entries:
-            reminder_id = self._ensure_string(raw_id)
-            removed = await self.redis.zrem(self.queue_key, reminder_id)
-            if removed:
-                claimed.append((reminder_id, int(score)))
-        return claimed
+        return [
+            (self._ensure_string(entries[index]), int(float(entries[index + 1])))
+            for index in range(0, len(entries), 2)
+        ]
+
+    async def reschedule_many(self, scores: dict[str, int]) -> None:
+        """Release leases and requeue reminders at the given millisecond scores."""
+        if not scores:
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zadd(self.queue_key, scores)
+            pipe.zrem(self.inflight_key, *scores)
+            await pipe.execute()
+
+    async def ack(self, *reminder_ids: UUID | str) -> None:
+        if reminder_ids:
+            await self.redis.zrem(self.inflight_key, *[str(item) for item in reminder_ids])
+
+    async def requeue_expired(
+        self, now: datetime | None = None, limit: int = 100
+    ) -> int:
+        """Return expired leases to the queue; ``claim_due`` also does this itself."""
+        return int(
+            await self._requeue_script(
+                keys=[self.queue_key, self.inflight_key],
+                args=[self._to_ms(now), limit],
+            )
+        )
+
+    @staticmethod
+    def _to_ms(moment: datetime | None) -> int:
+        return int((moment or datetime.now(timezone.utc)).timestamp() * 1000)
 
     @staticmethod
     def _ensure_string(value: object) -> str:
@@ -103,11 +190,24 @@ class TaskReminderQueue:
         return str(value)
 
 
+# Pops up to ARGV[2] members due before ARGV[1]. KEYS: queue.
+_POP_DUE_LUA = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], 0, ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, member in ipairs(due) do
+    redis.call('ZREM', KEYS[1], member)
+end
+return due
+"""
+
+
 @dataclass
 class DelayedTaskQueue:
     redis: Redis
     queue_key: str
 
+    def __post_init__(self) -> None:
+        self._pop_script = self.redis.register_script(_POP_DUE_LUA)
+
     async def schedule(self, task_id: UUID | str, run_at: datetime) -> None:
         timestamp = int(run_at.astimezone(timezone.utc).timestamp() * 1000)
         await self.redis.zadd(self.queue_key, {str(task_id): timestamp})
@@ -119,19 +219,20 @@ class DelayedTaskQueue:
         self, now: datetime | None = None, limit: int = 100
     ) -> list[str]:
         current = int((now or datetime.now(timezone.utc)).timestamp() * 1000)
-        entries = await self.redis.zrangebyscore(
-            self.queue_key,
-            min=0,
-            max=current,
-            start=0,
-            num=limit,
-        )
-        if entries:
-            await self.redis.zrem(
-                self.queue_key, *[self._ensure_string(entry) for entry in entries]
-            )
+        entries = await self._pop_script(keys=[self.queue_key], args=[current, limit])
         return [self._ensure_string(entry) for entry in entries]
 
+    async def schedule_many(self, task_ids: Iterable[UUID | str], run_at: datetime) -> None:
+        timestamp = int(run_at.astimezone(timezone.utc).timestamp() * 1000)
+        mapping = {str(task_id): timestamp for task_id in task_ids}
+        if mapping:
+            await self.redis.zadd(self.queue_key, mapping)
+
+    async def remove_many(self, task_ids: Iterable[UUID | str]) -> None:
+        members = [str(task_id) for task_id in task_ids]
+        if members:
+            await self.redis.zrem(self.queue_key, *members)
+
     @staticmethod
     def _ensure_string(value: object) -> str:
         if isinstance(value, str):
@@ -1,18 +1,41 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Generic, TypeVar
-from uuid import UUID
-
-from sqlalchemy import delete, func, or_, select, update
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Integer,
+    String,
+    any_,
+    bindparam,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    null,
+    or_,
+    select,
+    true,
+    tuple_,
+    update,
+    values,
+)
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PG_UUID, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, with_loader_criteria
+from sqlalchemy.orm import aliased, selectinload, with_loader_criteria
 
 from crm.domain import schemas
 from crm.infrastructure import models
+from crm.infrastructure.db import AfterCommitAction, run_after_commit
 from crm.domain.schemas import DealFilters, DealStage, map_deal_status_to_stage
 
 DEAL_STAGE_ORDER: tuple[DealStage, ...] = (
@@ -142,6 +165,130 @@ class DealRepository(BaseRepository[models.Deal]):
 
         return stmt
 
+    @classmethod
+    def stage_expression(cls):
+        """SQL counterpart of ``map_deal_status_to_stage`` for stored statuses."""
+        normalized = func.lower(cls.model.status)
+        return case(
+            *(
+                (normalized.in_(statuses), literal(stage))
+                for stage, statuses in STAGE_FILTER_MAP.items()
+            ),
+            else_=literal("qualification"),
+        )
+
+    async def pipeline(
+        self,
+        *,
+        per_stage: int,
+        cursors: dict[DealStage, tuple[date, datetime, UUID]] | None = None,
+        filters: DealFilters | None = None,
+    ) -> list[tuple[DealStage, int, Decimal, models.Deal | None]]:
+        """Stage counts, totals and one keyset page of deals per stage.
+
+        Runs as one statement: a ``VALUES`` list of stages (each carrying its
+        own cursor) joins a grouped count/value subquery and a ``LATERAL``
+        top-N ordered like ``list``. ``per_stage + 1`` deals are fetched so
+        the caller can tell whether another page exists.
+        """
+        cursors = cursors or {}
+        stage = self.stage_expression()
+        base_filters = filters.model_copy(update={"stage": None}) if filters else None
+
+        stages = values(
+            column("stage", String),
+            column("position", Integer),
+            column("cursor_review", Date),
+            column("cursor_updated", DateTime(timezone=True)),
+            column("cursor_id", PG_UUID(as_uuid=True)),
+            name="stages",
+        ).data(
+            [
+                (
+                    name,
+                    position,
+                    *self._typed_cursor(cursors.get(name)),
+                )
+                for position, name in enumerate(DEAL_STAGE_ORDER)
+            ]
+        )
+
+        payment_totals = (
+            select(
+                models.Payment.deal_id,
+                func.sum(models.Payment.planned_amount).label("amount"),
+            )
+            .where(models.Payment.status != "cancelled")
+            .group_by(models.Payment.deal_id)
+            .subquery("payment_totals")
+        )
+        totals_stmt = (
+            select(
+                stage.label("stage"),
+                func.count().label("deals_count"),
+                func.coalesce(func.sum(payment_totals.c.amount), 0).label("total_value"),
+            )
+            .select_from(self.model)
+            .outerjoin(payment_totals, payment_totals.c.deal_id == self.model.id)
+            .where(self.model.is_deleted.is_(False))
+        )
+        if base_filters is not None:
+            totals_stmt = self._apply_filters(totals_stmt, base_filters)
+        totals = totals_stmt.group_by(stage).subquery("stage_totals")
+
+        page_stmt = select(self.model).where(
+            self.model.is_deleted.is_(False),
+            stage == stages.c.stage,
+            or_(
+                stages.c.cursor_id.is_(None),
+                tuple_(self.model.next_review_at, self.model.updated_at, self.model.id)
+                > tuple_(stages.c.cursor_review, stages.c.cursor_updated, stages.c.cursor_id),
+            ),
+        )
+        if base_filters is not None:
+            page_stmt = self._apply_filters(page_stmt, base_filters)
+        page = (
+            page_stmt.order_by(
+                self.model.next_review_at.asc(),
+                self.model.updated_at.asc(),
+                self.model.id.asc(),
+            )
+            .limit(per_stage + 1)
+            .lateral("stage_deals")
+        )
+        deal = aliased(self.model, page)
+
+        stmt = (
+            select(
+                stages.c.stage,
+                func.coalesce(totals.c.deals_count, 0),
+                func.coalesce(totals.c.total_value, 0),
+                deal,
+            )
+            .select_from(stages)
+            .outerjoin(totals, totals.c.stage == stages.c.stage)
+            .outerjoin(deal, true())
+            .order_by(
+                stages.c.position,
+                page.c.next_review_at.asc(),
+                page.c.updated_at.asc(),
+                page.c.id.asc(),
+            )
+        )
+        result = await self.session.execute(stmt)
+        return [
+            (stage_name, int(count), Decimal(str(total_value)), entity)
+            for stage_name, count, total_value, entity in result.all()
+        ]
+
+    @staticmethod
+    def _typed_cursor(cursor: tuple[date, datetime, UUID] | None) -> tuple[Any, Any, Any]:
+        # Typed NULLs keep the VALUES columns comparable with the deal columns.
+        types = (Date(), DateTime(timezone=True), PG_UUID(as_uuid=True))
+        if cursor is None:
+            return tuple(cast(null(), type_) for type_ in types)  # type: ignore[return-value]
+        return tuple(literal(value, type_) for value, type_ in zip(cursor, types))  # type: ignore[return-value]
+
     async def mark_won(self, deal_id: UUID) -> models.Deal | None:
         stmt = (
             update(self.model)
@@ -424,6 +571,136 @@ class TaskRepository:
             raise RepositoryError(self._map_task_integrity_error(exc)) from exc
         return await self.get(task.id)
 
+    async def board(
+        self, *, assignee_id: UUID | None = None, limit: int = 20
+    ) -> list[tuple[models.TaskStatus, int, models.Task | None]]:
+        """Per-status counts and the first ``limit`` tasks of each status by due date.
+
+        One statement: counts come from a ``GROUP BY status_code`` subquery and
+        each status joins a ``LATERAL`` top-N that walks the
+        ``(status_code, due_at)`` index. Statuses without tasks yield a single
+        row with ``None`` instead of a task.
+        """
+        filters = []
+        if assignee_id is not None:
+            filters.append(models.Task.assignee_id == assignee_id)
+
+        counts = (
+            select(models.Task.status_code, func.count().label("total"))
+            .where(*filters)
+            .group_by(models.Task.status_code)
+            .subquery("counts")
+        )
+        top = (
+            select(models.Task)
+            .where(models.Task.status_code == models.TaskStatus.code, *filters)
+            .order_by(models.Task.due_at.asc().nulls_last(), models.Task.created_at.asc())
+            .limit(limit)
+            .lateral("top_tasks")
+        )
+        top_task = aliased(models.Task, top)
+        stmt = (
+            select(models.TaskStatus, func.coalesce(counts.c.total, 0), top_task)
+            .outerjoin(counts, counts.c.status_code == models.TaskStatus.code)
+            .outerjoin(top_task, true())
+            .order_by(
+                models.TaskStatus.code,
+                top.c.due_at.asc().nulls_last(),
+                top.c.created_at.asc(),
+            )
+        )
+        result = await self.session.execute(stmt)
+        return [(status, int(total), task) for status, total, task in result.all()]
+
+    async def get_many(self, task_ids: Sequence[UUID]) -> list[models.Task]:
+        if not task_ids:
+            return []
+        stmt = (
+            select(models.Task)
+            .where(models.Task.id == any_(self._uuid_array("task_ids", task_ids)))
+            .options(selectinload(models.Task.status))
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().unique().all())
+
+    async def bulk_update(
+        self,
+        expected_statuses: Mapping[UUID, str],
+        changes: dict[str, Any],
+        *,
+        payload_patch: dict[str, Any] | None = None,
+    ) -> list[models.Task]:
+        """Apply ``changes`` to tasks still in the status they were read in.
+
+        ``expected_statuses`` maps each task id to the status the caller
+        validated the change against; the UPDATE joins these pairs as a
+        ``VALUES`` list, so a task whose status changed in the meantime is
+        not matched. ``payload_patch`` is merged into the JSONB payload.
+        Returns the updated tasks; ids skipped because of a concurrent change
+        are simply missing from the result.
+        """
+        if not expected_statuses:
+            return []
+        expected = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("status_code", String),
+            name="expected",
+        ).data(list(expected_statuses.items()))
+        changes = dict(changes)
+        if payload_patch:
+            changes["payload"] = func.coalesce(
+                models.Task.payload, func.jsonb_build_object()
+            ).op("||")(bindparam("payload_patch", payload_patch, type_=JSONB))
+        stmt = (
+            update(models.Task)
+            .where(
+                models.Task.id == expected.c.id,
+                models.Task.status_code == expected.c.status_code,
+            )
+            .values(**changes)
+            .returning(models.Task.id)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            result = await self.session.execute(stmt)
+            updated_ids = list(result.scalars().all())
+            await self.session.commit()
+        except IntegrityError as exc:
+            await self.session.rollback()
+            raise RepositoryError(self._map_task_integrity_error(exc)) from exc
+        return await self.get_many(updated_ids)
+
+    async def promote_scheduled(self, task_ids: Sequence[UUID]) -> list[models.Task]:
+        """Move still-scheduled tasks to pending in one statement.
+
+        Tasks that were cancelled or rescheduled by hand in the meantime are
+        not matched, so promoting the same id twice is harmless.
+        """
+        if not task_ids:
+            return []
+        stmt = (
+            update(models.Task)
+            .where(
+                models.Task.id == any_(self._uuid_array("task_ids", task_ids)),
+                models.Task.status_code == schemas.TaskStatusCode.SCHEDULED.value,
+            )
+            .values(
+                status_code=schemas.TaskStatusCode.PENDING.value,
+                scheduled_for=None,
+            )
+            .returning(models.Task)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        promoted = list(result.scalars().all())
+        await self.session.commit()
+        return promoted
+
+    @staticmethod
+    def _uuid_array(name: str, values: Sequence[UUID]):
+        return bindparam(name, list(values), type_=ARRAY(PG_UUID(as_uuid=True)))
+
     @staticmethod
     def _map_task_integrity_error(exc: IntegrityError) -> str:
         message = str(exc.orig)
@@ -462,6 +739,16 @@ class TaskReminderRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_many(self, reminder_ids: Sequence[UUID]) -> list[models.TaskReminder]:
+        if not reminder_ids:
+            return []
+        stmt = select(models.TaskReminder).where(
+            models.TaskReminder.id
+            == any_(bindparam("reminder_ids", list(reminder_ids), type_=ARRAY(PG_UUID(as_uuid=True))))
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def delete(self, reminder_id: UUID) -> bool:
         stmt = (
             delete(models.TaskReminder)
@@ -939,6 +1226,75 @@ class NotificationRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def claim_due(
+        self, limit: int, *, visibility_timeout_ms: int
+    ) -> list[models.Notification]:
+        """Lease up to ``limit`` notifications whose next dispatch attempt is due.
+
+        Leased rows are hidden from other dispatchers until ``locked_until``;
+        if the holder dies, they become due again once the lease expires.
+        """
+        notification = models.Notification
+        now = func.now()
+        due = (
+            select(notification.id)
+            .where(
+                notification.status.in_(
+                    [
+                        schemas.NotificationStatus.PENDING.value,
+                        schemas.NotificationStatus.QUEUED.value,
+                    ]
+                ),
+                notification.next_attempt_at <= now,
+                or_(notification.locked_until.is_(None), notification.locked_until < now),
+            )
+            .order_by(notification.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(notification)
+            .where(notification.id.in_(due.scalar_subquery()))
+            .values(locked_until=now + timedelta(milliseconds=visibility_timeout_ms))
+            .returning(notification.id)
+            .execution_options(synchronize_session=False)
+        )
+        claimed_ids = list(result.scalars().all())
+        await self.session.commit()
+        if not claimed_ids:
+            return []
+        stmt = (
+            select(notification)
+            .where(notification.id.in_(claimed_ids))
+            .options(selectinload(notification.attempts))
+            .order_by(notification.next_attempt_at)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def extend_leases(
+        self, notification_ids: Sequence[UUID], *, visibility_timeout_ms: int
+    ) -> int:
+        """Push ``locked_until`` forward for notifications still being delivered.
+
+        Rows already released by their delivery (``locked_until`` reset) are
+        left alone. Returns the number of extended leases.
+        """
+        if not notification_ids:
+            return 0
+        notification = models.Notification
+        result = await self.session.execute(
+            update(notification)
+            .where(
+                notification.id.in_(list(notification_ids)),
+                notification.locked_until.is_not(None),
+            )
+            .values(locked_until=func.now() + timedelta(milliseconds=visibility_timeout_ms))
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount or 0
+
     async def update(self, notification_id: UUID, data: dict[str, Any]) -> models.Notification | None:
         stmt = (
             update(models.Notification)
@@ -966,6 +1322,40 @@ class NotificationAttemptRepository:
         await self.session.refresh(entity)
         return entity
 
+    async def record(
+        self,
+        notification_id: UUID,
+        attempts: Sequence[dict[str, Any]],
+        notification_values: dict[str, Any],
+    ) -> bool:
+        """Store ``attempts`` and update the notification in one statement.
+
+        The attempts are inserted by a data-modifying CTE of the notification
+        ``UPDATE``, so a dispatch round costs a single round trip and commit.
+        Returns ``False`` when the notification no longer exists.
+        """
+        notification = models.Notification
+        stmt = (
+            update(notification)
+            .where(notification.id == notification_id)
+            .values(**notification_values)
+            .returning(notification.id)
+        )
+        if attempts:
+            inserted = (
+                insert(models.NotificationDeliveryAttempt)
+                .values([{"id": uuid4(), **attempt} for attempt in attempts])
+                .returning(models.NotificationDeliveryAttempt.id)
+                .cte("recorded_attempts")
+            )
+            stmt = stmt.add_cte(inserted)
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            await self.session.rollback()
+            return False
+        await self.session.commit()
+        return True
+
 
 class NotificationEventRepository:
     def __init__(self, session: AsyncSession):
@@ -976,6 +1366,15 @@ class NotificationEventRepository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def existing_event_ids(self, event_ids: Sequence[UUID]) -> set[UUID]:
+        if not event_ids:
+            return set()
+        stmt = select(models.NotificationEvent.event_id).where(
+            models.NotificationEvent.event_id.in_(event_ids)
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
     async def create(self, data: dict[str, Any]) -> models.NotificationEvent:
         entity = models.NotificationEvent(**data)
         self.session.add(entity)
@@ -983,6 +1382,23 @@ class NotificationEventRepository:
         await self.session.refresh(entity)
         return entity
 
+    async def create_if_absent(self, data: dict[str, Any]) -> models.NotificationEvent | None:
+        """Insert the event unless its ``event_id`` is stored already.
+
+        Returns ``None`` for a duplicate. Uses ``ON CONFLICT DO NOTHING`` so
+        concurrent redeliveries of one event cannot both insert it.
+        """
+        stmt = (
+            pg_insert(models.NotificationEvent)
+            .values(id=uuid4(), **data)
+            .on_conflict_do_nothing(index_elements=[models.NotificationEvent.event_id])
+            .returning(models.NotificationEvent)
+        )
+        result = await self.session.execute(stmt)
+        entity = result.scalar_one_or_none()
+        await self.session.commit()
+        return entity
+
     async def update(self, event_id: UUID, data: dict[str, Any]) -> models.NotificationEvent | None:
         stmt = (
             update(models.NotificationEvent)
@@ -1015,3 +1431,109 @@ class NotificationEventRepository:
         )
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
+
+
+class OutboxRepository:
+    """Events written next to the domain change and relayed to RabbitMQ later.
+
+    ``on_added`` (the relay's wake-up) runs once the transaction that wrote
+    the rows has committed.
+    """
+
+    def __init__(self, session: AsyncSession, *, on_added: AfterCommitAction | None = None):
+        self.session = session
+        self.on_added = on_added
+
+    async def add_many(self, messages: Sequence[dict[str, Any]]) -> None:
+        if not messages:
+            return
+        self.session.add_all([models.OutboxMessage(**message) for message in messages])
+        await self.session.commit()
+        if self.on_added is not None:
+            await run_after_commit(self.session, self.on_added)
+
+    async def claim_batch(self, limit: int) -> list[models.OutboxMessage]:
+        """Lock up to ``limit`` due messages, oldest first.
+
+        Rows locked by another relay are skipped, so several relays can drain
+        the table concurrently. The locks are held until ``complete_batch``.
+        """
+        stmt = (
+            select(models.OutboxMessage)
+            .where(
+                models.OutboxMessage.sent_at.is_(None),
+                models.OutboxMessage.available_at <= func.now(),
+            )
+            .order_by(models.OutboxMessage.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def complete_batch(
+        self,
+        sent_ids: Sequence[UUID],
+        failed: dict[UUID, str],
+        *,
+        retry_at: datetime,
+    ) -> None:
+        """Mark a claimed batch as sent or postponed and release its locks."""
+        if sent_ids:
+            await self.session.execute(
+                update(models.OutboxMessage)
+                .where(models.OutboxMessage.id == any_(self._uuid_array("sent_ids", sent_ids)))
+                .values(
+                    sent_at=func.now(),
+                    attempts=models.OutboxMessage.attempts + 1,
+                    last_error=None,
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+        by_error: dict[str, list[UUID]] = {}
+        for message_id, error in failed.items():
+            by_error.setdefault(error, []).append(message_id)
+        for error, message_ids in by_error.items():
+            await self.session.execute(
+                update(models.OutboxMessage)
+                .where(
+                    models.OutboxMessage.id == any_(self._uuid_array("failed_ids", message_ids))
+                )
+                .values(
+                    available_at=retry_at,
+                    attempts=models.OutboxMessage.attempts + 1,
+                    last_error=error,
+                )
+                .execution_options(synchronize_session=False)
+            )
+        await self.session.commit()
+
+    async def delete_sent_before(self, cutoff: datetime, limit: int) -> int:
+        """Delete up to ``limit`` messages sent before ``cutoff``; returns the count."""
+        expired = (
+            select(models.OutboxMessage.id)
+            .where(models.OutboxMessage.sent_at < cutoff)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            delete(models.OutboxMessage)
+            .where(models.OutboxMessage.id.in_(expired.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount or 0
+
+    async def pending_stats(self) -> tuple[int, datetime | None]:
+        """Number of unsent messages and the creation time of the oldest one."""
+        stmt = select(func.count(), func.min(models.OutboxMessage.created_at)).where(
+            models.OutboxMessage.sent_at.is_(None)
+        )
+        result = await self.session.execute(stmt)
+        count, oldest = result.one()
+        return int(count or 0), oldest
+
+    @staticmethod
+    def _uuid_array(name: str, values: Sequence[UUID]):
+        return bindparam(name, list(values), type_=ARRAY(PG_UUID(as_uuid=True)))
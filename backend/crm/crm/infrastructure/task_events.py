@@ -8,22 +8,21 @@ from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
-import aio_pika
-from aio_pika import ExchangeType, Message
-from aio_pika.abc import AbstractChannel, AbstractExchange, AbstractRobustConnection
+from aio_pika import Message
 
 from crm.app.config import Settings
 from crm.domain import schemas
 from crm.infrastructure import models
+from crm.infrastructure.amqp import AmqpConnectionManager
 
 
 class TaskEventsPublisher:
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self, settings: Settings, connections: AmqpConnectionManager | None = None
+    ) -> None:
         self._settings = settings
-        self._connection: AbstractRobustConnection | None = None
-        self._channel: AbstractChannel | None = None
-        self._exchange: AbstractExchange | None = None
-        self._lock = asyncio.Lock()
+        self._owns_connections = connections is None
+        self._connections = connections or AmqpConnectionManager.from_settings(settings)
         self._logger = logging.getLogger(self.__class__.__name__)
 
     @property
@@ -31,29 +30,11 @@ class TaskEventsPublisher:
         return self._settings.tasks_events_routing_keys
 
     async def connect(self) -> None:
-        if self._exchange is not None:
-            return
-        async with self._lock:
-            if self._exchange is not None:
-                return
-            self._connection = await aio_pika.connect_robust(str(self._settings.rabbitmq_url))
-            self._channel = await self._connection.channel(publisher_confirms=True)
-            self._exchange = await self._channel.declare_exchange(
-                self._settings.tasks_events_exchange, ExchangeType.TOPIC, durable=True
-            )
+        await self._connections.exchange(self._settings.tasks_events_exchange)
 
     async def close(self) -> None:
-        async with self._lock:
-            exchange = self._exchange
-            channel = self._channel
-            connection = self._connection
-            self._exchange = None
-            self._channel = None
-            self._connection = None
-        if channel is not None:
-            await channel.close()
-        if connection is not None:
-            await connection.close()
+        if self._owns_connections:
+            await self._connections.close()
 
     async def task_created(self, task: models.Task) -> None:
         await self._publish(
@@ -73,7 +54,25 @@ class TaskEventsPublisher:
             self._map_task_status_changed(task, previous_status),
         )
 
+    async def tasks_status_changed(
+        self, tasks: list[models.Task], previous_status: schemas.TaskStatusCode
+    ) -> None:
+        """Publish status changes of many tasks, awaiting their confirms together."""
+        routing_key = self._routing_keys.get("task_status_changed", "task.status.changed")
+        await asyncio.gather(
+            *(
+                self._publish(
+                    routing_key,
+                    "tasks.task.status_changed",
+                    self._map_task_status_changed(task, previous_status),
+                )
+                for task in tasks
+                if previous_status.value != task.status_code
+            )
+        )
+
     async def task_reminder(self, reminder: models.TaskReminder) -> None:
+        """Publish a reminder; unlike other events a failure is raised so it can be retried."""
         await self._publish(
             self._routing_keys.get("task_reminder", "task.reminder"),
             "tasks.task.reminder",
@@ -82,21 +81,30 @@ class TaskEventsPublisher:
                 "remind_at": reminder.remind_at.astimezone(timezone.utc).isoformat(),
                 "channel": reminder.channel,
             },
+            suppress_errors=False,
         )
 
-    async def _publish(self, routing_key: str, event_type: str, data: dict[str, Any]) -> None:
+    async def _publish(
+        self,
+        routing_key: str,
+        event_type: str,
+        data: dict[str, Any],
+        *,
+        suppress_errors: bool = True,
+    ) -> None:
         try:
-            await self.connect()
-            assert self._exchange is not None
+            exchange = await self._connections.exchange(self._settings.tasks_events_exchange)
             event = self._create_event(event_type, data)
             message = Message(
                 body=json.dumps(event, ensure_ascii=False, default=str).encode("utf-8"),
                 content_type="application/cloudevents+json",
                 headers={"ce-specversion": "1.0"},
             )
-            await self._exchange.publish(message, routing_key=routing_key)
+            await exchange.publish(message, routing_key=routing_key)
         except Exception as exc:  # noqa: BLE001
             self._logger.warning("Failed to publish %s: %s", event_type, exc)
+            if not suppress_errors:
+                raise
 
     def _create_event(self, event_type: str, data: dict[str, Any]) -> dict[str, Any]:
         return {
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from crm.app.config import Settings
+
+if TYPE_CHECKING:  # pragma: no cover - httpx is an optional dependency
+    import httpx
+
+
+logger = logging.getLogger(__name__)
+
+# Longest per-chat Bot API limit (20 messages a minute in groups): a 429 for a
+# chat that got nothing else within this window cannot come from a chat limit.
+_CHAT_LIMIT_WINDOW_S = 60.0
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = max(rate, 0.001)
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token; returns 0 on success or the seconds to wait for one."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    @property
+    def full(self) -> bool:
+        elapsed = time.monotonic() - self._updated
+        return self.tokens + elapsed * self.rate >= self.capacity
+
+
+@dataclass
+class _ChatState:
+    bucket: TokenBucket
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    paused_until: float = 0.0
+    sent_at: float = float("-inf")
+    previous_sent_at: float = float("-inf")
+
+
+class TelegramRateLimiter:
+    """Keeps outgoing messages within the Bot API flood limits.
+
+    A message first waits for its chat's bucket (``chat_rate`` per second),
+    then for the bot-wide bucket (``global_rate`` per second). Both waits go
+    through FIFO locks, so concurrent senders form a queue instead of racing
+    for tokens, and a busy chat never holds up the global queue. ``pause``
+    honours ``retry_after`` of a 429 response for the affected chat.
+
+    A 429 is treated as bot-wide, and pauses every chat, when it cannot
+    come from a chat limit (the chat got no other message within a minute)
+    or when ``global_pause_chats`` different chats are rate limited within
+    ``global_pause_window`` seconds.
+    """
+
+    def __init__(
+        self,
+        global_rate: float,
+        chat_rate: float,
+        *,
+        global_burst: float | None = None,
+        chat_burst: float = 1.0,
+        max_chats: int = 10_000,
+        global_pause_chats: int = 3,
+        global_pause_window: float = 1.0,
+    ) -> None:
+        self._global = TokenBucket(global_rate, global_burst or global_rate)
+        self._global_lock = asyncio.Lock()
+        self._global_paused_until = 0.0
+        self._global_pause_chats = max(global_pause_chats, 1)
+        self._global_pause_window = global_pause_window
+        self._recent_limits: deque[tuple[float, str]] = deque()
+        self._chat_rate = chat_rate
+        self._chat_burst = chat_burst
+        self._max_chats = max_chats
+        self._chats: dict[str, _ChatState] = {}
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "TelegramRateLimiter":
+        return cls(
+            settings.notifications_telegram_rate_limit_per_second,
+            settings.notifications_telegram_chat_rate_limit_per_second,
+            global_pause_chats=settings.notifications_telegram_global_pause_chats,
+            global_pause_window=settings.notifications_telegram_global_pause_window_s,
+        )
+
+    async def acquire(self, chat_id: str) -> None:
+        chat = self._chat(chat_id)
+        async with chat.lock:
+            while True:
+                delay = max(chat.paused_until - time.monotonic(), 0.0) or chat.bucket.take()
+                if not delay:
+                    break
+                await asyncio.sleep(delay)
+            async with self._global_lock:
+                while delay := (
+                    max(self._global_paused_until - time.monotonic(), 0.0) or self._global.take()
+                ):
+                    await asyncio.sleep(delay)
+            chat.previous_sent_at, chat.sent_at = chat.sent_at, time.monotonic()
+
+    def pause(self, chat_id: str, seconds: float) -> None:
+        now = time.monotonic()
+        chat = self._chat(chat_id)
+        chat.paused_until = max(chat.paused_until, now + seconds)
+
+        recent = self._recent_limits
+        recent.append((now, chat_id))
+        while recent[0][0] < now - self._global_pause_window:
+            recent.popleft()
+        chat_scoped = now - chat.previous_sent_at < _CHAT_LIMIT_WINDOW_S
+        limited_chats = len({limited for _, limited in recent})
+        if chat_scoped and limited_chats < self._global_pause_chats:
+            return
+        if self._global_paused_until < now + seconds:
+            logger.warning(
+                "Telegram bot-wide rate limit (%d chats limited), pausing all chats for %.0f s",
+                limited_chats,
+                seconds,
+            )
+            self._global_paused_until = now + seconds
+
+    def _chat(self, chat_id: str) -> _ChatState:
+        chat = self._chats.get(chat_id)
+        if chat is None:
+            if len(self._chats) >= self._max_chats:
+                self._prune()
+            chat = _ChatState(TokenBucket(self._chat_rate, self._chat_burst))
+            self._chats[chat_id] = chat
+        return chat
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        idle = [
+            chat_id
+            for chat_id, chat in self._chats.items()
+            if not chat.lock.locked() and chat.bucket.full and chat.paused_until <= now
+        ]
+        for chat_id in idle:
+            del self._chats[chat_id]
+
+
+class TelegramBotClient:
+    """Sends Bot API messages over one pooled HTTP client.
+
+    ``api_base`` may point to a local stand-in of the Bot API (load tests,
+    local setup; see ``scripts/telegram_stand_in.py``). A 429 response
+    pauses the chat, or the whole bot (see ``TelegramRateLimiter``), for
+    ``retry_after`` seconds and the message is retried up to ``max_retries`` times as long as the
+    requested pause does not exceed ``max_retry_after`` seconds.
+    """
+
+    def __init__(
+        self,
+        bot_token: str,
+        *,
+        api_base: str = "https://api.telegram.org",
+        limiter: TelegramRateLimiter | None = None,
+        max_connections: int = 20,
+        timeout: float = 10.0,
+        max_retries: int = 3,
+        max_retry_after: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._bot_token = bot_token
+        self._api_base = api_base.rstrip("/")
+        self._limiter = limiter or TelegramRateLimiter(30, 1)
+        self._max_connections = max(max_connections, 1)
+        self._timeout = timeout
+        self._max_retries = max(max_retries, 0)
+        self._max_retry_after = max_retry_after
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "TelegramBotClient":
+        return cls(
+            settings.notifications_telegram_bot_token or "",
+            api_base=settings.notifications_telegram_api_base,
+            limiter=TelegramRateLimiter.from_settings(settings),
+            max_connections=settings.notifications_telegram_max_connections,
+            max_retries=settings.notifications_telegram_max_retries,
+            max_retry_after=settings.notifications_telegram_max_retry_after_s,
+        )
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                base_url=self._api_base,
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def send_message(self, chat_id: str, text: str) -> dict[str, Any]:
+        path = f"/bot{self._bot_token}/sendMessage"
+        payload = {"chat_id": chat_id, "text": text}
+        attempt = 0
+        while True:
+            await self._limiter.acquire(chat_id)
+            try:
+                response = await self._http().post(path, json=payload)
+            except Exception:  # noqa: BLE001
+                logger.warning("Telegram request for chat %s failed", chat_id, exc_info=True)
+                return {"accepted": False, "error": "telegram_request_failed", "messageId": None}
+            if response.status_code == 429:
+                retry_after = self._retry_after(response)
+                self._limiter.pause(chat_id, retry_after)
+                if attempt < self._max_retries and retry_after <= self._max_retry_after:
+                    attempt += 1
+                    logger.info(
+                        "Telegram rate limit for chat %s, retrying in %.0f s", chat_id, retry_after
+                    )
+                    continue
+                return {
+                    "accepted": False,
+                    "error": "telegram_http_429",
+                    "messageId": None,
+                    "retryAfter": retry_after,
+                }
+            if response.status_code >= 400:
+                return {
+                    "accepted": False,
+                    "error": f"telegram_http_{response.status_code}",
+                    "messageId": None,
+                }
+            try:
+                data = response.json()
+            except ValueError:
+                data = {}
+            if not data.get("ok", False):
+                return {
+                    "accepted": False,
+                    "error": "telegram_response_not_ok",
+                    "messageId": None,
+                }
+            message_id = data.get("result", {}).get("message_id")
+            return {
+                "accepted": True,
+                "messageId": str(message_id) if message_id is not None else None,
+                "error": None,
+            }
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> float:
+        try:
+            retry_after = response.json().get("parameters", {}).get("retry_after")
+        except (ValueError, AttributeError):
+            retry_after = None
+        if retry_after is None:
+            retry_after = response.headers.get("Retry-After")
+        try:
+            return max(float(retry_after), 0.0)
+        except (TypeError, ValueError):
+            return 1.0
+
+    async def close(self) -> None:
+        client = self._client
+        self._client = None
+        if client is not None:
+            await client.aclose()
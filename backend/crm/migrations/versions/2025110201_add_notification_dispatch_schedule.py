@@ -0,0 +1,48 @@
+"""Schedule notification dispatch in the background"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "2025110201_add_notification_dispatch_schedule"
+down_revision = "2025110101_add_outbox"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "notifications",
+        sa.Column(
+            "next_attempt_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            server_default=sa.text("timezone('utc', now())"),
+        ),
+        schema="crm",
+    )
+    op.add_column(
+        "notifications",
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=True),
+        schema="crm",
+    )
+    # Notifications dispatched inline before this revision are already final.
+    op.execute(
+        "UPDATE crm.notifications SET next_attempt_at = NULL "
+        "WHERE status NOT IN ('pending', 'queued')"
+    )
+    op.create_index(
+        "ix_notifications_due",
+        "notifications",
+        ["next_attempt_at"],
+        schema="crm",
+        postgresql_where=sa.text("status IN ('pending', 'queued')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_notifications_due", table_name="notifications", schema="crm")
+    op.drop_column("notifications", "locked_until", schema="crm")
+    op.drop_column("notifications", "next_attempt_at", schema="crm")
@@ -0,0 +1,26 @@
+"""Index sent outbox messages for retention cleanup"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "2025110301_add_outbox_sent_index"
+down_revision = "2025110201_add_notification_dispatch_schedule"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_outbox_sent",
+        "outbox",
+        ["sent_at"],
+        schema="crm",
+        postgresql_where=sa.text("sent_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_sent", table_name="outbox", schema="crm")
@@ -0,0 +1,178 @@
+"""Local stand-in of the Telegram Bot API for load tests of notification delivery.
+
+The stand-in accepts ``sendMessage`` and enforces the Bot API flood limits the
+way Telegram reports them: a message over the per-bot or per-chat limit gets
+``429`` with ``parameters.retry_after``.
+
+Run it on its own and point ``CRM_NOTIFICATIONS_TELEGRAM_API_BASE`` at it::
+
+    poetry run python scripts/telegram_stand_in.py serve --port 8081
+
+or send a burst through ``TelegramBotClient`` against an in-process stand-in::
+
+    poetry run python scripts/telegram_stand_in.py load --messages 150 --chats 50
+    poetry run python scripts/telegram_stand_in.py load --messages 150 --chats 50 --no-limiter
+
+Run from ``backend/crm``; importing the client reads the usual ``CRM_*``
+settings, so the ``.env`` of the local setup has to be in place.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import time
+from collections import deque
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from crm.infrastructure.telegram import TelegramBotClient, TelegramRateLimiter
+
+
+class StandInBotApi:
+    """Flood-limit bookkeeping of the stand-in: ``global_rate`` per second per bot,
+    one message per ``1 / chat_rate`` seconds per chat."""
+
+    def __init__(self, global_rate: float, chat_rate: float) -> None:
+        self.global_rate = global_rate
+        self.chat_interval = 1 / chat_rate
+        self.accepted = 0
+        self.rejected = 0
+        self._sent: deque[float] = deque()
+        self._chat_sent: dict[str, float] = {}
+
+    def send(self, chat_id: str) -> float:
+        """Register a message; returns 0 if accepted or the ``retry_after`` to report."""
+        now = time.monotonic()
+        while self._sent and self._sent[0] <= now - 1:
+            self._sent.popleft()
+        wait = 0.0
+        if len(self._sent) >= self.global_rate:
+            wait = self._sent[0] + 1 - now
+        last = self._chat_sent.get(chat_id)
+        if last is not None and now - last < self.chat_interval:
+            wait = max(wait, last + self.chat_interval - now)
+        if wait > 0:
+            self.rejected += 1
+            # Telegram reports whole seconds.
+            return float(max(math.ceil(wait), 1))
+        self._sent.append(now)
+        self._chat_sent[chat_id] = now
+        self.accepted += 1
+        return 0.0
+
+
+def create_app(api: StandInBotApi) -> FastAPI:
+    app = FastAPI(title="Telegram Bot API stand-in")
+
+    @app.post("/bot{token}/sendMessage")
+    async def send_message(token: str, request: Request) -> JSONResponse:
+        payload = await request.json()
+        chat_id = str(payload.get("chat_id", ""))
+        retry_after = api.send(chat_id)
+        if retry_after:
+            return JSONResponse(
+                {
+                    "ok": False,
+                    "error_code": 429,
+                    "description": f"Too Many Requests: retry after {retry_after:.0f}",
+                    "parameters": {"retry_after": retry_after},
+                },
+                status_code=429,
+                headers={"Retry-After": f"{retry_after:.0f}"},
+            )
+        return JSONResponse(
+            {
+                "ok": True,
+                "result": {
+                    "message_id": api.accepted,
+                    "chat": {"id": chat_id},
+                    "text": payload.get("text", ""),
+                },
+            }
+        )
+
+    return app
+
+
+async def _start(api: StandInBotApi, host: str, port: int) -> tuple[uvicorn.Server, asyncio.Task[None]]:
+    server = uvicorn.Server(uvicorn.Config(create_app(api), host=host, port=port, log_level="warning"))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            await task
+            raise RuntimeError("stand-in Bot API did not start")
+        await asyncio.sleep(0.05)
+    return server, task
+
+
+async def run_load(args: argparse.Namespace) -> None:
+    api = StandInBotApi(args.global_rate, args.chat_rate)
+    server, task = await _start(api, args.host, args.port)
+    if args.no_limiter:
+        # Flow control off, no retries: how sends behaved before the rate limiter.
+        limiter = TelegramRateLimiter(1_000_000, 1_000_000, chat_burst=1_000_000)
+        max_retries = 0
+    else:
+        limiter = TelegramRateLimiter(args.global_rate, args.chat_rate)
+        max_retries = args.max_retries
+    client = TelegramBotClient(
+        "stand-in-token",
+        api_base=f"http://{args.host}:{args.port}",
+        limiter=limiter,
+        max_retries=max_retries,
+        max_retry_after=args.max_retry_after,
+    )
+    try:
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                client.send_message(f"chat-{index % args.chats}", f"message {index}")
+                for index in range(args.messages)
+            )
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.close()
+        server.should_exit = True
+        await task
+
+    accepted = sum(1 for result in results if result["accepted"])
+    print(
+        f"{accepted}/{args.messages} accepted to {args.chats} chats in {elapsed:.1f} s; "
+        f"stand-in answered 429 {api.rejected} times"
+    )
+
+
+async def run_server(args: argparse.Namespace) -> None:
+    api = StandInBotApi(args.global_rate, args.chat_rate)
+    server = uvicorn.Server(
+        uvicorn.Config(create_app(api), host=args.host, port=args.port, log_level="info")
+    )
+    await server.serve()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--global-rate", type=float, default=30.0, help="messages per second per bot")
+    parser.add_argument("--chat-rate", type=float, default=1.0, help="messages per second per chat")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="run the stand-in until interrupted")
+    load = commands.add_parser("load", help="send a burst through TelegramBotClient")
+    load.add_argument("--messages", type=int, default=150)
+    load.add_argument("--chats", type=int, default=50)
+    load.add_argument("--max-retries", type=int, default=3)
+    load.add_argument("--max-retry-after", type=float, default=30.0)
+    load.add_argument("--no-limiter", action="store_true", help="send without flow control or retries")
+    args = parser.parse_args()
+
+    asyncio.run(run_load(args) if args.command == "load" else run_server(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from crm.app.events_stream import (
+    SLOW_CONSUMER_DISCONNECT,
+    EventStreamHub,
+    EventSubscription,
+    compile_topic_pattern,
+)
+
+
+def _hub(**kwargs) -> EventStreamHub:
+    settings = SimpleNamespace(events_exchange="crm.events")
+    return EventStreamHub(settings, MagicMock(), **kwargs)  # type: ignore[arg-type]
+
+
+def _register(hub: EventStreamHub, *patterns: str) -> EventSubscription:
+    # Bypass ``subscribe`` so no broker consumer is started.
+    subscription = EventSubscription(patterns, hub.subscriber_queue_size)
+    hub._subscribers.add(subscription)
+    return subscription
+
+
+@pytest.mark.parametrize(
+    ("pattern", "key", "expected"),
+    [
+        ("#", "deal.updated", True),
+        ("deal.#", "deal", True),
+        ("deal.#", "deal.payment.income.created", True),
+        ("deal.*", "deal.payment.updated", False),
+        ("deal.*.updated", "deal.payment.updated", True),
+        ("#.updated", "deal.payment.updated", True),
+        ("task.*", "deal.updated", False),
+    ],
+)
+def test_topic_patterns(pattern: str, key: str, expected: bool) -> None:
+    assert bool(compile_topic_pattern(pattern).fullmatch("." + key)) is expected
+
+
+def test_invalid_topic_pattern_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        compile_topic_pattern("deal..updated")
+
+
+@pytest.mark.asyncio
+async def test_dispatch_filters_and_drops_oldest_for_slow_subscribers() -> None:
+    hub = _hub(subscriber_queue_size=2)
+    deals = _register(hub, "deal.#")
+    tasks = _register(hub, "task.*")
+
+    for index in range(3):
+        hub.dispatch("deal.updated", {"event": "deal.updated", "data": str(index)})
+
+    assert [(await deals.get(timeout=0))["data"] for _ in range(2)] == ["1", "2"]
+    assert deals.dropped == 1
+    assert tasks._queue.empty()
+    assert hub.stats.received == 3
+    assert hub.stats.delivered == 2
+    assert hub.stats.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatch_disconnects_slow_subscribers() -> None:
+    hub = _hub(subscriber_queue_size=1, slow_consumer_policy=SLOW_CONSUMER_DISCONNECT)
+    slow = _register(hub, "#")
+
+    hub.dispatch("deal.updated", {"event": "deal.updated", "data": "1"})
+    hub.dispatch("deal.updated", {"event": "deal.updated", "data": "2"})
+
+    assert await slow.get(timeout=0) is None
+    assert hub.subscribers == 0
+    assert hub.stats.disconnected == 1
+
+
+class _Message:
+    def __init__(self, routing_key: str, body: dict) -> None:
+        self.routing_key = routing_key
+        self.body = json.dumps(body).encode("utf-8")
+        self.headers: dict = {}
+        self.message_id = None
+
+    @asynccontextmanager
+    async def process(self, ignore_processed: bool = False):  # noqa: FBT001, FBT002
+        yield
+
+
+class _Queue:
+    def __init__(self, messages: list[_Message]) -> None:
+        self.bind = AsyncMock()
+        self._messages = messages
+
+    @asynccontextmanager
+    async def iterator(self):
+        async def _iterate():
+            for message in self._messages:
+                yield message
+
+        yield _iterate()
+
+
+@pytest.mark.asyncio
+async def test_consumer_binds_task_events_exchange() -> None:
+    task_event = {"type": "tasks.task.created", "data": {"task_id": "1"}}
+    queue = _Queue([_Message("task.created", task_event)])
+    channel = SimpleNamespace(declare_queue=AsyncMock(return_value=queue))
+
+    @asynccontextmanager
+    async def open_channel(prefetch_count: int):
+        yield channel
+
+    connections = MagicMock()
+    connections.exchange = AsyncMock(side_effect=lambda name: name)
+    connections.channel = open_channel
+    hub = EventStreamHub(
+        SimpleNamespace(events_exchange="crm.events", tasks_events_exchange="tasks.events"),
+        connections,
+    )
+    subscription = _register(hub, "task.#")
+
+    await hub._consume_loop()
+
+    assert [call.args[0] for call in queue.bind.await_args_list] == ["crm.events", "tasks.events"]
+    payload = await subscription.get(timeout=0)
+    assert payload["event"] == "task.created"
+    assert json.loads(payload["data"]) == task_event
@@ -5,8 +5,11 @@ from unittest.mock import AsyncMock
 
 import pytest
 from fastapi import FastAPI
+from httpx import AsyncClient
 
 from crm.app import main
+from crm.app.dependencies import get_events_stream_hub
+from crm.app.events_stream import EventStreamHub, EventStreamStats
 
 
 @pytest.mark.asyncio()
@@ -55,3 +58,26 @@ async def test_lifespan_handles_connection_failure(monkeypatch: pytest.MonkeyPat
     # close should not be awaited because connect failed
     assert state["events_publisher"] is None
     close_permissions_queue.assert_awaited_once()
+
+
+@pytest.mark.asyncio()
+async def test_healthcheck_reports_events_stream_counters() -> None:
+    app = main.create_app()
+    hub = EventStreamHub(SimpleNamespace(), AsyncMock())  # type: ignore[arg-type]
+    hub.stats = EventStreamStats(received=10, delivered=7, dropped=2, disconnected=1)
+    app.dependency_overrides[get_events_stream_hub] = lambda: hub
+
+    async with AsyncClient(app=app, base_url="http://testserver") as client:
+        response = await client.get("/healthz")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "status": "ok",
+        "events_stream": {
+            "subscribers": 0,
+            "received": 10,
+            "delivered": 7,
+            "dropped": 2,
+            "disconnected": 1,
+        },
+    }
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from crm.app import notification_delivery
+from crm.app.notification_delivery import NotificationDeliveryScheduler
+from crm.domain import schemas
+
+
+def _settings(**overrides):
+    values = {
+        "notifications_dispatch_batch_size": 10,
+        "notifications_dispatch_poll_interval_ms": 1000,
+        "notifications_dispatch_visibility_timeout_ms": 180_000,
+        "notifications_dispatch_channel_concurrency": {},
+        "notifications_telegram_chat_rate_limit_per_second": 1.0,
+        "notifications_telegram_max_retries": 3,
+        "notifications_telegram_max_retry_after_s": 30.0,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _scheduler(settings) -> NotificationDeliveryScheduler:
+    return NotificationDeliveryScheduler(settings, MagicMock(), MagicMock(), MagicMock())
+
+
+def test_lease_outlasts_throttled_telegram_batch():
+    # 10 messages to one chat at 1/s plus 3 pauses of 30 s and 10 s of slack.
+    scheduler = _scheduler(_settings(notifications_dispatch_visibility_timeout_ms=60_000))
+
+    assert scheduler._lease_ms == 110_000
+    assert _scheduler(_settings())._lease_ms == 180_000
+
+
+@pytest.mark.asyncio
+async def test_leases_are_extended_while_delivery_is_in_progress(monkeypatch):
+    slow, fast = SimpleNamespace(id=uuid4()), SimpleNamespace(id=uuid4())
+    repository = MagicMock()
+    repository.claim_due = AsyncMock(return_value=[slow, fast])
+    repository.extend_leases = AsyncMock(return_value=1)
+
+    @asynccontextmanager
+    async def session_factory():
+        yield MagicMock()
+
+    monkeypatch.setattr(notification_delivery, "AsyncSessionFactory", session_factory)
+    monkeypatch.setattr(
+        notification_delivery.repositories,
+        "NotificationRepository",
+        lambda session: repository,
+    )
+    scheduler = _scheduler(_settings())
+    # Shorten the lease so the heartbeat runs during the test.
+    scheduler._lease_ms = 90
+
+    async def deliver(entity):
+        await asyncio.sleep(0.2 if entity is slow else 0)
+        return schemas.NotificationStatus.PROCESSED
+
+    monkeypatch.setattr(scheduler, "_deliver", deliver)
+
+    stats = await scheduler.process_due()
+
+    assert stats.processed == 2
+    assert repository.extend_leases.await_count >= 2
+    for call in repository.extend_leases.await_args_list:
+        assert call.args[0] == [slow.id]
+        assert call.kwargs == {"visibility_timeout_ms": 90}
+    extended = repository.extend_leases.await_count
+    await asyncio.sleep(0.1)
+    assert repository.extend_leases.await_count == extended
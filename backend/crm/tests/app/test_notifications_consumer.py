@@ -0,0 +1,200 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from crm.app import notifications_consumer
+from crm.app.notifications_consumer import NotificationQueueConsumer
+
+
+def _settings(**overrides):
+    values = dict(
+        notifications_consumer_prefetch=50,
+        notifications_consumer_workers=4,
+        notifications_consumer_batch_size=10,
+        notifications_consumer_batch_wait_ms=0,
+        notifications_consumer_max_attempts=3,
+        notifications_queue_name="notifications.events",
+        notifications_dlq_name="notifications.events.dlq",
+        notifications_seen_events_cache_size=100,
+        notifications_dispatch_exchange="notifications.exchange",
+        notifications_queue_routing_key="notifications.*",
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _message(body: object, headers: dict | None = None) -> MagicMock:
+    raw = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+    return MagicMock(
+        body=raw,
+        headers=headers or {},
+        redelivered=False,
+        routing_key="notifications.event",
+        content_type="application/json",
+        ack=AsyncMock(),
+        nack=AsyncMock(),
+    )
+
+
+def _event(chat_id: str, event_id=None) -> dict:
+    return {
+        "id": str(event_id or uuid4()),
+        "source": "crm",
+        "type": "deal.created",
+        "time": datetime.now(timezone.utc).isoformat(),
+        "data": {},
+        "chat_id": chat_id,
+    }
+
+
+class _SessionCM:
+    async def __aenter__(self):
+        return object()
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def consumer(monkeypatch: pytest.MonkeyPatch):
+    known = uuid4()
+    monkeypatch.setattr(notifications_consumer, "AsyncSessionFactory", _SessionCM)
+    monkeypatch.setattr(
+        notifications_consumer.repositories,
+        "NotificationEventRepository",
+        lambda session: SimpleNamespace(
+            existing_event_ids=AsyncMock(side_effect=lambda ids: {i for i in ids if i == known})
+        ),
+    )
+    publish_channel = SimpleNamespace(default_exchange=SimpleNamespace(publish=AsyncMock()))
+    connections = SimpleNamespace(publish_channel=AsyncMock(return_value=publish_channel))
+    instance = NotificationQueueConsumer(_settings(), MagicMock(), MagicMock(), connections)
+    instance.known_event_id = known
+    instance.dead_letters = publish_channel.default_exchange.publish
+    return instance
+
+
+@pytest.mark.asyncio
+async def test_dispatch_orders_by_chat_and_filters_duplicates(consumer):
+    lanes = [asyncio.Queue() for _ in range(consumer.workers)]
+    repeated = uuid4()
+    recently_handled = uuid4()
+    consumer._seen_events.add(recently_handled)
+    batch = [
+        _message(_event("chat-1")),
+        _message(_event("chat-2", repeated)),
+        _message(_event("chat-1")),
+        _message(_event("chat-2", repeated)),  # same id within the batch
+        _message(_event("chat-3", consumer.known_event_id)),  # already stored
+        _message({"notificationId": "dispatch job"}),  # not an event
+        _message(_event("chat-4", recently_handled)),  # redelivery, known in memory
+    ]
+
+    await consumer._dispatch(batch, lanes)
+
+    queued = {
+        index: [dto.chat_id for _, dto in lane._queue] for index, lane in enumerate(lanes)
+    }
+    chat_1_lanes = [index for index, chats in queued.items() if "chat-1" in chats]
+    assert len(chat_1_lanes) == 1
+    assert queued[chat_1_lanes[0]].count("chat-1") == 2
+    assert sum(len(chats) for chats in queued.values()) == 3
+    for duplicate in (batch[3], batch[4], batch[5], batch[6]):
+        duplicate.ack.assert_awaited_once()
+    assert consumer.stats.duplicates == 3
+    assert consumer.stats.skipped == 1
+
+
+@pytest.mark.asyncio
+async def test_poison_messages_go_to_dead_letter_queue(consumer):
+    lanes = [asyncio.Queue() for _ in range(consumer.workers)]
+    poison = _message(b"{not json")
+    invalid = _message({"id": "nope", "source": "crm", "type": "x", "time": "x", "data": {}})
+
+    await consumer._dispatch([poison, invalid], lanes)
+
+    assert consumer.dead_letters.await_count == 2
+    routing_keys = {call.kwargs["routing_key"] for call in consumer.dead_letters.await_args_list}
+    assert routing_keys == {"notifications.events.dlq"}
+    poison.ack.assert_awaited_once()
+    invalid.ack.assert_awaited_once()
+    assert consumer.stats.dead_lettered == 2
+
+
+@pytest.mark.asyncio
+async def test_handler_records_metrics(consumer, monkeypatch):
+    message = _message(_event("chat-1"))
+    dto = notifications_consumer.schemas.NotificationEventIngest.model_validate(
+        json.loads(message.body)
+    )
+
+    monkeypatch.setattr(consumer, "_handle_event", AsyncMock())
+    await consumer._process(message, dto)
+
+    message.ack.assert_awaited_once()
+    assert consumer.stats.processed == 1
+    assert consumer.stats.processing_ms_max >= 0
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_is_retried_then_dead_lettered(consumer, monkeypatch):
+    body = _event("chat-1")
+    dto = notifications_consumer.schemas.NotificationEventIngest.model_validate(body)
+    monkeypatch.setattr(consumer, "_handle_event", AsyncMock(side_effect=ConnectionError("db down")))
+
+    first = _message(body)
+    await consumer._process(first, dto)
+
+    first.ack.assert_awaited_once()
+    retry = consumer.dead_letters.await_args
+    assert retry.kwargs["routing_key"] == "notifications.events"
+    assert retry.args[0].headers["x-attempt"] == 2
+    assert retry.args[0].headers["x-original-routing-key"] == "notifications.event"
+    assert consumer.stats.retried == 1
+    assert consumer.stats.dead_lettered == 0
+
+    # A broker redelivery counts as an attempt as well.
+    last = _message(body, headers=dict(retry.args[0].headers))
+    last.redelivered = True
+    await consumer._process(last, dto)
+
+    dead = consumer.dead_letters.await_args
+    assert dead.kwargs["routing_key"] == "notifications.events.dlq"
+    assert dead.args[0].headers["x-error"] == "ConnectionError: db down"
+    assert dead.args[0].headers["x-original-routing-key"] == "notifications.event"
+    assert consumer.stats.dead_lettered == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_event_is_dead_lettered_without_retry(consumer, monkeypatch):
+    message = _message(_event("chat-1"))
+    dto = notifications_consumer.schemas.NotificationEventIngest.model_validate(
+        json.loads(message.body)
+    )
+    monkeypatch.setattr(consumer, "_handle_event", AsyncMock(side_effect=ValueError("bad data")))
+
+    await consumer._process(message, dto)
+
+    assert consumer.dead_letters.await_args.kwargs["routing_key"] == "notifications.events.dlq"
+    assert consumer.stats.retried == 0
+    assert consumer.stats.dead_lettered == 1
+
+
+@pytest.mark.asyncio
+async def test_message_is_requeued_when_retry_cannot_be_published(consumer, monkeypatch):
+    message = _message(_event("chat-1"))
+    dto = notifications_consumer.schemas.NotificationEventIngest.model_validate(
+        json.loads(message.body)
+    )
+    monkeypatch.setattr(consumer, "_handle_event", AsyncMock(side_effect=ConnectionError("db down")))
+    consumer.dead_letters.side_effect = ConnectionError("broker down")
+
+    await consumer._process(message, dto)
+
+    message.nack.assert_awaited_once_with(requeue=True)
+    message.ack.assert_not_awaited()
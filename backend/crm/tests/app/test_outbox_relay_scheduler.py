@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from crm.app.outbox_relay import OutboxRelayScheduler
+from crm.infrastructure.db import _AFTER_COMMIT_KEY
+from crm.infrastructure.repositories import OutboxRepository
+
+
+@pytest.mark.asyncio
+async def test_wake_relays_without_waiting_for_poll_interval(monkeypatch):
+    settings = SimpleNamespace(
+        outbox_relay_poll_interval_ms=60_000, outbox_purge_interval_ms=60_000
+    )
+    scheduler = OutboxRelayScheduler(settings, MagicMock())  # type: ignore[arg-type]
+    runs = asyncio.Queue()
+
+    async def relay_pending():
+        runs.put_nowait(None)
+
+    purge_sent = AsyncMock(return_value=0)
+    monkeypatch.setattr(scheduler, "relay_pending", relay_pending)
+    monkeypatch.setattr(scheduler, "purge_sent", purge_sent)
+
+    await scheduler.start()
+    try:
+        await asyncio.wait_for(runs.get(), 1)
+        await scheduler.wake()
+        await asyncio.wait_for(runs.get(), 1)
+    finally:
+        await scheduler.stop()
+
+    # Retention runs on its own, longer interval.
+    purge_sent.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_outbox_rows_wake_relay_only_after_commit():
+    pending: list = []
+    session = MagicMock(info={_AFTER_COMMIT_KEY: pending}, commit=AsyncMock())
+    on_added = AsyncMock()
+    repository = OutboxRepository(session, on_added=on_added)
+
+    await repository.add_many([])
+    assert pending == []
+
+    await repository.add_many(
+        [{"exchange": "crm.events", "routing_key": "deal.updated", "body": {}}]
+    )
+
+    on_added.assert_not_awaited()
+    assert pending == [on_added]
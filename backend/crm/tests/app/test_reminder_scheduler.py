@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from crm.app.reminder_scheduler import ReminderScheduler
+
+
+def _scheduler(next_due: int | None, idle_ms: int = 60_000) -> ReminderScheduler:
+    settings = SimpleNamespace(
+        tasks_scheduling_batch_size=100,
+        tasks_reminders_poll_interval_ms=5000,
+        tasks_reminders_publish_concurrency=5,
+        tasks_reminders_scheduler_idle_ms=idle_ms,
+    )
+    queue = MagicMock()
+    queue.next_due_at = AsyncMock(return_value=next_due)
+    return ReminderScheduler(settings, queue, MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_sleep_returns_immediately_when_reminder_is_due():
+    scheduler = _scheduler(next_due=0)
+
+    started = time.perf_counter()
+    await scheduler._sleep_until_next_due()
+
+    assert time.perf_counter() - started < 0.1
+
+
+@pytest.mark.asyncio
+async def test_sleep_is_interrupted_by_wakeup_notification():
+    now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+    scheduler = _scheduler(next_due=now_ms + 30_000)
+
+    asyncio.get_running_loop().call_later(0.05, scheduler._wakeup.set)
+    started = time.perf_counter()
+    await scheduler._sleep_until_next_due()
+
+    assert time.perf_counter() - started < 1
+
+
+@pytest.mark.asyncio
+async def test_sleep_is_bounded_by_idle_timeout_for_empty_queue():
+    scheduler = _scheduler(next_due=None, idle_ms=50)
+
+    started = time.perf_counter()
+    await scheduler._sleep_until_next_due()
+
+    assert 0.04 < time.perf_counter() - started < 1
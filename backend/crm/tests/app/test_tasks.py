@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 import inspect
 import sys
@@ -26,6 +27,13 @@ class DummySettings:
         self.celery_default_queue = "crm.sync"
         self.celery_task_routes = {}
         self.celery_retry_delay_seconds = 0
+        self.tasks_reminders_poll_interval_ms = 5000
+        self.tasks_delayed_poll_interval_ms = 5000
+        self.tasks_reminders_scheduler_enabled = False
+        self.outbox_enabled = True
+        self.outbox_relay_in_process = False
+        self.outbox_relay_poll_interval_ms = 1000
+        self.outbox_purge_interval_ms = 300_000
 
     def model_copy(self, *, update: dict | None = None, **_: object) -> "DummySettings":
         return self
@@ -115,7 +123,7 @@ async def test_refresh_policy_status_uses_repository(monkeypatch: pytest.MonkeyP
 
 def test_sync_deal_status_converts_identifiers_to_uuid(monkeypatch: pytest.MonkeyPatch) -> None:
     run_mock = Mock()
-    monkeypatch.setattr(tasks.asyncio, "run", run_mock)
+    monkeypatch.setattr(tasks.runtime, "run", run_mock)
 
     update_mock = AsyncMock()
     monkeypatch.setattr(tasks, "_update_deal_status", update_mock)
@@ -141,7 +149,7 @@ def test_sync_deal_status_converts_identifiers_to_uuid(monkeypatch: pytest.Monke
 
 def test_refresh_policy_state_converts_identifiers_to_uuid(monkeypatch: pytest.MonkeyPatch) -> None:
     run_mock = Mock()
-    monkeypatch.setattr(tasks.asyncio, "run", run_mock)
+    monkeypatch.setattr(tasks.runtime, "run", run_mock)
 
     refresh_mock = AsyncMock()
     monkeypatch.setattr(tasks, "_refresh_policy_status", refresh_mock)
@@ -163,3 +171,21 @@ def test_refresh_policy_state_converts_identifiers_to_uuid(monkeypatch: pytest.M
     frame_locals = coroutine_arg.cr_frame.f_locals
     assert isinstance(frame_locals["args"][0], UUID)
     coroutine_arg.close()
+
+
+def test_worker_runtime_reuses_one_loop_until_shutdown() -> None:
+    from crm.app.worker_runtime import AsyncWorkerRuntime
+
+    runtime = AsyncWorkerRuntime()
+
+    async def current_loop() -> object:
+        return asyncio.get_running_loop()
+
+    first = runtime.run(current_loop())
+    second = runtime.run(current_loop())
+    assert first is second
+
+    runtime.shutdown()
+    assert first.is_closed()
+    assert runtime.run(current_loop()) is not first
+    runtime.shutdown()
@@ -4,7 +4,7 @@ import asyncio
 import importlib
 import os
 import sys
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import UUID, uuid4
@@ -73,6 +73,10 @@ class _FakeConnection:
 class _FakeChannel:
     def __init__(self, broker: _InMemoryBroker) -> None:
         self._broker = broker
+        self.is_closed = False
+
+    async def set_qos(self, prefetch_count: int = 0) -> None:
+        return None
 
     async def declare_exchange(self, name: str, _type, durable: bool = True) -> "_FakeExchange":  # noqa: FBT002
         return self._broker.get_exchange(name)
@@ -83,7 +87,7 @@ class _FakeChannel:
         return queue
 
     async def close(self) -> None:
-        return None
+        self.is_closed = True
 
 
 class _FakeExchange:
@@ -303,19 +307,57 @@ async def api_client(apply_migrations) -> AsyncIterator[AsyncClient]:
     from crm.app import main
     from crm.app import config as app_config
     from crm.app.events import EventsPublisher
+    from crm.app.outbox_relay import OutboxRelayScheduler
+    from crm.infrastructure.outbox import OutboxSender
 
     importlib.reload(main)
     app = main.create_app()
     publisher = EventsPublisher(app_config.settings)
     await publisher.connect()
     app.state.events_publisher = publisher
+    # Same wiring as the lifespan: requests wake the relay after their commit.
+    outbox_relay = OutboxRelayScheduler(app_config.settings, OutboxSender(app_config.settings))
+    await outbox_relay.start()
+    app.state.outbox_relay = outbox_relay
     try:
         async with AsyncClient(app=app, base_url="http://testserver") as client:
             yield client
     finally:
+        await outbox_relay.stop()
         await publisher.close()
 
 
+@pytest_asyncio.fixture(params=[True, False], ids=["outbox", "direct"])
+async def relay_outbox(
+    request: pytest.FixtureRequest, apply_migrations, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[Callable[[], Awaitable[int]]]:
+    """Runs an event-asserting test with and without the outbox.
+
+    With the outbox the yielded callable drains whatever the background relay
+    has not sent yet, so the events can be collected deterministically; with
+    direct publishing it finds nothing to send.
+    """
+    from crm.app import config as app_config
+    from crm.app import dependencies
+    from crm.domain.services import OutboxRelay
+    from crm.infrastructure.db import AsyncSessionFactory
+    from crm.infrastructure.outbox import OutboxSender
+    from crm.infrastructure.repositories import OutboxRepository
+
+    monkeypatch.setattr(dependencies.settings, "outbox_enabled", request.param)
+    sender = OutboxSender(app_config.settings)
+    await sender.connect()
+
+    async def _relay() -> int:
+        async with AsyncSessionFactory() as session:
+            stats = await OutboxRelay(OutboxRepository(session), sender).relay_pending()
+        return stats.sent
+
+    try:
+        yield _relay
+    finally:
+        await sender.close()
+
 
 @pytest_asyncio.fixture()
 async def db_session(apply_migrations) -> AsyncIterator[AsyncSession]:
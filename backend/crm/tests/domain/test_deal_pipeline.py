@@ -0,0 +1,81 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from crm.domain.services import DealService
+
+
+def _deal(status: str, offset: int = 0):
+    now = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        id=uuid4(),
+        title="Fleet insurance",
+        description=None,
+        status=status,
+        next_review_at=date(2024, 3, 10) + timedelta(days=offset),
+        client_id=uuid4(),
+        owner_id=None,
+        created_at=now,
+        updated_at=now,
+        is_deleted=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_pipeline_trims_extra_row_into_next_cursor():
+    first, second, extra = _deal("draft", 0), _deal("draft", 1), _deal("draft", 2)
+    rows = [
+        ("qualification", 3, Decimal("1500"), first),
+        ("qualification", 3, Decimal("1500"), second),
+        ("qualification", 3, Decimal("1500"), extra),
+        ("negotiation", 0, Decimal("0"), None),
+    ]
+    repository = MagicMock()
+    repository.pipeline = AsyncMock(return_value=rows)
+    service = DealService(repository)
+
+    pipeline = await service.get_pipeline(per_stage=2)
+
+    qualification, negotiation = pipeline.stages
+    assert [deal.id for deal in qualification.deals] == [first.id, second.id]
+    assert qualification.count == 3
+    assert qualification.total_value == Decimal("1500")
+    assert service.decode_pipeline_cursor(qualification.next_cursor) == (
+        second.next_review_at,
+        second.updated_at,
+        second.id,
+    )
+    assert negotiation.deals == []
+    assert negotiation.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_pipeline_decodes_cursors_per_stage():
+    deal = _deal("proposal")
+    repository = MagicMock()
+    repository.pipeline = AsyncMock(return_value=[])
+    service = DealService(repository)
+    cursor = service.encode_pipeline_cursor(deal)
+
+    await service.get_pipeline(per_stage=10, cursors={"proposal": cursor})
+
+    repository.pipeline.assert_awaited_once_with(
+        per_stage=10,
+        cursors={"proposal": (deal.next_review_at, deal.updated_at, deal.id)},
+        filters=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_pipeline_rejects_foreign_cursor():
+    repository = MagicMock()
+    repository.pipeline = AsyncMock()
+    service = DealService(repository)
+
+    with pytest.raises(ValueError):
+        await service.get_pipeline(per_stage=10, cursors={"proposal": "not-a-cursor"})
+    repository.pipeline.assert_not_awaited()
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from crm.domain import schemas
+from crm.domain.services import DelayedTaskPromoter
+
+
+class _ListQueue:
+    def __init__(self, task_ids: list[str]) -> None:
+        self.task_ids = task_ids
+        self.pulls = 0
+        self.schedule_many = AsyncMock()
+
+    async def pull_due(self, now=None, limit: int = 100) -> list[str]:
+        self.pulls += 1
+        batch, self.task_ids = self.task_ids[:limit], self.task_ids[limit:]
+        return batch
+
+
+def _repository():
+    async def promote(task_ids):
+        return [SimpleNamespace(id=task_id, status_code="pending") for task_id in task_ids]
+
+    repository = MagicMock()
+    repository.promote_scheduled = AsyncMock(side_effect=promote)
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_promote_due_tasks_drains_queue_in_batches():
+    queue = _ListQueue([str(uuid4()) for _ in range(10_000)])
+    repository = _repository()
+    events = MagicMock()
+    events.tasks_status_changed = AsyncMock()
+    promoter = DelayedTaskPromoter(queue, repository, events, batch_size=1000)
+
+    promoted = await promoter.promote_due_tasks()
+
+    assert promoted == 10_000
+    assert repository.promote_scheduled.await_count == 10
+    assert events.tasks_status_changed.await_count == 10
+    assert events.tasks_status_changed.await_args.args[1] is schemas.TaskStatusCode.SCHEDULED
+    assert queue.pulls == 11
+
+
+@pytest.mark.asyncio
+async def test_promote_due_tasks_requeues_batch_on_database_error():
+    task_id = uuid4()
+    queue = _ListQueue([str(task_id), "not-a-uuid"])
+    repository = MagicMock()
+    repository.promote_scheduled = AsyncMock(side_effect=RuntimeError("db_down"))
+    events = MagicMock()
+    events.tasks_status_changed = AsyncMock()
+    promoter = DelayedTaskPromoter(queue, repository, events)
+
+    with pytest.raises(RuntimeError):
+        await promoter.promote_due_tasks()
+
+    assert queue.schedule_many.await_args.args[0] == [task_id]
+    events.tasks_status_changed.assert_not_awaited()
@@ -0,0 +1,110 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from crm.domain import schemas
+from crm.domain.services import NotificationService
+
+
+def _service(dispatcher, *, retry_attempts=3):
+    events_service = SimpleNamespace(handle_incoming=AsyncMock())
+    service = NotificationService(
+        SimpleNamespace(update=AsyncMock()),
+        SimpleNamespace(record=AsyncMock(return_value=True)),
+        MagicMock(),
+        dispatcher,
+        events_service,
+        rabbit_exchange="notifications.exchange",
+        rabbit_routing_key="notifications.dispatch",
+        redis_channel="notifications:dispatch",
+        retry_attempts=retry_attempts,
+        retry_delay_ms=1000,
+        retry_max_delay_ms=4000,
+    )
+    return service, events_service
+
+
+def _notification(*attempts):
+    return SimpleNamespace(
+        id=uuid4(),
+        event_key="deal.created",
+        payload={"dealId": "deal-1"},
+        recipients=[{"userId": "user-1", "telegramId": "123456"}],
+        channel_overrides=None,
+        deduplication_key=None,
+        attempts=[SimpleNamespace(channel=channel, status=status) for channel, status in attempts],
+    )
+
+
+@pytest.mark.asyncio
+async def test_deliver_skips_channels_that_already_succeeded():
+    dispatcher = SimpleNamespace(publish_rabbit=AsyncMock(), publish_redis=AsyncMock())
+    service, events_service = _service(dispatcher)
+    entity = _notification(("rabbitmq", "success"), ("redis", "failure"))
+
+    status = await service.deliver(entity)
+
+    assert status is schemas.NotificationStatus.PROCESSED
+    dispatcher.publish_rabbit.assert_not_awaited()
+    dispatcher.publish_redis.assert_awaited_once()
+    events_service.handle_incoming.assert_awaited_once()
+    # The whole round is written once: both attempts plus the final status.
+    service.attempts.record.assert_awaited_once()
+    service.repository.update.assert_not_awaited()
+    notification_id, recorded, final = service.attempts.record.await_args.args
+    assert notification_id == entity.id
+    assert [(item["channel"], item["attempt_number"]) for item in recorded] == [
+        ("redis", 3),
+        ("events-service", 4),
+    ]
+    assert final["status"] == "processed"
+    assert final["attempts_count"] == 4
+    assert final["next_attempt_at"] is None
+
+
+@pytest.mark.asyncio
+async def test_failed_round_is_rescheduled_with_backoff():
+    dispatcher = SimpleNamespace(
+        publish_rabbit=AsyncMock(), publish_redis=AsyncMock(side_effect=RuntimeError("down"))
+    )
+    service, events_service = _service(dispatcher)
+    entity = _notification(("redis", "failure"))
+    before = datetime.now(timezone.utc)
+
+    status = await service.deliver(entity)
+
+    assert status is None
+    events_service.handle_incoming.assert_not_awaited()
+    _, recorded, update = service.attempts.record.await_args.args
+    assert [(item["channel"], item["status"]) for item in recorded] == [
+        ("rabbitmq", "success"),
+        ("redis", "failure"),
+    ]
+    assert update["status"] == "queued"
+    assert update["attempts_count"] == 3
+    assert update["last_error"] == "down"
+    assert update["locked_until"] is None
+    # Second failed round: 2 s base delay with equal jitter.
+    delay = (update["next_attempt_at"] - before).total_seconds()
+    assert 1 <= delay <= 2.5
+
+
+@pytest.mark.asyncio
+async def test_notification_fails_after_last_retry():
+    dispatcher = SimpleNamespace(
+        publish_rabbit=AsyncMock(side_effect=RuntimeError("down")), publish_redis=AsyncMock()
+    )
+    service, _ = _service(dispatcher, retry_attempts=2)
+    entity = _notification(("rabbitmq", "failure"))
+
+    status = await service.deliver(entity)
+
+    assert status is schemas.NotificationStatus.FAILED
+    _, recorded, update = service.attempts.record.await_args.args
+    assert [item["error"] for item in recorded] == ["down"]
+    assert update["status"] == "failed"
+    assert update["next_attempt_at"] is None
+    dispatcher.publish_redis.assert_not_awaited()
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from crm.domain import schemas
+from crm.domain.services import NotificationEventsService, SeenEventIds
+
+
+def _row(**overrides):
+    now = datetime.now(timezone.utc)
+    values = dict(
+        id=uuid4(),
+        event_type="deal.created",
+        payload={},
+        delivered_to_telegram=False,
+        telegram_message_id=None,
+        telegram_delivery_status=None,
+        telegram_delivery_reason=None,
+        telegram_delivery_occurred_at=None,
+        created_at=now,
+        updated_at=now,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _dto():
+    return schemas.NotificationEventIngest(
+        id=uuid4(),
+        source="crm",
+        type="deal.created",
+        time=datetime.now(timezone.utc),
+        data={},
+        chat_id="123456",
+    )
+
+
+def _service(repository, seen_events=None):
+    stream = SimpleNamespace(publish=AsyncMock())
+    telegram = SimpleNamespace(send=AsyncMock(return_value={"accepted": True, "messageId": "7"}))
+    return NotificationEventsService(repository, stream, telegram, seen_events)
+
+
+@pytest.mark.asyncio
+async def test_new_event_is_inserted_once_and_not_read_back():
+    inserted = _row()
+    updated = _row(id=inserted.id, telegram_message_id="7", telegram_delivery_status="sent")
+    repository = MagicMock(
+        create_if_absent=AsyncMock(return_value=inserted),
+        update=AsyncMock(return_value=updated),
+        get_by_event_id=AsyncMock(),
+    )
+    service = _service(repository)
+    dto = _dto()
+
+    event = await service.handle_incoming(dto)
+
+    assert event.telegram_message_id == "7"
+    assert event.telegram_delivery_status == "sent"
+    repository.create_if_absent.assert_awaited_once()
+    repository.get_by_event_id.assert_not_awaited()
+    assert dto.id in service.seen_events
+
+
+@pytest.mark.asyncio
+async def test_redelivered_event_is_skipped():
+    repository = MagicMock(create_if_absent=AsyncMock(return_value=None), update=AsyncMock())
+    seen_events = SeenEventIds()
+    service = _service(repository, seen_events)
+    dto = _dto()
+
+    # Stored by another consumer: the insert conflicts.
+    assert await service.handle_incoming(dto) is None
+    # Redelivered again: answered from memory.
+    assert await service.handle_incoming(dto) is None
+
+    repository.create_if_absent.assert_awaited_once()
+    repository.update.assert_not_awaited()
+    service.stream.publish.assert_not_awaited()
+    service.telegram.send.assert_not_awaited()
+
+
+def test_seen_event_ids_evicts_least_recently_seen():
+    seen = SeenEventIds(max_size=2)
+    first, second, third = uuid4(), uuid4(), uuid4()
+    seen.add(first)
+    seen.add(second)
+    assert first in seen  # refreshes ``first``
+    seen.add(third)
+
+    assert first in seen
+    assert second not in seen
+    assert len(seen) == 2
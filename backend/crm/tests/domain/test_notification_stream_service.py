@@ -0,0 +1,79 @@
+import pytest
+
+from crm.domain.services import NotificationStreamService
+
+
+@pytest.mark.asyncio
+async def test_reconnecting_subscriber_replays_missed_events():
+    stream = NotificationStreamService(5000, history_size=3)
+    seen, _ = await stream.subscribe()
+    for index in range(5):
+        await stream.publish("deal.created", {"index": index})
+    ids = [seen.get_nowait()["id"] for _ in range(5)]
+
+    _, missed = await stream.subscribe(last_event_id=ids[2])
+    assert [message["id"] for message in missed] == ids[3:]
+
+    _, missed = await stream.subscribe(last_event_id=ids[0])  # older than the buffer
+    assert [message["id"] for message in missed] == ids[2:]
+
+    _, missed = await stream.subscribe(last_event_id=ids[4])
+    assert missed == []
+
+    _, missed = await stream.subscribe()
+    assert missed == []
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_events():
+    stream = NotificationStreamService(5000, queue_size=2)
+    queue, _ = await stream.subscribe()
+
+    for index in range(3):
+        await stream.publish("deal.created", {"index": index})
+
+    assert [queue.get_nowait()["data"]["payload"]["index"] for _ in range(2)] == [1, 2]
+    assert stream.dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_disconnects_slow_subscriber():
+    stream = NotificationStreamService(5000, queue_size=1, overflow_policy="disconnect")
+    slow, _ = await stream.subscribe()
+
+    await stream.publish("deal.created", {})
+    await stream.publish("deal.updated", {})
+
+    assert slow.get_nowait() is None
+    assert stream.disconnected == 1
+    await stream.publish("deal.deleted", {})
+    assert slow.empty()
+
+
+@pytest.mark.asyncio
+async def test_backend_relays_events_to_local_subscribers():
+    published: list[tuple[str, dict]] = []
+
+    class _Backend:
+        async def publish(self, event_type, payload):
+            published.append((event_type, payload))
+
+        async def start(self, deliver):
+            self.deliver = deliver
+
+        async def stop(self):
+            return None
+
+    backend = _Backend()
+    stream = NotificationStreamService(5000, backend=backend)
+    await stream.start()
+    queue, _ = await stream.subscribe()
+
+    await stream.publish("deal.created", {"id": 1})
+    assert published == [("deal.created", {"id": 1})]
+    assert queue.empty()  # delivered only once the relay reads it back
+
+    backend.deliver("deal.created", {"id": 1}, "1700000000000-3")
+    message = queue.get_nowait()
+    assert message["id"] == "1700000000000-3"
+    assert message["data"] == {"eventType": "deal.created", "payload": {"id": 1}}
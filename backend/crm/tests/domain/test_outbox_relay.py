@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from crm.domain.services import OutboxRelay
+
+
+def _message(age_ms: int = 0):
+    return SimpleNamespace(
+        id=uuid4(),
+        created_at=datetime.now(timezone.utc) - timedelta(milliseconds=age_ms),
+    )
+
+
+def _repository(*batches):
+    repository = MagicMock()
+    repository.claim_batch = AsyncMock(side_effect=[*batches, []])
+    repository.complete_batch = AsyncMock()
+    repository.pending_stats = AsyncMock(return_value=(0, None))
+    return repository
+
+
+@pytest.mark.asyncio
+async def test_relay_marks_sent_and_postpones_failed_messages():
+    sent, failed = _message(age_ms=1500), _message()
+    repository = _repository([sent, failed])
+    sender = MagicMock()
+    sender.send_many = AsyncMock(return_value=[None, ConnectionError("nack")])
+    relay = OutboxRelay(repository, sender, batch_size=10, retry_delay_ms=5000)
+
+    stats = await relay.relay_pending()
+
+    args, kwargs = repository.complete_batch.await_args
+    assert args[0] == [sent.id]
+    assert args[1] == {failed.id: "ConnectionError: nack"}
+    assert kwargs["retry_at"] > datetime.now(timezone.utc) + timedelta(seconds=4)
+    assert (stats.claimed, stats.sent, stats.failed) == (2, 1, 1)
+    assert stats.lag_ms >= 1500
+    assert relay.last_run is stats
+
+
+@pytest.mark.asyncio
+async def test_relay_drains_full_batches_until_table_is_empty():
+    repository = _repository([_message(), _message()], [_message()])
+    sender = MagicMock()
+    sender.send_many = AsyncMock(side_effect=lambda messages: [None] * len(messages))
+    relay = OutboxRelay(repository, sender, batch_size=2)
+
+    stats = await relay.relay_pending()
+
+    assert repository.claim_batch.await_count == 2
+    assert stats.sent == 3
+
+
+@pytest.mark.asyncio
+async def test_relay_stops_after_broker_failure():
+    batch = [_message(), _message()]
+    repository = _repository(batch, [_message(), _message()])
+    repository.pending_stats = AsyncMock(return_value=(4, batch[0].created_at))
+    sender = MagicMock()
+    sender.send_many = AsyncMock(side_effect=ConnectionError("broker down"))
+    relay = OutboxRelay(repository, sender, batch_size=2)
+
+    stats = await relay.relay_pending()
+
+    repository.claim_batch.assert_awaited_once()
+    assert repository.complete_batch.await_args.args[0] == []
+    assert len(repository.complete_batch.await_args.args[1]) == 2
+    assert stats.pending == 4
+
+
+@pytest.mark.asyncio
+async def test_purge_deletes_sent_messages_in_batches():
+    repository = _repository()
+    repository.delete_sent_before = AsyncMock(side_effect=[2, 2, 1])
+    relay = OutboxRelay(repository, MagicMock())
+    before = datetime.now(timezone.utc)
+
+    deleted = await relay.purge_sent(timedelta(hours=72), batch_size=2)
+
+    assert deleted == 5
+    assert repository.delete_sent_before.await_count == 3
+    cutoff, limit = repository.delete_sent_before.await_args.args
+    assert limit == 2
+    assert before - timedelta(hours=72, seconds=1) < cutoff <= before - timedelta(hours=71)
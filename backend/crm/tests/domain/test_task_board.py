@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from crm.domain.services import TaskService
+
+
+def _task(status: str):
+    now = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        id=uuid4(),
+        title="Call client",
+        description=None,
+        status_code=status,
+        status=None,
+        due_at=now,
+        scheduled_for=None,
+        completed_at=None,
+        cancelled_reason=None,
+        created_at=now,
+        updated_at=now,
+        payload={},
+        assignee_id=uuid4(),
+        author_id=uuid4(),
+        deal_id=None,
+        policy_id=None,
+        payment_id=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_board_groups_rows_into_ordered_columns():
+    pending = SimpleNamespace(code="pending", name="Pending")
+    completed = SimpleNamespace(code="completed", name="Completed")
+    rows = [
+        (completed, 0, None),
+        (pending, 7, _task("pending")),
+        (pending, 7, _task("pending")),
+    ]
+    repository = MagicMock()
+    repository.board = AsyncMock(return_value=rows)
+    service = TaskService(repository, MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock())
+    assignee_id = uuid4()
+
+    board = await service.get_board(assignee_id=assignee_id, limit=2)
+
+    repository.board.assert_awaited_once_with(assignee_id=assignee_id, limit=2)
+    assert [column.status.value for column in board.columns] == ["pending", "completed"]
+    assert [column.total for column in board.columns] == [7, 0]
+    assert len(board.columns[0].tasks) == 2
+    assert board.columns[1].tasks == []
+    assert board.total == 7
@@ -0,0 +1,156 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import ANY, AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from crm.domain import schemas
+from crm.domain.services import TaskService
+
+
+def _task(status: str, **extra):
+    now = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    data = {
+        "id": uuid4(),
+        "title": "Call client",
+        "description": None,
+        "status_code": status,
+        "status": None,
+        "due_at": None,
+        "scheduled_for": None,
+        "completed_at": None,
+        "cancelled_reason": None,
+        "created_at": now,
+        "updated_at": now,
+        "payload": {},
+        "assignee_id": uuid4(),
+        "author_id": uuid4(),
+        "deal_id": None,
+        "policy_id": None,
+        "payment_id": None,
+    }
+    data.update(extra)
+    return SimpleNamespace(**data)
+
+
+def _service(tasks, *, stored_statuses=None):
+    """``stored_statuses`` overrides what the UPDATE sees, as a concurrent writer would."""
+    repository = MagicMock()
+    repository.get_many = AsyncMock(return_value=tasks)
+    stored = {task.id: task.status_code for task in tasks}
+    stored.update(stored_statuses or {})
+
+    async def bulk_update(expected_statuses, values, *, payload_patch=None):
+        updated = []
+        for task in tasks:
+            if expected_statuses.get(task.id, object()) == stored[task.id]:
+                updated.append(SimpleNamespace(**{**vars(task), **values}))
+        return updated
+
+    repository.bulk_update = AsyncMock(side_effect=bulk_update)
+    delayed_queue = MagicMock()
+    delayed_queue.schedule_many = AsyncMock()
+    delayed_queue.remove_many = AsyncMock()
+    events = MagicMock()
+    events.tasks_status_changed = AsyncMock()
+    service = TaskService(repository, MagicMock(), MagicMock(), delayed_queue, MagicMock(), events)
+    return service, repository, delayed_queue, events
+
+
+@pytest.mark.asyncio
+async def test_bulk_complete_reports_per_item_results():
+    pending, scheduled, cancelled = _task("pending"), _task("scheduled"), _task("cancelled")
+    missing = uuid4()
+    service, repository, delayed_queue, events = _service([pending, scheduled, cancelled])
+    request = schemas.TaskBulkRequest(
+        task_ids=[pending.id, scheduled.id, cancelled.id, missing], operation="complete"
+    )
+
+    result = await service.bulk_update(request)
+
+    assert [item.status for item in result.items] == ["updated", "failed", "failed", "failed"]
+    assert [item.code for item in result.items[1:]] == [
+        "invalid_status_transition",
+        "invalid_status_transition",
+        "task_not_found",
+    ]
+    assert (result.updated, result.failed) == (1, 3)
+    repository.bulk_update.assert_awaited_once()
+    assert repository.bulk_update.await_args.args[0] == {pending.id: "pending"}
+    events.tasks_status_changed.assert_awaited_once()
+    assert events.tasks_status_changed.await_args.args[1] is schemas.TaskStatusCode.PENDING
+    delayed_queue.remove_many.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_reschedule_updates_delayed_queue_once():
+    first, second = _task("scheduled"), _task("scheduled")
+    service, repository, delayed_queue, events = _service([first, second])
+    run_at = datetime(2024, 4, 1, 9, tzinfo=timezone.utc)
+    request = schemas.TaskBulkRequest(
+        task_ids=[first.id, second.id], operation="reschedule", scheduled_for=run_at
+    )
+
+    result = await service.bulk_update(request)
+
+    assert result.updated == 2
+    delayed_queue.schedule_many.assert_awaited_once()
+    assert set(delayed_queue.schedule_many.await_args.args[0]) == {first.id, second.id}
+    events.tasks_status_changed.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_reports_concurrent_status_change():
+    first, second = _task("pending"), _task("in_progress")
+    # ``second`` was cancelled after it was read, so its status no longer matches.
+    service, repository, delayed_queue, events = _service(
+        [first, second], stored_statuses={second.id: "cancelled"}
+    )
+    request = schemas.TaskBulkRequest(task_ids=[first.id, second.id], operation="complete")
+
+    result = await service.bulk_update(request)
+
+    assert repository.bulk_update.await_args.args[0] == {
+        first.id: "pending",
+        second.id: "in_progress",
+    }
+    assert [(item.status, item.code) for item in result.items] == [
+        ("updated", None),
+        ("failed", "concurrent_update"),
+    ]
+    events.tasks_status_changed.assert_awaited_once()
+    published, previous = events.tasks_status_changed.await_args.args
+    assert [task.id for task in published] == [first.id]
+    assert previous is schemas.TaskStatusCode.PENDING
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_skips_tasks_already_in_target_status():
+    completed, scheduled = _task("completed"), _task("scheduled")
+    service, repository, _, _ = _service([completed, scheduled])
+
+    result = await service.bulk_update(
+        schemas.TaskBulkRequest(task_ids=[completed.id], operation="complete")
+    )
+
+    assert result.items[0].status == "unchanged"
+    repository.bulk_update.assert_awaited_once_with({}, ANY, payload_patch=None)
+
+    run_at = datetime(2024, 4, 1, 9, tzinfo=timezone.utc)
+    result = await service.bulk_update(
+        schemas.TaskBulkRequest(
+            task_ids=[scheduled.id], operation="reschedule", scheduled_for=run_at
+        )
+    )
+
+    assert result.items[0].status == "updated"
+    assert repository.bulk_update.await_args.args[0] == {scheduled.id: "scheduled"}
+
+
+def test_bulk_request_requires_operation_fields():
+    with pytest.raises(ValidationError):
+        schemas.TaskBulkRequest(task_ids=[uuid4()], operation="cancel")
+    with pytest.raises(ValidationError):
+        schemas.TaskBulkRequest(task_ids=[uuid4() for _ in range(201)], operation="complete")
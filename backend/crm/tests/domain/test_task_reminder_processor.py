@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from crm.domain.services import TaskReminderProcessor
+from crm.infrastructure.queues import TaskReminderQueue
+
+
+def _queue(claimed):
+    queue = MagicMock()
+    queue.claim_due = AsyncMock(return_value=claimed)
+    queue.ack = AsyncMock()
+    queue.reschedule_many = AsyncMock()
+    return queue
+
+
+@pytest.mark.asyncio
+async def test_process_due_reminders_acks_batch_once():
+    published, missing = str(uuid4()), str(uuid4())
+    queue = _queue([(published, 1000), (missing, 1000), ("not-a-uuid", 1000)])
+    repository = MagicMock()
+    repository.get_many = AsyncMock(return_value=[SimpleNamespace(id=UUID(published))])
+    events = MagicMock()
+    events.task_reminder = AsyncMock()
+    processor = TaskReminderProcessor(queue, repository, events)
+
+    processed = await processor.process_due_reminders()
+
+    assert processed == 1
+    repository.get_many.assert_awaited_once_with([UUID(published), UUID(missing)])
+    queue.ack.assert_awaited_once()
+    assert set(queue.ack.await_args.args) == {published, missing, "not-a-uuid"}
+    queue.reschedule_many.assert_not_awaited()
+    stats = processor.last_batch
+    assert (stats.claimed, stats.processed, stats.retried, stats.skipped) == (3, 1, 0, 2)
+    assert stats.lag_ms > 0
+
+
+@pytest.mark.asyncio
+async def test_process_due_reminders_reschedules_only_failures_at_once():
+    ok_id, failed_id = uuid4(), uuid4()
+    queue = _queue([(str(ok_id), 1000), (str(failed_id), 1000)])
+    repository = MagicMock()
+    repository.get_many = AsyncMock(
+        return_value=[SimpleNamespace(id=ok_id), SimpleNamespace(id=failed_id)]
+    )
+    events = MagicMock()
+
+    async def publish(reminder):
+        if reminder.id == failed_id:
+            raise RuntimeError("broker_down")
+
+    events.task_reminder = AsyncMock(side_effect=publish)
+    processor = TaskReminderProcessor(queue, repository, events, retry_delay_ms=5000)
+
+    processed = await processor.process_due_reminders()
+
+    assert processed == 1
+    queue.ack.assert_awaited_once_with(str(ok_id))
+    queue.reschedule_many.assert_awaited_once()
+    scores = queue.reschedule_many.await_args.args[0]
+    assert list(scores) == [str(failed_id)]
+    assert scores[str(failed_id)] > 1000
+    assert processor.last_batch.retried == 1
+
+
+@pytest.mark.asyncio
+async def test_claim_due_leases_batch_in_one_script_call():
+    claim_script = AsyncMock(return_value=["a", "1000", "b", "2000"])
+    redis = MagicMock()
+    redis.register_script = MagicMock(side_effect=[claim_script, AsyncMock()])
+    queue = TaskReminderQueue(redis=redis, queue_key="tasks:reminders", lease_ms=30_000)
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    claimed = await queue.claim_due(now=now, limit=2)
+
+    now_ms = int(now.timestamp() * 1000)
+    claim_script.assert_awaited_once_with(
+        keys=["tasks:reminders", "tasks:reminders:inflight"],
+        args=[now_ms, 2, now_ms + 30_000],
+    )
+    assert claimed == [("a", 1000), ("b", 2000)]
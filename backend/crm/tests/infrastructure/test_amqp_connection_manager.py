@@ -0,0 +1,89 @@
+import pytest
+
+from crm.infrastructure import amqp
+from crm.infrastructure.amqp import AmqpConnectionManager
+
+
+class _Channel:
+    def __init__(self, publisher_confirms: bool) -> None:
+        self.publisher_confirms = publisher_confirms
+        self.is_closed = False
+        self.declared: list[str] = []
+        self.prefetch_count: int | None = None
+
+    async def declare_exchange(self, name: str, _type, durable: bool = True):  # noqa: FBT002
+        self.declared.append(name)
+        return object()
+
+    async def set_qos(self, prefetch_count: int = 0) -> None:
+        self.prefetch_count = prefetch_count
+
+    async def close(self) -> None:
+        self.is_closed = True
+
+
+class _Connection:
+    def __init__(self) -> None:
+        self.channels: list[_Channel] = []
+        self.closed = False
+
+    async def channel(self, publisher_confirms: bool = False) -> _Channel:  # noqa: FBT002
+        channel = _Channel(publisher_confirms)
+        self.channels.append(channel)
+        return channel
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def connections(monkeypatch: pytest.MonkeyPatch) -> list[_Connection]:
+    opened: list[_Connection] = []
+
+    async def connect_robust(url: str) -> _Connection:
+        connection = _Connection()
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(amqp.aio_pika, "connect_robust", connect_robust)
+    return opened
+
+
+@pytest.mark.asyncio
+async def test_exchanges_are_declared_once_on_one_connection(connections):
+    manager = AmqpConnectionManager("amqp://localhost/")
+
+    first = await manager.exchange("crm.events")
+    again = await manager.exchange("crm.events")
+    await manager.exchange("crm.tasks")
+
+    assert first is again
+    assert len(connections) == 1
+    [publish_channel] = connections[0].channels
+    assert publish_channel.publisher_confirms
+    assert publish_channel.declared == ["crm.events", "crm.tasks"]
+
+    # A channel closed by the broker is reopened and its exchanges redeclared.
+    publish_channel.is_closed = True
+    await manager.exchange("crm.events")
+    assert len(connections[0].channels) == 2
+    assert connections[0].channels[1].declared == ["crm.events"]
+
+
+@pytest.mark.asyncio
+async def test_consumer_channels_are_pooled(connections):
+    manager = AmqpConnectionManager("amqp://localhost/", channel_pool_size=1)
+
+    async with manager.channel() as first:
+        async with manager.channel(prefetch_count=1) as second:
+            assert first is not second
+    async with manager.channel() as reused:
+        assert reused is second
+
+    assert second.prefetch_count == 1
+    assert first.is_closed  # beyond the pool size
+    assert not second.is_closed
+
+    await manager.close()
+    assert second.is_closed
+    assert connections[0].closed
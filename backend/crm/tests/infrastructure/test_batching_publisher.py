@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+from aio_pika import Message
+
+from crm.infrastructure.amqp import BatchingPublisher, PublishBufferFull
+
+
+class _RecordingExchange:
+    def __init__(self) -> None:
+        self.published: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_keys: set[str] = set()
+
+    async def publish(self, message: Message, routing_key: str) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)  # broker confirm round trip
+        self.in_flight -= 1
+        if routing_key in self.fail_keys:
+            raise ConnectionError("nack")
+        self.published.append(routing_key)
+
+
+def _publisher(exchange: _RecordingExchange, **kwargs) -> BatchingPublisher:
+    async def exchange_factory(name: str) -> _RecordingExchange:
+        return exchange
+
+    return BatchingPublisher(exchange_factory, **kwargs)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_messages_are_published_concurrently_and_confirmed():
+    exchange = _RecordingExchange()
+    publisher = _publisher(exchange, batch_size=10, flush_interval_ms=5)
+
+    await asyncio.gather(
+        *(publisher.publish("crm.events", f"event.{i}", Message(b"{}")) for i in range(20))
+    )
+
+    assert sorted(exchange.published) == sorted(f"event.{i}" for i in range(20))
+    assert exchange.max_in_flight > 1
+    assert publisher.stats.published == 20
+    assert publisher.stats.batches >= 2
+    await publisher.close()
+
+
+@pytest.mark.asyncio
+async def test_nacked_message_fails_only_its_caller():
+    exchange = _RecordingExchange()
+    exchange.fail_keys = {"event.bad"}
+    publisher = _publisher(exchange, batch_size=10)
+
+    results = await asyncio.gather(
+        publisher.publish("crm.events", "event.good", Message(b"{}")),
+        publisher.publish("crm.events", "event.bad", Message(b"{}")),
+        return_exceptions=True,
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], ConnectionError)
+    assert publisher.stats.failed == 1
+    await publisher.close()
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_applies_back_pressure():
+    blocked = asyncio.Event()
+
+    async def exchange_factory(name: str):
+        await blocked.wait()
+        return _RecordingExchange()
+
+    publisher = BatchingPublisher(
+        exchange_factory,
+        buffer_size=2,
+        batch_size=1,
+        max_in_flight_batches=1,
+        enqueue_timeout_ms=20,
+    )
+
+    # One message is held by the stalled flush, one by the flusher, two fill the buffer.
+    for _ in range(4):
+        await publisher.enqueue("crm.events", "event", Message(b"{}"))
+        await asyncio.sleep(0)
+    with pytest.raises(PublishBufferFull):
+        await publisher.enqueue("crm.events", "event", Message(b"{}"))
+
+    blocked.set()
+    await publisher.close()
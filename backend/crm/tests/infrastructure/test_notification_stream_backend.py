@@ -0,0 +1,57 @@
+import asyncio
+import json
+
+import pytest
+
+from crm.infrastructure.notification_stream import RedisNotificationStreamBackend
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.entries: list[tuple[str, dict[str, str]]] = []
+        self.read_from: list[str] = []
+        self._new_entry = asyncio.Event()
+
+    async def xadd(self, key, fields, maxlen=None, approximate=True):  # noqa: FBT002
+        entry_id = f"1700000000000-{len(self.entries)}"
+        self.entries.append((entry_id, fields))
+        self._new_entry.set()
+        return entry_id
+
+    async def xread(self, streams, count=None, block=None):
+        [(key, last_id)] = streams.items()
+        self.read_from.append(last_id)
+        if last_id == "$":
+            last_id = self.entries[-1][0] if self.entries else "0-0"
+        while True:
+            newer = [entry for entry in self.entries if entry[0] > last_id]
+            if newer:
+                return [(key, newer[:count])]
+            self._new_entry.clear()
+            await self._new_entry.wait()
+
+
+@pytest.mark.asyncio
+async def test_relay_delivers_entries_published_by_any_process():
+    redis = _FakeRedis()
+    backend = RedisNotificationStreamBackend(redis, "notifications:stream")  # type: ignore[arg-type]
+    delivered: list[tuple[str, dict, str]] = []
+
+    await backend.start(lambda *event: delivered.append(event))
+    await asyncio.sleep(0)
+    await backend.publish("deal.created", {"deal_id": "d-1"})
+    await backend.publish("deal.updated", {"deal_id": "d-1"})
+    for _ in range(10):
+        if len(delivered) == 2:
+            break
+        await asyncio.sleep(0.01)
+    await backend.stop()
+
+    assert delivered == [
+        ("deal.created", {"deal_id": "d-1"}, "1700000000000-0"),
+        ("deal.updated", {"deal_id": "d-1"}, "1700000000000-1"),
+    ]
+    assert json.loads(redis.entries[0][1]["payload"]) == {"deal_id": "d-1"}
+    # After the first read the relay resumes from the last entry it saw.
+    assert redis.read_from[0] == "$"
+    assert redis.read_from[-1] in {"1700000000000-0", "1700000000000-1"}
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from crm.infrastructure.telegram import TelegramBotClient, TelegramRateLimiter
+
+
+class _StandInBotApi:
+    """Minimal Bot API stand-in that rejects messages sent too fast to one chat."""
+
+    def __init__(self, chat_interval: float, retry_after: float = 0) -> None:
+        self.chat_interval = chat_interval
+        self.retry_after = retry_after
+        self.sent: list[str] = []
+        self.rejected = 0
+        self._last_sent: dict[str, float] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        chat_id = json.loads(request.content)["chat_id"]
+        now = time.monotonic()
+        if now - self._last_sent.get(chat_id, -1e9) < self.chat_interval:
+            self.rejected += 1
+            return httpx.Response(
+                429,
+                json={
+                    "ok": False,
+                    "error_code": 429,
+                    "parameters": {"retry_after": self.retry_after},
+                },
+            )
+        self._last_sent[chat_id] = now
+        self.sent.append(chat_id)
+        return httpx.Response(200, json={"ok": True, "result": {"message_id": len(self.sent)}})
+
+
+@pytest.mark.asyncio
+async def test_limiter_spaces_messages_per_chat_only():
+    limiter = TelegramRateLimiter(1000, 20)
+
+    started = time.monotonic()
+    await asyncio.gather(*(limiter.acquire(f"chat-{index}") for index in range(5)))
+    assert time.monotonic() - started < 0.04
+
+    started = time.monotonic()
+    await asyncio.gather(*(limiter.acquire("chat-busy") for _ in range(3)))
+    assert time.monotonic() - started >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_chat_limit_pauses_only_that_chat():
+    limiter = TelegramRateLimiter(1000, 1000, chat_burst=10)
+    await limiter.acquire("chat-busy")
+    await limiter.acquire("chat-busy")
+
+    limiter.pause("chat-busy", 0.2)
+
+    started = time.monotonic()
+    await limiter.acquire("chat-other")
+    assert time.monotonic() - started < 0.05
+    await limiter.acquire("chat-busy")
+    assert time.monotonic() - started >= 0.19
+
+
+@pytest.mark.asyncio
+async def test_limit_outside_chat_limits_pauses_every_chat():
+    limiter = TelegramRateLimiter(1000, 1000, chat_burst=10)
+    # First message to the chat: a 429 here cannot come from the chat limit.
+    await limiter.acquire("chat-quiet")
+
+    limiter.pause("chat-quiet", 0.2)
+
+    started = time.monotonic()
+    await limiter.acquire("chat-other")
+    assert time.monotonic() - started >= 0.19
+
+
+@pytest.mark.asyncio
+async def test_limits_across_several_chats_pause_every_chat():
+    limiter = TelegramRateLimiter(1000, 1000, chat_burst=10, global_pause_chats=3)
+    for index in range(3):
+        await limiter.acquire(f"chat-{index}")
+        await limiter.acquire(f"chat-{index}")
+
+    limiter.pause("chat-0", 0.2)
+    limiter.pause("chat-1", 0.2)
+    started = time.monotonic()
+    await limiter.acquire("chat-other")
+    assert time.monotonic() - started < 0.05
+
+    limiter.pause("chat-2", 0.2)
+    started = time.monotonic()
+    await limiter.acquire("chat-other")
+    assert time.monotonic() - started >= 0.19
+
+
+@pytest.mark.asyncio
+async def test_burst_stays_within_stand_in_limits():
+    api = _StandInBotApi(chat_interval=0.045)
+    client = TelegramBotClient(
+        "token",
+        limiter=TelegramRateLimiter(200, 20),
+        transport=httpx.MockTransport(api),
+    )
+
+    results = await asyncio.gather(
+        *(client.send_message(f"chat-{index % 3}", "hello") for index in range(9))
+    )
+    await client.close()
+
+    assert all(result["accepted"] for result in results)
+    assert api.rejected == 0
+    assert sorted(api.sent) == sorted(f"chat-{index % 3}" for index in range(9))
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_message_is_retried_after_retry_after():
+    api = _StandInBotApi(chat_interval=0.1, retry_after=0.1)
+    # The limiter allows more than the stand-in, so the second message gets a 429.
+    client = TelegramBotClient(
+        "token",
+        limiter=TelegramRateLimiter(1000, 1000, chat_burst=10),
+        transport=httpx.MockTransport(api),
+    )
+
+    first = await client.send_message("chat-1", "one")
+    second = await client.send_message("chat-1", "two")
+    await client.close()
+
+    assert first["accepted"] and second["accepted"]
+    assert api.rejected == 1
+    assert second["messageId"] == "2"
+
+
+@pytest.mark.asyncio
+async def test_long_retry_after_fails_the_message():
+    api = _StandInBotApi(chat_interval=60, retry_after=120)
+    client = TelegramBotClient(
+        "token",
+        limiter=TelegramRateLimiter(1000, 1000, chat_burst=10),
+        transport=httpx.MockTransport(api),
+        max_retry_after=30,
+    )
+
+    await client.send_message("chat-1", "one")
+    result = await client.send_message("chat-1", "two")
+    await client.close()
+
+    assert result == {
+        "accepted": False,
+        "error": "telegram_http_429",
+        "messageId": None,
+        "retryAfter": 120.0,
+    }
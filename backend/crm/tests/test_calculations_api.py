@@ -180,7 +180,7 @@ async def test_calculation_creation_checks_deal_existence(api_client, db_session
 
 
 @pytest.mark.asyncio()
-async def test_calculations_flow(api_client, configure_environment):
+async def test_calculations_flow(api_client, configure_environment, relay_outbox):
     settings = configure_environment
     headers = {}
 
@@ -368,6 +368,7 @@ async def test_calculations_flow(api_client, configure_environment):
     assert empty_list_resp.status_code == 200
     assert empty_list_resp.json() == []
 
+    await relay_outbox()
     events = await _collect_events(events_queue)
     await channel.close()
     await connection.close()
@@ -22,7 +22,7 @@ async def _collect_events(queue: aio_pika.abc.AbstractQueue) -> list[tuple[str,
 
 
 @pytest.mark.asyncio()
-async def test_deal_journal_flow(api_client, configure_environment):
+async def test_deal_journal_flow(api_client, configure_environment, relay_outbox):
     settings = configure_environment
     headers = {}
 
@@ -106,6 +106,7 @@ async def test_deal_journal_flow(api_client, configure_environment):
     assert len(paged_collection.items) == 1
     assert paged_collection.items[0].id == second_entry.id
 
+    await relay_outbox()
     events = await _collect_events(events_queue)
     await channel.close()
     await connection.close()
@@ -33,6 +33,20 @@ async def api_client_telegram_disabled(apply_migrations):
         app_dependencies._telegram_service = None
 
 
+async def _deliver_pending_notifications() -> None:
+    from crm.app import config as app_config
+    from crm.app import dependencies as app_dependencies
+    from crm.app.notification_delivery import NotificationDeliveryScheduler
+
+    scheduler = NotificationDeliveryScheduler(
+        app_config.settings,
+        app_dependencies.get_notification_dispatcher(),
+        app_dependencies.get_notification_stream(),
+        app_dependencies.get_telegram_service(),
+    )
+    await scheduler.process_due()
+
+
 @pytest.mark.asyncio
 async def test_notification_templates(api_client):
     template_payload = {
@@ -73,6 +87,7 @@ async def test_notifications_flow(api_client):
     assert response.status_code == 202
     data = response.json()
     notification_id = data["notification_id"]
+    await _deliver_pending_notifications()
 
     status_response = await api_client.get(f"/api/v1/notifications/{notification_id}")
     assert status_response.status_code == 200
@@ -126,6 +141,7 @@ async def test_notifications_flow_telegram_disabled(api_client_telegram_disabled
     assert response.status_code == 202
     data = response.json()
     notification_id = data["notification_id"]
+    await _deliver_pending_notifications()
 
     status_response = await api_client_telegram_disabled.get(
         f"/api/v1/notifications/{notification_id}"
@@ -0,0 +1,142 @@
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import aio_pika
+import pytest
+from sqlalchemy import select
+
+from crm.app.dependencies import get_delayed_task_queue, get_task_reminder_queue
+from crm.domain import schemas
+from crm.infrastructure import models
+from crm.infrastructure.db import AsyncSessionFactory
+from crm.infrastructure.outbox import OutboxTaskEventsPublisher
+from crm.infrastructure.queues import DelayedTaskQueue, TaskReminderQueue
+
+
+def _task_payload(**extra: object) -> dict[str, object]:
+    return {
+        "subject": "Проверить outbox",
+        "description": "Событие пишется вместе с задачей",
+        "assignee_id": str(uuid4()),
+        "author_id": str(uuid4()),
+        **extra,
+    }
+
+
+async def _visible(model: type, entity_id: UUID | str) -> bool:
+    """Whether a row is visible to a connection outside the request transaction."""
+    async with AsyncSessionFactory() as session:
+        return await session.get(model, UUID(str(entity_id))) is not None
+
+
+async def _outbox_rows(task_id: UUID | str) -> list[models.OutboxMessage]:
+    async with AsyncSessionFactory() as session:
+        result = await session.scalars(
+            select(models.OutboxMessage).where(
+                models.OutboxMessage.body["data"]["task_id"].astext == str(task_id)
+            )
+        )
+        return list(result)
+
+
+@pytest.mark.asyncio
+async def test_outbox_row_is_committed_with_the_task(api_client, monkeypatch):
+    original = OutboxTaskEventsPublisher.task_created
+    seen_before_commit: list[bool] = []
+
+    async def task_created(self, task):
+        await original(self, task)
+        seen_before_commit.append(await _visible(models.Task, task.id))
+
+    monkeypatch.setattr(OutboxTaskEventsPublisher, "task_created", task_created)
+
+    response = await api_client.post("/api/v1/tasks", json=_task_payload())
+    assert response.status_code == 201
+    task = schemas.TaskRead.model_validate(response.json())
+
+    assert seen_before_commit == [False]
+    rows = await _outbox_rows(task.id)
+    assert [row.routing_key for row in rows] == ["task.created"]
+
+
+@pytest.mark.asyncio
+async def test_commit_wakes_relay_without_polling(api_client, configure_environment):
+    settings = configure_environment
+    connection = await aio_pika.connect_robust(str(settings.rabbitmq_url))
+    channel = await connection.channel()
+    exchange = await channel.declare_exchange(
+        settings.tasks_events_exchange, aio_pika.ExchangeType.TOPIC, durable=True
+    )
+    queue = await channel.declare_queue(exclusive=True)
+    await queue.bind(exchange, routing_key="task.created")
+
+    response = await api_client.post("/api/v1/tasks", json=_task_payload())
+    assert response.status_code == 201
+    task = schemas.TaskRead.model_validate(response.json())
+
+    # Well below the relay poll interval: only the after-commit wake-up can deliver it.
+    message = await queue.get(timeout=1)
+    await message.ack()
+    assert json.loads(message.body)["data"]["task_id"] == str(task.id)
+    await connection.close()
+
+
+@pytest.mark.asyncio
+async def test_outbox_row_is_rolled_back_when_request_fails(api_client, monkeypatch):
+    original = OutboxTaskEventsPublisher.task_created
+    created: list[UUID] = []
+
+    async def task_created(self, task):
+        await original(self, task)
+        created.append(task.id)
+        raise RuntimeError("request failed after the event was written")
+
+    monkeypatch.setattr(OutboxTaskEventsPublisher, "task_created", task_created)
+
+    with pytest.raises(RuntimeError):
+        await api_client.post("/api/v1/tasks", json=_task_payload())
+
+    assert len(created) == 1
+    assert not await _visible(models.Task, created[0])
+    assert await _outbox_rows(created[0]) == []
+
+
+@pytest.mark.asyncio
+async def test_queue_entries_are_written_after_commit(api_client, monkeypatch):
+    visible_at_schedule: list[tuple[str, bool]] = []
+    schedule_reminder = TaskReminderQueue.schedule
+    schedule_task = DelayedTaskQueue.schedule
+
+    async def reminder_schedule(self, reminder_id, run_at):
+        visible_at_schedule.append(("reminder", await _visible(models.TaskReminder, reminder_id)))
+        await schedule_reminder(self, reminder_id, run_at)
+
+    async def delayed_schedule(self, task_id, run_at):
+        visible_at_schedule.append(("task", await _visible(models.Task, task_id)))
+        await schedule_task(self, task_id, run_at)
+
+    monkeypatch.setattr(TaskReminderQueue, "schedule", reminder_schedule)
+    monkeypatch.setattr(DelayedTaskQueue, "schedule", delayed_schedule)
+
+    scheduled_for = (datetime.now(timezone.utc) + timedelta(hours=2)).isoformat()
+    response = await api_client.post(
+        "/api/v1/tasks",
+        json=_task_payload(initial_status="scheduled", scheduled_for=scheduled_for),
+    )
+    assert response.status_code == 201
+    task = schemas.TaskRead.model_validate(response.json())
+    assert task.status_code == schemas.TaskStatusCode.SCHEDULED
+
+    remind_at = (datetime.now(timezone.utc) + timedelta(minutes=10)).isoformat()
+    reminder_response = await api_client.post(
+        f"/api/v1/tasks/{task.id}/reminders", json={"remind_at": remind_at, "channel": "sse"}
+    )
+    assert reminder_response.status_code == 201
+    reminder_id = reminder_response.json()["id"]
+
+    assert visible_at_schedule == [("task", True), ("reminder", True)]
+    delayed_queue = get_delayed_task_queue()
+    reminder_queue = get_task_reminder_queue()
+    assert await delayed_queue.redis.zscore(delayed_queue.queue_key, str(task.id)) is not None
+    assert await reminder_queue.redis.zscore(reminder_queue.queue_key, reminder_id) is not None
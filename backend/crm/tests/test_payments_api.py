@@ -99,7 +99,7 @@ async def _prepare_payment(
 
 
 @pytest.mark.asyncio()
-async def test_payments_flow(api_client, configure_environment):
+async def test_payments_flow(api_client, configure_environment, relay_outbox):
     settings = configure_environment
     headers = {}
 
@@ -257,6 +257,7 @@ async def test_payments_flow(api_client, configure_environment):
     )
     assert missing_resp.status_code == 404
 
+    await relay_outbox()
     events = await _collect_events(events_queue)
     await channel.close()
     routing_keys = {routing for routing, _ in events}
@@ -292,7 +293,7 @@ async def test_payments_flow(api_client, configure_environment):
 
 
 @pytest.mark.asyncio()
-async def test_income_deleted_event_contains_deleted_by(api_client, configure_environment):
+async def test_income_deleted_event_contains_deleted_by(api_client, configure_environment, relay_outbox):
     settings = configure_environment
     headers, deal, policy, payment = await _prepare_payment(api_client, configure_environment)
 
@@ -331,6 +332,7 @@ async def test_income_deleted_event_contains_deleted_by(api_client, configure_en
     assert payment_after_delete.incomes_total == 0
     assert payment_after_delete.incomes == []
 
+    await relay_outbox()
     events = await _collect_events(events_queue)
     await channel.close()
     await connection.close()
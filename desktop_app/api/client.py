@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import importlib.util
 import logging
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Callable, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, TypeVar
 from uuid import UUID
 
 import httpx
@@ -12,24 +15,191 @@ from models import Client, Deal, Payment, Policy, StatCounters, Task
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_MISSING = object()
+# How often a fan-out waiting for its calls checks whether it was cancelled
+_CANCEL_POLL_SECONDS = 0.05
+_pool_thread = threading.local()
+
+
+def _mark_pool_thread() -> None:
+    _pool_thread.active = True
+
+
+def _in_pool_thread() -> bool:
+    return getattr(_pool_thread, "active", False)
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
 
 class APIClientError(RuntimeError):
     """Raised when the CRM API request fails."""
 
 
+class RequestCancelled(APIClientError):
+    """Raised when the caller cancelled a multi-request load."""
+
+
+class ResponseCache:
+    """Thread-safe short-lived cache of decoded GET responses.
+
+    Entries expire after ``ttl`` seconds; ``ttl <= 0`` disables caching. Every
+    invalidation bumps a generation counter so that a GET which started before
+    a mutation cannot store its (possibly stale) result afterwards.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable) -> Any:
+        if self._ttl <= 0:
+            return _MISSING
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            return value
+
+    def set(self, key: Hashable, value: Any, generation: int) -> None:
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+
 class APIClient:
     def __init__(
         self,
         base_url: str,
         timeout: float = 10.0,
         get_auth_header: Optional[Callable[[], dict[str, str]]] = None,
+        *,
+        max_workers: int = 8,
+        cache_ttl: float = 5.0,
+        http2: bool = True,
     ) -> None:
-        self._client = httpx.Client(base_url=base_url, timeout=timeout)
+        use_http2 = http2 and _http2_available()
+        if http2 and not use_http2:
+            logger.debug("h2 package is not installed; falling back to HTTP/1.1")
+        self._client = httpx.Client(
+            base_url=base_url,
+            timeout=timeout,
+            http2=use_http2,
+            limits=httpx.Limits(
+                max_connections=max_workers * 2,
+                max_keepalive_connections=max_workers,
+                keepalive_expiry=30.0,
+            ),
+        )
         self._get_auth_header = get_auth_header or (lambda: {})
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(max_workers, 1),
+            thread_name_prefix="api-client",
+            initializer=_mark_pool_thread,
+        )
+        self._cache = ResponseCache(cache_ttl)
+        self._inflight: dict[Hashable, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
         self._client.close()
 
+    # ----- concurrency helpers ----------------------------------------------
+    def fetch_many(
+        self,
+        calls: Iterable[Callable[[], T]],
+        *,
+        return_exceptions: bool = False,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[T | BaseException]:
+        """
+        Run independent API calls in parallel on the client's thread pool.
+
+        Args:
+            calls: Zero-argument callables, typically bound ``fetch_*`` methods
+            return_exceptions: Return raised exceptions in place of results
+                instead of re-raising the first one
+            cancelled: Polled while waiting; once it returns True calls that
+                have not started are dropped and ``RequestCancelled`` is raised
+
+        Returns:
+            Results in the same order as ``calls``
+        """
+        call_list = list(calls)
+        if len(call_list) <= 1 or _in_pool_thread():
+            # Nested fan-out from a pool thread runs inline to avoid starving the pool.
+            inline: list[T | BaseException] = []
+            for call in call_list:
+                self._check_cancelled(cancelled)
+                inline.append(self._run_call(call, return_exceptions))
+            return inline
+
+        self._check_cancelled(cancelled)
+        futures = [self._executor.submit(call) for call in call_list]
+        if cancelled is not None:
+            self._wait(futures, cancelled)
+        results: list[T | BaseException] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                if not return_exceptions:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                results.append(exc)
+        return results
+
+    @staticmethod
+    def _check_cancelled(cancelled: Optional[Callable[[], bool]]) -> None:
+        if cancelled is not None and cancelled():
+            raise RequestCancelled("Request cancelled")
+
+    @classmethod
+    def _wait(cls, futures: List[Future], cancelled: Callable[[], bool]) -> None:
+        pending = set(futures)
+        while pending:
+            if cancelled():
+                for future in pending:
+                    future.cancel()
+                cls._check_cancelled(cancelled)
+            _done, pending = wait(pending, timeout=_CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+
+    @staticmethod
+    def _run_call(call: Callable[[], T], return_exceptions: bool) -> T | BaseException:
+        try:
+            return call()
+        except Exception as exc:
+            if not return_exceptions:
+                raise
+            return exc
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached GET responses."""
+        self._cache.invalidate()
+
     # ----- internal helpers -------------------------------------------------
     def _request(
         self,
@@ -53,6 +223,21 @@ class APIClient:
         Raises:
             APIClientError: If request fails after all retries
         """
+        if method.upper() != "GET":
+            try:
+                return self._send(method, url, max_retries, **kwargs)
+            finally:
+                # Any mutation may change collections cached for other tabs.
+                self._cache.invalidate()
+        return self._send(method, url, max_retries, **kwargs)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        max_retries: int,
+        **kwargs,
+    ) -> httpx.Response:
         # Add authentication header if available
         headers = kwargs.get("headers", {})
         auth_header = self._get_auth_header()
@@ -112,7 +297,39 @@ class APIClient:
         raise APIClientError(f"Request failed after {max_retries} retries: {last_exception}") from last_exception
 
     def _get(self, url: str, params: dict | None = None) -> dict | list:
-        return self._request("GET", url, params=params).json()
+        """
+        GET a JSON document through the shared cache.
+
+        Identical GETs issued while one is already in flight wait for that
+        request instead of hitting the API again.
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(key)
+        if cached is not _MISSING:
+            return cached
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+        if not is_leader:
+            return future.result()
+
+        generation = self._cache.generation
+        try:
+            data = self._request("GET", url, params=params).json()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            self._cache.set(key, data, generation)
+            future.set_result(data)
+            return data
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
 
     # ----- public API: clients ---------------------------------------------
     def fetch_clients(self) -> List[Client]:
@@ -191,6 +408,12 @@ class APIClient:
         data = self._get("/tasks")
         return [Task.model_validate(item) for item in data if item.get("status") != "cancelled"]
 
+    def fetch_tasks_page(self, limit: int, offset: int = 0) -> tuple[List[Task], bool]:
+        """Fetch one page of tasks; the flag tells whether another page may follow."""
+        data = self._get("/tasks", params={"limit": limit, "offset": offset})
+        tasks = [Task.model_validate(item) for item in data if item.get("status") != "cancelled"]
+        return tasks, len(data) >= limit
+
     def fetch_payments(self, deal_id: UUID, policy_id: UUID) -> List[Payment]:
         path = f"/deals/{deal_id}/policies/{policy_id}/payments"
         data = self._get(path)
@@ -223,23 +446,38 @@ class APIClient:
         path = f"/deals/{deal_id}/policies/{policy_id}/payments/{payment_id}"
         self._request("DELETE", path)
 
-    def fetch_payments_for_policies(self, policies: Iterable[Policy]) -> List[Payment]:
+    def fetch_payments_for_policies(
+        self,
+        policies: Iterable[Policy],
+        *,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[Payment]:
+        linked = [policy for policy in policies if policy.deal_id]
+        results = self.fetch_many(
+            (
+                lambda policy=policy: self.fetch_payments(policy.deal_id, policy.id)
+                for policy in linked
+            ),
+            return_exceptions=True,
+            cancelled=cancelled,
+        )
         payments: list[Payment] = []
-        for policy in policies:
-            if not policy.deal_id:
-                continue
-            try:
-                payments.extend(self.fetch_payments(policy.deal_id, policy.id))
-            except APIClientError:
+        for result in results:
+            if isinstance(result, RequestCancelled):
+                raise result
+            if isinstance(result, APIClientError):
                 continue
+            if isinstance(result, BaseException):
+                raise result
+            payments.extend(result)
         return payments
 
     # ----- derived stats ---------------------------------------------------
-    def fetch_stats(self) -> StatCounters:
-        clients = self.fetch_clients()
-        deals = self.fetch_deals()
-        policies = self.fetch_policies()
-        tasks = self.fetch_tasks()
+    def fetch_stats(self, *, cancelled: Optional[Callable[[], bool]] = None) -> StatCounters:
+        clients, deals, policies, tasks = self.fetch_many(
+            [self.fetch_clients, self.fetch_deals, self.fetch_policies, self.fetch_tasks],
+            cancelled=cancelled,
+        )
         return StatCounters(
             clients=len(clients),
             deals=len(deals),
@@ -8,6 +8,13 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 
+def _default_stream_url(api_base_url: str) -> str:
+    # The gateway relays the CRM SSE stream at /api/v1/streams/crm
+    if api_base_url.endswith("/crm"):
+        return f"{api_base_url[: -len('/crm')]}/streams/crm"
+    return f"{api_base_url}/streams"
+
+
 def _normalize_base_url(raw_url: str | None) -> str:
     if not raw_url:
         return "http://localhost:8080/api/v1/crm"
@@ -23,6 +30,12 @@ class Settings:
     api_base_url: str = "http://localhost:8080/api/v1/crm"
     auth_base_url: str = "http://localhost:8080/api/v1/auth"
     api_timeout: float = 10.0
+    api_max_workers: int = 8
+    api_cache_ttl: float = 5.0
+    api_http2: bool = True
+    local_store_path: str | None = None
+    stream_url: str | None = None
+    stream_poll_interval: float = 60.0
     log_level: str = "INFO"
     journal_author_id: str | None = None
 
@@ -41,11 +54,37 @@ def get_settings(env_path: Path | None = None) -> Settings:
         api_timeout = float(timeout_env)
     except ValueError:
         api_timeout = 10.0
+    try:
+        api_max_workers = max(int(os.getenv("DESKTOP_API_MAX_WORKERS", "8")), 1)
+    except ValueError:
+        api_max_workers = 8
+    try:
+        api_cache_ttl = max(float(os.getenv("DESKTOP_API_CACHE_TTL", "5")), 0.0)
+    except ValueError:
+        api_cache_ttl = 5.0
+
+    local_store_path = os.getenv("DESKTOP_LOCAL_STORE", str(Path.home() / ".crm_desktop" / "replica.sqlite3"))
+    if local_store_path.strip().lower() in {"", "0", "off", "false", "none"}:
+        local_store_path = None
+
+    stream_url = os.getenv("DESKTOP_STREAM_URL", _default_stream_url(api_base_url)).rstrip("/")
+    if stream_url.strip().lower() in {"", "0", "off", "false", "none"}:
+        stream_url = None
+    try:
+        stream_poll_interval = max(float(os.getenv("DESKTOP_STREAM_POLL_INTERVAL", "60")), 5.0)
+    except ValueError:
+        stream_poll_interval = 60.0
 
     settings = Settings(
         api_base_url=api_base_url,
         auth_base_url=auth_base_url,
         api_timeout=api_timeout,
+        api_max_workers=api_max_workers,
+        api_cache_ttl=api_cache_ttl,
+        api_http2=os.getenv("DESKTOP_API_HTTP2", "true").lower() not in {"0", "false", "no"},
+        local_store_path=local_store_path,
+        stream_url=stream_url,
+        stream_poll_interval=stream_poll_interval,
         log_level=os.getenv("DESKTOP_LOG_LEVEL", "INFO").upper(),
         journal_author_id=os.getenv("DESKTOP_JOURNAL_AUTHOR_ID"),
     )
@@ -1,13 +1,32 @@
 from __future__ import annotations
 
+import logging
+import sqlite3
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Optional
+from typing import Callable, Dict, Iterable, List, Optional
 from uuid import UUID
 
+from pydantic import BaseModel
+
 from api.client import APIClient
 from config import Settings, get_settings
 from core.auth_service import AuthService
-from models import Client, Deal, Policy, Task
+from core.live_updates import LiveUpdate
+from core.local_store import LocalStore, StoreWriter
+from models import Client, Deal, Payment, Policy, Task
+
+logger = logging.getLogger(__name__)
+
+# DataCache attribute -> model stored in the local replica
+_STORED_MODELS: Dict[str, type[BaseModel]] = {
+    "clients": Client,
+    "deals": Deal,
+    "policies": Policy,
+    "payments": Payment,
+    "tasks": Task,
+}
 
 
 @dataclass(slots=True)
@@ -16,6 +35,19 @@ class DataCache:
     deals: Dict[UUID, Deal] = field(default_factory=dict)
     policies: Dict[UUID, Policy] = field(default_factory=dict)
     tasks: Dict[UUID, Task] = field(default_factory=dict)
+    payments: Dict[UUID, Payment] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Snapshot:
+    """Full API download produced by :meth:`AppContext.reconcile`.
+
+    ``generation`` is the cache generation when the download started;
+    records changed locally after it are newer than the snapshot.
+    """
+
+    records: Dict[str, List[BaseModel]]
+    generation: int
 
 
 class AppContext:
@@ -29,25 +61,173 @@ class AppContext:
             base_url=self.settings.api_base_url,
             timeout=self.settings.api_timeout,
             get_auth_header=self.auth_service.get_auth_header,
+            max_workers=self.settings.api_max_workers,
+            cache_ttl=self.settings.api_cache_ttl,
+            http2=self.settings.api_http2,
         )
         self.cache = DataCache()
+        # Generation of the last local change per record, see ``Snapshot``
+        self._generation = 0
+        self._touched: Dict[str, Dict[UUID, int]] = {kind: {} for kind in _STORED_MODELS}
+        self._touched_lock = threading.Lock()
+        self.store = self._open_store()
+        self._writer: StoreWriter | None = None
+        if self.store is not None:
+            self._writer = StoreWriter()
+            self.hydrate()
 
     # ----- caching helpers --------------------------------------------------
     def update_clients(self, clients: Iterable[Client]) -> None:
-        for client in clients:
-            self.cache.clients[client.id] = client
+        self._update("clients", clients)
 
     def update_deals(self, deals: Iterable[Deal]) -> None:
-        for deal in deals:
-            self.cache.deals[deal.id] = deal
+        self._update("deals", deals)
 
     def update_policies(self, policies: Iterable[Policy]) -> None:
-        for policy in policies:
-            self.cache.policies[policy.id] = policy
+        self._update("policies", policies)
 
     def update_tasks(self, tasks: Iterable[Task]) -> None:
-        for task in tasks:
-            self.cache.tasks[task.id] = task
+        self._update("tasks", tasks)
+
+    def update_payments(self, payments: Iterable[Payment]) -> None:
+        self._update("payments", payments)
+
+    def _update(self, kind: str, items: Iterable[BaseModel]) -> None:
+        items = list(items)
+        cache = getattr(self.cache, kind)
+        for item in items:
+            cache[item.id] = item  # type: ignore[attr-defined]
+        self._touch(kind, [item.id for item in items])  # type: ignore[attr-defined]
+        if self._writer is not None and items:
+            self._writer.submit(self.store.upsert, kind, items)  # type: ignore[union-attr]
+
+    def apply_live_update(self, update: LiveUpdate) -> None:
+        """Apply a row-level patch received from the event stream."""
+        if update.updated:
+            self._update(update.kind, update.updated)
+        if update.removed:
+            cache = getattr(self.cache, update.kind)
+            for item_id in update.removed:
+                cache.pop(item_id, None)
+            self._touch(update.kind, update.removed)
+            if self._writer is not None:
+                self._writer.submit(self.store.delete, update.kind, update.removed)  # type: ignore[union-attr]
+
+    def _touch(self, kind: str, ids: Iterable[UUID]) -> None:
+        touched = self._touched.get(kind)
+        if touched is None:
+            return
+        with self._touched_lock:
+            self._generation += 1
+            for item_id in ids:
+                touched[item_id] = self._generation
+
+    def _touched_since(self, kind: str, generation: int) -> set[UUID]:
+        with self._touched_lock:
+            return {item_id for item_id, touched in self._touched[kind].items() if touched > generation}
+
+    # ----- local replica ----------------------------------------------------
+    def _open_store(self) -> LocalStore | None:
+        path = self.settings.local_store_path
+        if not path:
+            return None
+        try:
+            return LocalStore(path)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Local store %s is unavailable, running without it: %s", path, exc)
+            return None
+
+    def hydrate(self) -> None:
+        """Fill the in-memory cache from the local replica."""
+        if self.store is None:
+            return
+        started = time.perf_counter()
+        for kind, model in _STORED_MODELS.items():
+            cache = getattr(self.cache, kind)
+            for item in self.store.load(kind, model):
+                cache[item.id] = item  # type: ignore[attr-defined]
+        logger.info(
+            "Hydrated cache from local store in %.0f ms",
+            (time.perf_counter() - started) * 1000,
+        )
+
+    def reconcile(self, *, cancelled: Optional[Callable[[], bool]] = None) -> Snapshot:
+        """Download full snapshots and bring the local replica in line with them.
+
+        Runs in a worker thread; the returned snapshot is merged into the
+        in-memory cache on the UI thread via :meth:`apply_snapshot`. Records
+        changed locally or by live updates while the download was running
+        are newer than the snapshot and are left alone.
+
+        Args:
+            cancelled: Polled between requests; a cancelled reconcile raises
+                ``RequestCancelled`` and leaves the replica untouched
+        """
+        with self._touched_lock:
+            generation = self._generation
+        api = self.api
+        clients, deals, policies, tasks = api.fetch_many(
+            [api.fetch_clients, api.fetch_deals, api.fetch_policies, api.fetch_tasks],
+            cancelled=cancelled,
+        )
+        payments = api.fetch_payments_for_policies(policies, cancelled=cancelled)
+        snapshot = Snapshot(
+            records={
+                "clients": clients,
+                "deals": deals,
+                "policies": policies,
+                "payments": payments,
+                "tasks": tasks,
+            },
+            generation=generation,
+        )
+        if self.store is not None and self._writer is not None:
+            synced_at = time.time()
+            for kind, items in snapshot.records.items():
+                # Queued behind pending upserts so they cannot overwrite the snapshot;
+                # newer rows are looked up when the writer gets to it.
+                changed = self._writer.submit(self._replace_stored, kind, items, snapshot, synced_at).result()
+                if changed:
+                    logger.info("Local store: %d %s rows changed", changed, kind)
+        return snapshot
+
+    def _replace_stored(self, kind: str, items: List[BaseModel], snapshot: Snapshot, synced_at: float) -> int:
+        keep = self._touched_since(kind, snapshot.generation)
+        return self.store.replace(kind, items, synced_at=synced_at, keep=keep)  # type: ignore[union-attr]
+
+    def apply_snapshot(self, snapshot: Snapshot) -> None:
+        """Merge a reconcile snapshot into the cache, keeping newer records."""
+        for kind, items in snapshot.records.items():
+            cache = getattr(self.cache, kind)
+            newer = self._touched_since(kind, snapshot.generation)
+            fresh = {item.id: item for item in items if item.id not in newer}  # type: ignore[attr-defined]
+            for item_id in [item_id for item_id in cache if item_id not in fresh and item_id not in newer]:
+                del cache[item_id]
+            cache.update(fresh)
+
+    def flush_store(self) -> None:
+        """Wait until queued local store writes have been applied."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def search(self, kind: str, text: str, *, limit: int = 200) -> List[BaseModel]:
+        """Search cached records of ``kind`` by their text fields.
+
+        The local index trails the cache by the writes still queued.
+        """
+        cache = getattr(self.cache, kind)
+        if self.store is not None:
+            ids = self.store.search(kind, text, limit=limit)
+            return [cache[item_id] for item_id in ids if item_id in cache]
+        words = text.lower().split()
+        matches = []
+        for item in cache.values():
+            haystack = " ".join(value for value in item.__dict__.values() if isinstance(value, str)).lower()
+            if all(word in haystack for word in words):
+                matches.append(item)
+                if len(matches) >= limit:
+                    break
+        return matches
 
     # ----- lookup -----------------------------------------------------------
     def get_client_name(self, client_id: Optional[UUID]) -> str:
@@ -102,6 +282,10 @@ class AppContext:
     def close(self) -> None:
         self.api.close()
         self.auth_service.close()
+        if self._writer is not None:
+            self._writer.close()
+        if self.store is not None:
+            self.store.close()
 
 
 _GLOBAL_CONTEXT: AppContext | None = None
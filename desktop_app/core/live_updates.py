@@ -0,0 +1,162 @@
+"""Parsing of CRM server-sent events into cache patches."""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ValidationError
+
+from models import Client, Deal, Payment, Policy, Task
+
+if TYPE_CHECKING:
+    from core.app_context import DataCache
+
+logger = logging.getLogger(__name__)
+
+# Entity events carry the full record under one of these keys
+_ENTITY_MODELS: Dict[str, tuple[str, type[BaseModel]]] = {
+    "client": ("clients", Client),
+    "deal": ("deals", Deal),
+    "policy": ("policies", Policy),
+    "payment": ("payments", Payment),
+    "task": ("tasks", Task),
+}
+
+
+@dataclass(slots=True)
+class SSEMessage:
+    event: str
+    data: str
+    id: Optional[str] = None
+
+
+class SSEParser:
+    """Incremental ``text/event-stream`` parser fed one line at a time."""
+
+    def __init__(self) -> None:
+        self._event = ""
+        self._data: list[str] = []
+        self._id: Optional[str] = None
+        self.last_event_id: Optional[str] = None
+
+    def feed(self, line: str) -> Optional[SSEMessage]:
+        """Consume a line; return a message when a blank line completes one."""
+        if not line:
+            if not self._data and not self._event:
+                return None
+            message = SSEMessage(event=self._event or "message", data="\n".join(self._data), id=self._id)
+            if self._id is not None:
+                self.last_event_id = self._id
+            self._event, self._data, self._id = "", [], None
+            return message
+        if line.startswith(":"):
+            return None
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "event":
+            self._event = value
+        elif name == "data":
+            self._data.append(value)
+        elif name == "id":
+            self._id = value
+        return None
+
+
+@dataclass(slots=True)
+class LiveUpdate:
+    """Row-level change for one ``DataCache`` collection."""
+
+    kind: str
+    updated: List[BaseModel] = field(default_factory=list)
+    removed: List[UUID] = field(default_factory=list)
+
+
+def parse_event(event: str, data: str, cache: "DataCache") -> Optional[LiveUpdate]:
+    """Translate an SSE message into a cache patch.
+
+    Returns ``None`` for heartbeats and events the desktop does not mirror
+    (calculations, journal entries, reminders).
+    """
+    if event in ("heartbeat", "ping") or not data:
+        return None
+    try:
+        payload = json.loads(data)
+    except ValueError:
+        logger.debug("Ignoring non-JSON event %s", event)
+        return None
+    if not isinstance(payload, dict):
+        return None
+
+    # Task events are CloudEvents envelopes published under the tasks.* types.
+    if isinstance(payload.get("type"), str) and isinstance(payload.get("data"), dict):
+        event, payload = payload["type"], payload["data"]
+
+    try:
+        if event.startswith("deal.payment."):
+            return _payment_update(event, payload)
+        if event.startswith("tasks.task.") or event.startswith("task."):
+            return _task_update(event, payload, cache)
+        return _entity_update(event, payload)
+    except (ValidationError, ValueError, KeyError, TypeError) as exc:
+        logger.debug("Cannot apply event %s: %s", event, exc)
+        return None
+
+
+def _payment_update(event: str, payload: Dict[str, Any]) -> Optional[LiveUpdate]:
+    if event == "deal.payment.deleted":
+        return LiveUpdate("payments", removed=[UUID(payload["payment_id"])])
+    if event in ("deal.payment.created", "deal.payment.updated"):
+        return LiveUpdate("payments", updated=[Payment.model_validate(payload["payment"])])
+    # Income/expense events are followed by deal.payment.updated with new totals.
+    return None
+
+
+def _task_update(event: str, payload: Dict[str, Any], cache: "DataCache") -> Optional[LiveUpdate]:
+    task_id = UUID(payload["task_id"])
+    if event.endswith("status_changed") or event.endswith("status.changed"):
+        task = cache.tasks.get(task_id)
+        if task is None:
+            return None
+        if payload.get("new_status") == "cancelled":
+            return LiveUpdate("tasks", removed=[task_id])
+        changes: Dict[str, Any] = {"status_code": payload.get("new_status"), "status_name": None}
+        if payload.get("changed_at"):
+            changes["updated_at"] = datetime.fromisoformat(payload["changed_at"])
+        return LiveUpdate("tasks", updated=[task.model_copy(update=changes)])
+    if event.endswith("created"):
+        context = payload.get("context") or {}
+        task = Task(
+            id=task_id,
+            title=payload.get("subject") or "",
+            status_code=payload.get("status"),
+            due_at=payload.get("due_date"),
+            assignee_id=payload.get("assignee_id"),
+            author_id=payload.get("author_id"),
+            deal_id=context.get("deal_id"),
+            policy_id=context.get("policy_id"),
+        )
+        return LiveUpdate("tasks", updated=[task])
+    return None
+
+
+def _entity_update(event: str, payload: Dict[str, Any]) -> Optional[LiveUpdate]:
+    parts = event.split(".")
+    for key in reversed(parts[:-1]):
+        if key in _ENTITY_MODELS:
+            kind, model = _ENTITY_MODELS[key]
+            break
+    else:
+        return None
+    if parts[-1] == "deleted":
+        raw_id = payload.get(f"{key}_id") or payload.get("id")
+        return LiveUpdate(kind, removed=[UUID(str(raw_id))]) if raw_id else None
+    record = payload.get(key)
+    if not isinstance(record, dict):
+        return None
+    return LiveUpdate(kind, updated=[model.model_validate(record)])
@@ -0,0 +1,275 @@
+"""Persistent SQLite replica of CRM data for offline startup."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Collection, Iterable, Iterator, List, Sequence, Type, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    row_id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    search_text TEXT NOT NULL DEFAULT '',
+    UNIQUE (kind, id)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    kind TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    row_count INTEGER NOT NULL
+);
+"""
+
+# External-content index keyed by ``entities.row_id``: triggers maintain it
+# through the FTS5 'delete' command, so no trigger scans the index.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entities_fts USING fts5(
+    search_text, content = 'entities', content_rowid = 'row_id', tokenize = 'unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS entities_ai AFTER INSERT ON entities BEGIN
+    INSERT INTO entities_fts (rowid, search_text) VALUES (new.row_id, new.search_text);
+END;
+CREATE TRIGGER IF NOT EXISTS entities_ad AFTER DELETE ON entities BEGIN
+    INSERT INTO entities_fts (entities_fts, rowid, search_text) VALUES ('delete', old.row_id, old.search_text);
+END;
+CREATE TRIGGER IF NOT EXISTS entities_au AFTER UPDATE OF search_text ON entities BEGIN
+    INSERT INTO entities_fts (entities_fts, rowid, search_text) VALUES ('delete', old.row_id, old.search_text);
+    INSERT INTO entities_fts (rowid, search_text) VALUES (new.row_id, new.search_text);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO entities (kind, id, payload, search_text) VALUES (?, ?, ?, ?)
+ON CONFLICT (kind, id) DO UPDATE SET payload = excluded.payload, search_text = excluded.search_text
+WHERE entities.payload != excluded.payload
+"""
+
+
+def _search_text(model: BaseModel) -> str:
+    values = (value for value in model.__dict__.values() if isinstance(value, str) and value)
+    return " ".join(values).lower()
+
+
+class LocalStore:
+    """SQLite (WAL) mirror of the records shown in the desktop tabs.
+
+    Records are stored as JSON payloads keyed by ``(kind, id)`` where ``kind``
+    is the ``DataCache`` attribute name (``clients``, ``deals`` ...). Writes
+    only touch rows whose payload changed, so re-saving a full API snapshot
+    is cheap. Text search goes through an FTS5 index when SQLite provides it
+    and falls back to ``LIKE`` otherwise.
+
+    The connection is shared between the UI thread (reads), workers and the
+    :class:`StoreWriter` thread and guarded by a lock.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self._path = Path(path)
+        if str(path) != ":memory:":
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._check_version()
+        self._conn.executescript(_SCHEMA)
+        self._fts = self._init_fts()
+        self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def _init_fts(self) -> bool:
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            logger.info("SQLite FTS5 is not available, local search falls back to LIKE")
+            return False
+        return True
+
+    def _check_version(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version == SCHEMA_VERSION:
+            return
+        if version:
+            # The replica is only a cache of the API: rebuild it from scratch.
+            logger.info("Local store schema %s is outdated, clearing replica", version)
+            self._conn.executescript(
+                """
+                DROP TABLE IF EXISTS entities_fts;
+                DROP TABLE IF EXISTS entities;
+                DROP TABLE IF EXISTS sync_state;
+                """
+            )
+
+    # ----- reads ------------------------------------------------------------
+    def load(self, kind: str, model: Type[ModelT]) -> List[ModelT]:
+        """Return all stored records of ``kind``; unreadable rows are skipped."""
+        with self._lock:
+            rows = self._conn.execute("SELECT payload FROM entities WHERE kind = ?", (kind,)).fetchall()
+        items: List[ModelT] = []
+        for (payload,) in rows:
+            try:
+                items.append(model.model_validate_json(payload))
+            except ValueError:
+                logger.debug("Skipping unreadable %s record in local store", kind)
+        return items
+
+    def search(self, kind: str, text: str, *, limit: int = 200) -> List[UUID]:
+        """Return ids of ``kind`` records whose text fields contain every word of ``text``."""
+        words = [word for word in text.lower().split() if word]
+        if not words:
+            return []
+        with self._lock:
+            if self._fts:
+                query = " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+                rows = self._conn.execute(
+                    "SELECT e.id FROM entities_fts JOIN entities e ON e.row_id = entities_fts.rowid "
+                    "WHERE entities_fts MATCH ? AND e.kind = ? LIMIT ?",
+                    (query, kind, limit),
+                ).fetchall()
+            else:
+                clause = " AND ".join("search_text LIKE ?" for _ in words)
+                rows = self._conn.execute(
+                    f"SELECT id FROM entities WHERE kind = ? AND {clause} LIMIT ?",
+                    (kind, *(f"%{word}%" for word in words), limit),
+                ).fetchall()
+        return [UUID(row[0]) for row in rows]
+
+    def synced_at(self, kind: str) -> float | None:
+        """Timestamp of the last full snapshot saved for ``kind``."""
+        with self._lock:
+            row = self._conn.execute("SELECT synced_at FROM sync_state WHERE kind = ?", (kind,)).fetchone()
+        return row[0] if row else None
+
+    # ----- writes -----------------------------------------------------------
+    def upsert(self, kind: str, items: Iterable[BaseModel]) -> None:
+        """Insert or update records; rows with an unchanged payload are not rewritten."""
+        rows = self._rows(kind, items)
+        if not rows:
+            return
+        with self._lock, self._transaction():
+            self._conn.executemany(_UPSERT, rows)
+
+    def replace(
+        self,
+        kind: str,
+        items: Iterable[BaseModel],
+        *,
+        synced_at: float,
+        keep: Collection[UUID] = (),
+    ) -> int:
+        """Make the stored ``kind`` records match a full API snapshot.
+
+        Args:
+            kind: Record kind
+            items: Full snapshot of the records
+            synced_at: Time the snapshot was taken
+            keep: Ids whose stored rows are newer than the snapshot and are left as they are
+
+        Returns:
+            Number of rows inserted, updated or deleted
+        """
+        kept = {str(item_id) for item_id in keep}
+        rows = [row for row in self._rows(kind, items) if row[1] not in kept]
+        with self._lock, self._transaction():
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS snapshot_ids (id TEXT PRIMARY KEY)")
+            self._conn.execute("DELETE FROM snapshot_ids")
+            self._conn.executemany("INSERT OR IGNORE INTO snapshot_ids (id) VALUES (?)", ((row[1],) for row in rows))
+            self._conn.executemany("INSERT OR IGNORE INTO snapshot_ids (id) VALUES (?)", ((item_id,) for item_id in kept))
+            changed = self._conn.executemany(_UPSERT, rows).rowcount if rows else 0
+            changed += self._conn.execute(
+                "DELETE FROM entities WHERE kind = ? AND id NOT IN (SELECT id FROM snapshot_ids)",
+                (kind,),
+            ).rowcount
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (kind, synced_at, row_count) VALUES (?, ?, ?)",
+                (kind, synced_at, len(rows)),
+            )
+        return changed
+
+    def delete(self, kind: str, ids: Sequence[UUID]) -> None:
+        with self._lock, self._transaction():
+            self._conn.executemany(
+                "DELETE FROM entities WHERE kind = ? AND id = ?",
+                ((kind, str(item_id)) for item_id in ids),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ----- internals --------------------------------------------------------
+    @staticmethod
+    def _rows(kind: str, items: Iterable[BaseModel]) -> list[tuple[str, str, str, str]]:
+        return [
+            (kind, str(item.id), item.model_dump_json(by_alias=True), _search_text(item))  # type: ignore[attr-defined]
+            for item in items
+        ]
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+
+class StoreWriter:
+    """Runs local store writes on a dedicated thread, in submission order.
+
+    Keeps SQLite off the UI thread: callers update their in-memory state
+    and hand the write over. Failed writes are logged; the replica is only
+    a cache and the next reconciliation repairs it.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.SimpleQueue[tuple[Callable[[], Any], Future[Any]] | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="local-store-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Future[Any]:
+        """Queue ``func(*args, **kwargs)``; the future resolves once it has run."""
+        future: Future[Any] = Future()
+        self._queue.put((lambda: func(*args, **kwargs), future))
+        return future
+
+    def flush(self) -> None:
+        """Block until every write submitted so far has been applied."""
+        self.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """Apply pending writes and stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            call, future = job
+            try:
+                future.set_result(call())
+            except sqlite3.Error as exc:
+                logger.warning("Local store write failed: %s", exc)
+                future.set_exception(exc)
+            except BaseException as exc:  # noqa: BLE001 - reported through the future
+                logger.exception("Local store write failed")
+                future.set_exception(exc)
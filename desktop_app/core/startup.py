@@ -0,0 +1,65 @@
+"""Startup timeline for measuring time to login dialog and first usable screen."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# Process-relative origin: this module is imported first by main.py
+_ORIGIN = time.perf_counter()
+
+
+class StartupTimeline:
+    """Collects named startup phases and logs them once startup is complete.
+
+    Marks are always recorded (a ``perf_counter`` call each); the timeline is
+    logged only when ``DESKTOP_STARTUP_PROFILE`` is set, after ``.env`` has been
+    loaded by ``get_settings``.
+    """
+
+    def __init__(self, origin: float = _ORIGIN) -> None:
+        self._origin = origin
+        self._marks: list[tuple[str, float]] = []
+        self._finished = False
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.getenv("DESKTOP_STARTUP_PROFILE", "").lower() in {"1", "true", "yes"}
+
+    def mark(self, phase: str) -> None:
+        """Record ``phase`` once; later marks with the same name are ignored."""
+        if self._finished or any(name == phase for name, _ in self._marks):
+            return
+        self._marks.append((phase, time.perf_counter()))
+
+    def finish(self, phase: str | None = None) -> None:
+        """Record the final ``phase`` and log the timeline if profiling is enabled."""
+        if self._finished:
+            return
+        if phase is not None:
+            self.mark(phase)
+        self._finished = True
+        if not self.enabled():
+            return
+        previous = self._origin
+        for name, moment in self._marks:
+            logger.info(
+                "Startup %-16s %7.0f ms (+%.0f ms)",
+                name,
+                (moment - self._origin) * 1000,
+                (moment - previous) * 1000,
+            )
+            previous = moment
+
+    def elapsed(self, phase: str) -> float | None:
+        """Seconds from process start to ``phase``, if recorded."""
+        for name, moment in self._marks:
+            if name == phase:
+                return moment - self._origin
+        return None
+
+
+timeline = StartupTimeline()
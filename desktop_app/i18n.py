@@ -155,6 +155,7 @@ TRANSLATIONS: Dict[str, str] = {
     "Выбор строки": "Выбор строки",
     "Выберите запись для изменения.": "Выберите запись для изменения.",
     "Выберите запись для удаления.": "Выберите запись для удаления.",
+    "Search...": "Поиск...",
 }
 
 
@@ -1,51 +1,74 @@
 from __future__ import annotations
 
+from core.startup import timeline  # noqa: I001 - first import, anchors the startup timeline
+
 import sys
+import threading
+from importlib import import_module
 from pathlib import Path
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 
 from config import get_settings
-from core.app_context import get_app_context, init_app_context
-from core.auth_service import AuthService
 from logging_config import configure_logging
 from ui.dialogs.login_dialog import LoginDialog
-from ui.main_window import MainWindow
 
 ROOT_DIR = Path(__file__).resolve().parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+# Imported while the login dialog is open instead of before it is shown
+_DEFERRED_MODULES = ("core.auth_service", "core.app_context")
+
 
 def main() -> int:
+    timeline.mark("imports")
     settings = get_settings()
     configure_logging(settings)
 
     app = QApplication.instance() or QApplication(sys.argv)
     _apply_application_style(app)
 
-    # Create authentication service
-    auth_service = AuthService(
-        base_url=settings.auth_base_url,
-        timeout=settings.api_timeout,
-    )
+    def create_auth_service():
+        from core.auth_service import AuthService
+
+        return AuthService(base_url=settings.auth_base_url, timeout=settings.api_timeout)
 
     # Show login dialog
-    login_dialog = LoginDialog(auth_service=auth_service)
+    login_dialog = LoginDialog(auth_service_factory=create_auth_service)
+    login_dialog.show()
+    timeline.mark("login_dialog")
+    _preload_modules()
     if login_dialog.exec() != login_dialog.DialogCode.Accepted:
         # User cancelled login
         return 0
+    timeline.mark("login_accepted")
+
+    from core.app_context import get_app_context, init_app_context
+    from ui.main_window import MainWindow
 
     # Initialize app context with authenticated auth service
-    init_app_context(settings, auth_service)
+    init_app_context(settings, login_dialog.get_auth_service())
     context = get_app_context()
 
     # Show main window
     window = MainWindow(context=context)
+    window.first_data_loaded.connect(lambda: timeline.finish("first_data"))  # type: ignore[arg-type]
     window.show()
+    QTimer.singleShot(0, lambda: timeline.mark("first_paint"))
     return app.exec()
 
 
+def _preload_modules() -> None:
+    """Import the HTTP stack in the background while the user types credentials."""
+
+    def preload() -> None:
+        for name in _DEFERRED_MODULES:
+            import_module(name)
+
+    threading.Thread(target=preload, name="preload-imports", daemon=True).start()
+
 
 def _apply_application_style(app: QApplication) -> None:
     resources_dir = Path(__file__).resolve().parent / "resources"
@@ -59,5 +82,3 @@ def _apply_application_style(app: QApplication) -> None:
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
-
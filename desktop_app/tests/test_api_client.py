@@ -7,7 +7,7 @@ from unittest.mock import Mock, patch
 import httpx
 import pytest
 
-from api.client import APIClient, APIClientError
+from api.client import APIClient, APIClientError, RequestCancelled
 from models import Client, Deal
 
 
@@ -85,6 +85,25 @@ class TestAPIClient:
         assert result[0].title == "Test Deal"
         mock_request.assert_called_once_with("GET", "/deals", params=None)
 
+    @patch("api.client.APIClient._request")
+    def test_api_client_fetch_tasks_page(self, mock_request: Mock) -> None:
+        """Test fetch_tasks_page sends paging params and reports further pages."""
+        from uuid import uuid4
+
+        mock_response = Mock()
+        mock_response.json.return_value = [
+            {"id": str(uuid4()), "title": "Open", "status": "pending"},
+            {"id": str(uuid4()), "title": "Cancelled", "status": "cancelled"},
+        ]
+        mock_request.return_value = mock_response
+
+        client = APIClient(base_url="http://localhost:8000")
+        tasks, has_more = client.fetch_tasks_page(2, 4)
+
+        assert [task.title for task in tasks] == ["Open"]
+        assert has_more is True
+        mock_request.assert_called_once_with("GET", "/tasks", params={"limit": 2, "offset": 4})
+
     @patch("api.client.APIClient._request")
     def test_api_client_create_client(self, mock_request: Mock) -> None:
         """Test create_client makes correct API request."""
@@ -274,3 +293,117 @@ class TestAPIClient:
         client = APIClient(base_url="http://localhost:8000")
         client.close()
         # Should not raise
+
+
+class TestAPIClientConcurrency:
+    """Test parallel fetches, GET coalescing and the response cache."""
+
+    @staticmethod
+    def _json_response(data: dict | list) -> Mock:
+        response = Mock()
+        response.json.return_value = data
+        return response
+
+    def test_fetch_many_preserves_order(self) -> None:
+        """Test fetch_many returns results in call order."""
+        import time as real_time
+
+        client = APIClient(base_url="http://localhost:8000")
+
+        def slow() -> str:
+            real_time.sleep(0.05)
+            return "slow"
+
+        assert client.fetch_many([slow, lambda: "fast"]) == ["slow", "fast"]
+        client.close()
+
+    def test_fetch_many_return_exceptions(self) -> None:
+        """Test fetch_many can collect failures instead of raising."""
+        client = APIClient(base_url="http://localhost:8000")
+
+        def failing() -> None:
+            raise APIClientError("boom")
+
+        results = client.fetch_many([failing, lambda: 1], return_exceptions=True)
+
+        assert isinstance(results[0], APIClientError)
+        assert results[1] == 1
+        with pytest.raises(APIClientError):
+            client.fetch_many([failing, lambda: 1])
+        client.close()
+
+    def test_fetch_many_stops_waiting_when_cancelled(self) -> None:
+        """Test a cancelled fan-out raises at once and drops calls that have not started."""
+        import threading
+
+        client = APIClient(base_url="http://localhost:8000", max_workers=1)
+        release = threading.Event()
+        cancelled = threading.Event()
+        started: list[int] = []
+
+        def blocking() -> None:
+            started.append(1)
+            release.wait(5)
+
+        def never() -> None:
+            started.append(2)
+
+        timer = threading.Timer(0.05, cancelled.set)
+        timer.start()
+        with pytest.raises(RequestCancelled):
+            client.fetch_many([blocking, never], cancelled=cancelled.is_set)
+        release.set()
+        client.close()
+
+        assert started == [1]
+
+    @patch("api.client.APIClient._request")
+    def test_identical_gets_are_coalesced(self, mock_request: Mock) -> None:
+        """Test concurrent identical GETs share one HTTP request."""
+        import threading
+
+        release = threading.Event()
+
+        def delayed_request(*args, **kwargs) -> Mock:
+            release.wait(timeout=2)
+            return self._json_response([])
+
+        mock_request.side_effect = delayed_request
+        client = APIClient(base_url="http://localhost:8000", cache_ttl=0)
+
+        threads = [threading.Thread(target=client._get, args=("/clients",)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert mock_request.call_count == 1
+        client.close()
+
+    @patch("api.client.APIClient._send")
+    def test_cache_serves_repeat_gets_until_mutation(self, mock_send: Mock) -> None:
+        """Test cached GETs are reused and dropped after a write."""
+        mock_send.return_value = self._json_response([])
+        client = APIClient(base_url="http://localhost:8000", cache_ttl=60)
+
+        client._get("/clients")
+        client._get("/clients")
+        assert mock_send.call_count == 1
+
+        client._request("POST", "/clients", json={"name": "New"})
+        client._get("/clients")
+        assert mock_send.call_count == 3
+        client.close()
+
+    @patch("api.client.APIClient._send")
+    def test_cache_disabled_with_zero_ttl(self, mock_send: Mock) -> None:
+        """Test cache_ttl=0 always hits the API."""
+        mock_send.return_value = self._json_response([])
+        client = APIClient(base_url="http://localhost:8000", cache_ttl=0)
+
+        client._get("/deals")
+        client._get("/deals")
+
+        assert mock_send.call_count == 2
+        client.close()
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import threading
 from uuid import UUID, uuid4
 from unittest.mock import Mock, patch
 
 import pytest
 
 from core.app_context import AppContext, DataCache, init_app_context, get_app_context
+from core.live_updates import LiveUpdate
 from config import Settings
 from models import Client, Deal, Policy, Task
 
@@ -332,3 +334,128 @@ class TestAppContextGlobal:
         context = get_app_context()
         assert context is not None
         assert context.settings is not None
+
+
+class TestLocalReplica:
+    """Test AppContext backed by the SQLite local store."""
+
+    @staticmethod
+    def _settings(tmp_path) -> Settings:
+        return Settings(
+            api_base_url="http://localhost:8000",
+            local_store_path=str(tmp_path / "replica.sqlite3"),
+        )
+
+    @patch("core.app_context.APIClient")
+    def test_cache_is_hydrated_on_next_start(self, mock_api_client: Mock, tmp_path) -> None:
+        """Test records saved by one context are loaded by the next one."""
+        client = Client(id=uuid4(), name="Stored Client", email="stored@example.com")
+        context = AppContext(settings=self._settings(tmp_path))
+        context.update_clients([client])
+        context.close()
+
+        restarted = AppContext(settings=self._settings(tmp_path))
+
+        assert restarted.cache.clients[client.id].name == "Stored Client"
+        restarted.close()
+
+    @patch("core.app_context.APIClient")
+    def test_reconcile_removes_records_missing_from_api(self, mock_api_client: Mock, tmp_path) -> None:
+        """Test reconcile makes the replica match the API snapshot."""
+        kept = Client(id=uuid4(), name="Kept")
+        removed = Client(id=uuid4(), name="Removed")
+        api = mock_api_client.return_value
+        api.fetch_many.return_value = [[kept], [], [], []]
+        api.fetch_payments_for_policies.return_value = []
+
+        context = AppContext(settings=self._settings(tmp_path))
+        context.update_clients([kept, removed])
+        context.apply_snapshot(context.reconcile())
+        context.close()
+
+        restarted = AppContext(settings=self._settings(tmp_path))
+
+        assert list(restarted.cache.clients) == [kept.id]
+        restarted.close()
+
+    @patch("core.app_context.APIClient")
+    def test_search_matches_text_fields(self, mock_api_client: Mock, tmp_path) -> None:
+        """Test local search finds records by words in their text fields."""
+        context = AppContext(settings=self._settings(tmp_path))
+        match = Client(id=uuid4(), name="Ivan Petrov", email="ivan@example.com")
+        context.update_clients([match, Client(id=uuid4(), name="Anna Smirnova")])
+        context.flush_store()
+
+        assert context.search("clients", "petr ivan") == [match]
+        assert context.search("clients", "nobody") == []
+        context.close()
+
+    @patch("core.app_context.APIClient")
+    def test_search_follows_updates_and_deletes(self, mock_api_client: Mock, tmp_path) -> None:
+        """Test the search index drops old text when a record changes or goes away."""
+        context = AppContext(settings=self._settings(tmp_path))
+        client = Client(id=uuid4(), name="Ivan Petrov")
+        context.update_clients([client])
+        context.flush_store()
+
+        renamed = client.model_copy(update={"name": "Ivan Sidorov"})
+        context.update_clients([renamed])
+        context.flush_store()
+        assert context.search("clients", "petrov") == []
+        assert context.search("clients", "sidorov") == [renamed]
+
+        context.store.delete("clients", [client.id])
+        assert context.search("clients", "sidorov") == []
+        context.close()
+
+    @patch("core.app_context.APIClient")
+    def test_updates_are_persisted_off_the_calling_thread(self, mock_api_client: Mock, tmp_path) -> None:
+        """Test cache updates return at once and the write happens on the store writer thread."""
+        context = AppContext(settings=self._settings(tmp_path))
+        write_threads: list[str] = []
+        upsert = context.store.upsert
+
+        def recording_upsert(kind, items):
+            write_threads.append(threading.current_thread().name)
+            upsert(kind, items)
+
+        context.store.upsert = recording_upsert  # type: ignore[method-assign]
+        client = Client(id=uuid4(), name="Queued")
+        context.update_clients([client])
+
+        assert context.cache.clients[client.id] is client
+        context.flush_store()
+        assert write_threads == ["local-store-writer"]
+        assert context.search("clients", "queued") == [client]
+        context.close()
+
+    @patch("core.app_context.APIClient")
+    def test_reconcile_keeps_changes_made_during_download(self, mock_api_client: Mock, tmp_path) -> None:
+        """Test records patched while the snapshot downloads are not reverted or dropped."""
+        edited = Client(id=uuid4(), name="Old name")
+        deleted = Client(id=uuid4(), name="Deleted meanwhile")
+        context = AppContext(settings=self._settings(tmp_path))
+        context.update_clients([edited, deleted])
+        added = Client(id=uuid4(), name="Created meanwhile")
+        renamed = edited.model_copy(update={"name": "New name"})
+
+        def fetch_many(_calls, **_kwargs):
+            # Live updates arrive while the snapshot is being downloaded.
+            context.update_clients([renamed, added])
+            context.apply_live_update(LiveUpdate(kind="clients", removed=[deleted.id]))
+            return [[edited, deleted], [], [], []]
+
+        api = mock_api_client.return_value
+        api.fetch_many.side_effect = fetch_many
+        api.fetch_payments_for_policies.return_value = []
+        clients = context.cache.clients
+
+        context.apply_snapshot(context.reconcile())
+
+        assert context.cache.clients is clients
+        assert context.cache.clients == {edited.id: renamed, added.id: added}
+        context.close()
+
+        restarted = AppContext(settings=self._settings(tmp_path))
+        assert restarted.cache.clients == {edited.id: renamed, added.id: added}
+        restarted.close()
@@ -0,0 +1,77 @@
+"""Unit tests for event stream parsing."""
+
+from __future__ import annotations
+
+import json
+from uuid import uuid4
+
+from core.app_context import DataCache
+from core.live_updates import SSEParser, parse_event
+from models import Task
+
+
+class TestSSEParser:
+    """Test SSEParser class."""
+
+    def test_parser_builds_message_on_blank_line(self) -> None:
+        """Test fields are collected until a blank line ends the message."""
+        parser = SSEParser()
+        lines = [": keep-alive", "event: deal.payment.updated", "id: 42", "data: {\"a\":", "data: 1}", ""]
+
+        messages = [parser.feed(line) for line in lines]
+
+        assert messages[:-1] == [None] * 5
+        assert messages[-1].event == "deal.payment.updated"
+        assert messages[-1].data == "{\"a\":\n1}"
+        assert parser.last_event_id == "42"
+
+
+class TestParseEvent:
+    """Test parse_event function."""
+
+    def test_payment_updated_event(self) -> None:
+        """Test payment events produce a payments patch."""
+        payment_id = uuid4()
+        data = json.dumps({
+            "deal_id": str(uuid4()),
+            "policy_id": str(uuid4()),
+            "payment": {
+                "id": str(payment_id),
+                "deal_id": str(uuid4()),
+                "policy_id": str(uuid4()),
+                "sequence": 1,
+                "status": "paid",
+                "net_total": "10.00",
+            },
+        })
+
+        update = parse_event("deal.payment.updated", data, DataCache())
+
+        assert update is not None
+        assert update.kind == "payments"
+        assert update.updated[0].id == payment_id
+        assert update.updated[0].net_total == 10.0
+
+    def test_task_status_changed_patches_cached_task(self) -> None:
+        """Test a CloudEvents status change updates the cached task copy."""
+        cache = DataCache()
+        task = Task(id=uuid4(), title="Call client", status_code="pending", status_name="Pending")
+        cache.tasks[task.id] = task
+        data = json.dumps({
+            "type": "tasks.task.status_changed",
+            "data": {"task_id": str(task.id), "old_status": "pending", "new_status": "completed"},
+        })
+
+        update = parse_event("message", data, cache)
+
+        assert update is not None
+        assert update.updated[0].status_code == "completed"
+        assert update.updated[0].title == "Call client"
+        assert cache.tasks[task.id].status_code == "pending"
+
+    def test_unmirrored_events_are_ignored(self) -> None:
+        """Test heartbeats and calculation events produce no patch."""
+        cache = DataCache()
+
+        assert parse_event("heartbeat", "", cache) is None
+        assert parse_event("deal.calculation.created", json.dumps({"deal_id": str(uuid4())}), cache) is None
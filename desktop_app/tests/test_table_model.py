@@ -0,0 +1,71 @@
+"""Unit tests for ColumnTableModel."""
+
+from __future__ import annotations
+
+import pytest
+from PySide6.QtCore import QCoreApplication, Qt
+
+from ui.table_model import SORT_KEY_ROLE, ColumnTableModel, sort_key
+
+
+@pytest.fixture
+def app() -> QCoreApplication:
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def _column(model: ColumnTableModel, column: int) -> list[str]:
+    return [model.data(model.index(row, column)) for row in range(model.rowCount())]
+
+
+class TestColumnTableModel:
+    """Test paging, search and sorting of the column model."""
+
+    def test_search_covers_rows_not_exposed_yet(self, app: QCoreApplication) -> None:
+        """Test the filter sees rows beyond the exposed batch."""
+        model = ColumnTableModel(["Name"], batch_size=10)
+        model.set_rows([f"Client {number}"] for number in range(100))
+        assert model.rowCount() == 10
+
+        model.set_filter_text("client 95")
+
+        assert _column(model, 0) == ["Client 95"]
+        assert model.source_row(0) == 95
+        model.set_filter_text("")
+        assert model.rowCount() == 10
+        assert model.source_row(3) == 3
+
+    def test_sort_orders_all_rows_by_typed_value(self, app: QCoreApplication) -> None:
+        """Test money columns sort numerically across the whole model."""
+        model = ColumnTableModel(["Amount"], batch_size=2)
+        model.set_rows([["200.00"], ["1,000.00"], ["30.50"], [""], ["12,500.00"]])
+
+        model.sort(0, Qt.SortOrder.DescendingOrder)
+
+        assert _column(model, 0) == ["12,500.00", "1,000.00"]
+        model.fetchMore()
+        model.fetchMore()
+        assert _column(model, 0) == ["12,500.00", "1,000.00", "200.00", "30.50", ""]
+        assert model.data(model.index(0, 0), SORT_KEY_ROLE) == (1, 12500.0)
+
+    def test_row_changes_follow_the_view(self, app: QCoreApplication) -> None:
+        """Test update and remove take source rows while a filter is active."""
+        model = ColumnTableModel(["Name"], batch_size=10)
+        model.set_rows([["Anna"], ["Ivan"], ["Ivanna"]])
+        model.set_filter_text("ivan")
+
+        model.update_row(2, ["Ivanna Petrova"])
+        model.remove_row(1)
+        model.insert_row(["Ivan Sidorov"])
+        model.insert_row(["Oleg"])
+
+        assert _column(model, 0) == ["Ivanna Petrova", "Ivan Sidorov"]
+        assert [model.source_row(row) for row in range(model.rowCount())] == [1, 2]
+        assert model.total_rows() == 4
+
+
+def test_sort_key_ranks_values_by_type() -> None:
+    """Test numbers and ISO dates get typed keys and words stay text."""
+    assert sort_key("9") < sort_key("10")
+    assert sort_key("2025-01-02") < sort_key("2025-01-02 10:30") < sort_key("2025-02-01")
+    assert sort_key("nan") == (3, "nan")
+    assert sort_key("") < sort_key("1") < sort_key("2025-01-01") < sort_key("abc")
@@ -0,0 +1,142 @@
+"""Unit tests for Worker and WorkerPool."""
+
+from __future__ import annotations
+
+import gc
+import threading
+
+import pytest
+from PySide6.QtCore import QCoreApplication, QThreadPool
+
+from ui.worker import Worker, WorkerPool, cancel_check, current_cancel_token, worker_timings
+
+
+@pytest.fixture
+def app() -> QCoreApplication:
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def _drain(app: QCoreApplication, thread_pool: QThreadPool) -> None:
+    thread_pool.waitForDone(5000)
+    app.processEvents()
+
+
+class TestWorkerPool:
+    """Test WorkerPool class."""
+
+    def test_result_is_delivered_and_worker_released(self, app: QCoreApplication) -> None:
+        """Test finished is emitted and the pool forgets the worker."""
+        thread_pool = QThreadPool()
+        pool = WorkerPool(thread_pool)
+        results: list[int] = []
+        worker = Worker(lambda: 42)
+        worker.finished.connect(results.append)
+
+        pool.start("answer", worker)
+        _drain(app, thread_pool)
+
+        assert results == [42]
+        assert not pool.is_running("answer")
+        assert pool._workers == {}
+        assert worker_timings()["answer"].count >= 1
+
+    def test_superseded_worker_result_is_dropped(self, app: QCoreApplication) -> None:
+        """Test a newer request with the same key cancels the older one."""
+        thread_pool = QThreadPool()
+        pool = WorkerPool(thread_pool)
+        entered = threading.Event()
+        release = threading.Event()
+        seen_tokens: list[bool] = []
+        results: list[str] = []
+
+        def slow() -> str:
+            entered.set()
+            release.wait(5)
+            seen_tokens.append(current_cancel_token().cancelled)
+            return "stale"
+
+        old = Worker(slow)
+        old.finished.connect(results.append)
+        new = Worker(lambda: "fresh")
+        new.finished.connect(results.append)
+
+        pool.start("load", old)
+        assert entered.wait(5)
+        pool.start("load", new)
+        release.set()
+        _drain(app, thread_pool)
+
+        assert results == ["fresh"]
+        assert seen_tokens == [True]
+
+    def test_coalesced_request_shares_running_result(self, app: QCoreApplication) -> None:
+        """Test coalesce=True joins the in-flight worker instead of starting another."""
+        thread_pool = QThreadPool()
+        pool = WorkerPool(thread_pool)
+        release = threading.Event()
+        calls: list[int] = []
+        results: list[int] = []
+
+        def load() -> int:
+            calls.append(1)
+            release.wait(5)
+            return 7
+
+        first = Worker(load)
+        first.finished.connect(results.append)
+        second = Worker(load)
+        second.finished.connect(results.append)
+
+        pool.start("load", first)
+        pool.start("load", second, coalesce=True)
+        release.set()
+        _drain(app, thread_pool)
+
+        assert calls == [1]
+        assert results == [7, 7]
+
+    def test_coalesced_worker_survives_garbage_collection(self, app: QCoreApplication) -> None:
+        """Test a joining worker the caller did not keep still gets the result."""
+        thread_pool = QThreadPool()
+        pool = WorkerPool(thread_pool)
+        release = threading.Event()
+        results: list[int] = []
+
+        def load() -> int:
+            release.wait(5)
+            return 3
+
+        pool.start("load", Worker(load))
+        joining = Worker(load)
+        joining.finished.connect(results.append)
+        pool.start("load", joining, coalesce=True)
+        del joining
+        gc.collect()
+        release.set()
+        _drain(app, thread_pool)
+
+        assert results == [3]
+
+    def test_cancel_check_follows_worker_token(self, app: QCoreApplication) -> None:
+        """Test cancel_check reports the cancellation of the worker it was created in."""
+        thread_pool = QThreadPool()
+        pool = WorkerPool(thread_pool)
+        entered = threading.Event()
+        release = threading.Event()
+        checks: list[bool] = []
+
+        def load() -> None:
+            cancelled = cancel_check()
+            checks.append(cancelled())
+            entered.set()
+            release.wait(5)
+            checks.append(cancelled())
+
+        pool.start("load", Worker(load))
+        assert entered.wait(5)
+        pool.cancel("load")
+        release.set()
+        _drain(app, thread_pool)
+
+        assert checks == [False, True]
+        assert cancel_check()() is False
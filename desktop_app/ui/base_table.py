@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Sequence
 
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QHBoxLayout,
+    QLineEdit,
     QMessageBox,
     QPushButton,
     QSizePolicy,
@@ -15,7 +15,9 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from core.live_updates import LiveUpdate
 from i18n import _
+from ui.table_model import ColumnTableModel
 
 logger = logging.getLogger(__name__)
 
@@ -38,11 +40,14 @@ class BaseTableTab(QWidget):
         super().__init__(parent)
         self._columns = columns
         self._title = title or ""
-        self._model = QStandardItemModel(self)
-        self._model.setHorizontalHeaderLabels(list(columns))
+        self._model = ColumnTableModel(columns, parent=self)
+        self._model.remote_fetch_requested.connect(self.load_more)  # type: ignore[arg-type]
 
+        # The model sorts and filters itself: a proxy would only see the exposed batch.
         self.table = QTableView(self)
         self.table.setModel(self._model)
+        self.table.setSortingEnabled(True)
+        self.table.sortByColumn(-1, Qt.SortOrder.AscendingOrder)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
@@ -54,6 +59,10 @@ class BaseTableTab(QWidget):
         self.edit_button = QPushButton(_("Изменить"), self)
         self.delete_button = QPushButton(_("Удалить"), self)
         self.refresh_button = QPushButton(_("Обновить"), self)
+        self.filter_edit = QLineEdit(self)
+        self.filter_edit.setPlaceholderText(_("Search..."))
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(self._model.set_filter_text)  # type: ignore[arg-type]
 
         for button in (
             self.add_button,
@@ -68,6 +77,7 @@ class BaseTableTab(QWidget):
         header_layout.addWidget(self.edit_button)
         header_layout.addWidget(self.delete_button)
         header_layout.addStretch(1)
+        header_layout.addWidget(self.filter_edit)
         header_layout.addWidget(self.refresh_button)
 
         layout = QVBoxLayout(self)
@@ -93,6 +103,12 @@ class BaseTableTab(QWidget):
     def refresh(self) -> None:
         self.load_data()
 
+    def load_more(self, offset: int) -> None:
+        """Load the server page starting at ``offset`` and pass it to ``append_page``.
+
+        Only invoked after ``populate``/``append_page`` reported ``has_more=True``.
+        """
+
     def on_add(self) -> None:
         QMessageBox.information(self, _("Действие недоступно"), _("Функция ещё не реализована."))
 
@@ -123,34 +139,77 @@ class BaseTableTab(QWidget):
         self.on_delete(index, row)
 
     # ----- population -------------------------------------------------------
-    def populate(self, rows: Iterable[Sequence[str]]) -> None:
-        self._model.setRowCount(0)
-        for row_idx, row in enumerate(rows):
-            items = [self._create_item(value) for value in row]
-            self._model.insertRow(row_idx, items)
-        self.data_loaded.emit(self._model.rowCount())
+    def populate(self, rows: Iterable[Sequence[str]], *, has_more: bool = False) -> None:
+        """Replace table contents.
+
+        Args:
+            rows: Row values in display order
+            has_more: Server has further pages; ``load_more`` is called on scroll
+        """
+        self._model.set_rows(rows, has_more_remote=has_more)
+        self.data_loaded.emit(self._model.total_rows())
+        self._update_action_state()
+
+    def append_page(self, rows: Iterable[Sequence[str]], *, has_more: bool = False) -> None:
+        """Append a server page fetched by ``load_more``."""
+        self._model.append_rows(rows, has_more_remote=has_more)
+        self.data_loaded.emit(self._model.total_rows())
+
+    def apply_live_update(self, update: LiveUpdate) -> None:
+        """Patch rows from an event stream update; tabs mirroring ``update.kind`` override this."""
+
+    def patch_rows(
+        self,
+        records: list,
+        update: LiveUpdate,
+        to_rows: Callable[[list], Iterable[Sequence[str]]],
+    ) -> None:
+        """Apply ``update`` to ``records`` and the matching table rows.
+
+        Args:
+            records: Tab's record list, in the same order as the table rows
+            update: Changed and removed records
+            to_rows: Tab's record-to-row conversion
+        """
+        if self.is_empty():
+            # Not loaded yet; the cache already holds the change for the first load.
+            return
+        count_before = self._model.total_rows()
+        positions = {record.id: row for row, record in enumerate(records)}
+        for item in update.updated:
+            values = next(iter(to_rows([item])))
+            row = positions.get(item.id)
+            if row is None:
+                positions[item.id] = len(records)
+                records.append(item)
+                self._model.insert_row(values)
+            else:
+                records[row] = item
+                self._model.update_row(row, values)
+        removed_rows = sorted((positions[item_id] for item_id in update.removed if item_id in positions), reverse=True)
+        for row in removed_rows:
+            del records[row]
+            self._model.remove_row(row)
+        if self._model.total_rows() != count_before:
+            self.data_loaded.emit(self._model.total_rows())
         self._update_action_state()
 
+    def is_empty(self) -> bool:
+        return self._model.total_rows() == 0
+
+    def cancel_page_load(self) -> None:
+        """Re-arm paging after ``load_more`` failed."""
+        self._model.cancel_remote_fetch()
+
     def get_selected_index(self) -> int | None:
+        """Return the selected row as an index into the source rows (unsorted, unfiltered)."""
         selected = self.table.selectionModel().selectedRows()
         if not selected:
             return None
-        return selected[0].row()
+        return self._model.source_row(selected[0].row())
 
     def get_selected_row_values(self, row_index: int) -> Sequence[str]:
-        return [
-            self._model.item(row_index, column).text()
-            if self._model.item(row_index, column) is not None
-            else ""
-            for column in range(self._model.columnCount())
-        ]
-
-    @staticmethod
-    def _create_item(value: str | None) -> QStandardItem:
-        item = QStandardItem(str(value) if value is not None else "")
-        item.setEditable(False)
-        item.setData(item.text(), Qt.ItemDataRole.ToolTipRole)
-        return item
+        return self._model.row_values(row_index)
 
     def _update_action_state(self) -> None:
         has_selection = bool(self.table.selectionModel().selectedRows())
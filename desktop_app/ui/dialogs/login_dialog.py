@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
@@ -15,20 +15,45 @@ from PySide6.QtWidgets import (
     QMessageBox,
 )
 
-from core.auth_service import AuthService
 from i18n import _
 
+if TYPE_CHECKING:
+    from core.auth_service import AuthService
+
 logger = logging.getLogger(__name__)
 
 
 class LoginDialog(QDialog):
     """Dialog for user login with username and password."""
 
-    def __init__(self, auth_service: AuthService, parent=None) -> None:
+    def __init__(
+        self,
+        auth_service: AuthService | None = None,
+        parent=None,
+        *,
+        auth_service_factory: Callable[[], AuthService] | None = None,
+    ) -> None:
+        """Initialize dialog.
+
+        Args:
+            auth_service: Service used to sign in
+            parent: Parent widget
+            auth_service_factory: Creates the service on the first sign-in
+                attempt, so the HTTP stack is not imported before the dialog shows
+        """
         super().__init__(parent)
+        if auth_service is None and auth_service_factory is None:
+            raise ValueError("auth_service or auth_service_factory is required")
         self._auth_service = auth_service
+        self._auth_service_factory = auth_service_factory
         self._setup_ui()
 
+    def _service(self) -> AuthService:
+        if self._auth_service is None:
+            assert self._auth_service_factory is not None
+            self._auth_service = self._auth_service_factory()
+        return self._auth_service
+
     def _setup_ui(self) -> None:
         """Set up the dialog UI."""
         self.setWindowTitle(_("CRM Desktop - Login"))
@@ -100,7 +125,7 @@ class LoginDialog(QDialog):
 
         try:
             # Attempt authentication
-            if self._auth_service.login(username, password):
+            if self._service().login(username, password):
                 logger.info("Login successful for user: %s", username)
                 self.accept()
             else:
@@ -0,0 +1,120 @@
+"""Background listener for the CRM server-sent events stream."""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+from typing import Callable, Dict, Optional
+
+import httpx
+from PySide6.QtCore import QObject, Signal
+
+from core.live_updates import SSEParser
+
+logger = logging.getLogger(__name__)
+
+
+class EventStreamListener(QObject):
+    """Keep one SSE connection open and forward its events to the UI thread.
+
+    The stream is read on a daemon thread rather than a ``QThread``: a
+    blocking read cannot be interrupted reliably, and a daemon thread never
+    holds up application shutdown.
+
+    While the stream is unavailable the listener reconnects with exponential
+    backoff (capped at ``poll_interval``) and emits ``poll_requested`` before
+    every wait, so the window can fall back to reloading the visible tab.
+
+    Signals:
+        event_received: Emitted with the event name and raw data string
+        poll_requested: Emitted when live updates are unavailable
+        connection_changed: Emitted with True/False when the stream opens/drops
+    """
+
+    event_received = Signal(str, str)
+    poll_requested = Signal()
+    connection_changed = Signal(bool)
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        get_auth_header: Callable[[], Dict[str, str]] | None = None,
+        timeout: float = 10.0,
+        poll_interval: float = 60.0,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self._url = url
+        self._get_auth_header = get_auth_header or (lambda: {})
+        # Upstream heartbeats arrive every 15-30 s; a silent stream is treated as dropped.
+        self._timeout = httpx.Timeout(timeout, read=max(timeout, 90.0))
+        self._poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._response: Optional[httpx.Response] = None
+        self._last_event_id: Optional[str] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="event-stream", daemon=True)
+        self._thread.start()
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def stop(self) -> None:
+        """Ask the listener to exit and close the open stream."""
+        self._stop_event.set()
+        response = self._response
+        if response is not None:
+            try:
+                response.close()
+            except Exception:  # pragma: no cover - closing from another thread is best effort
+                logger.debug("Failed to close event stream", exc_info=True)
+
+    def _run(self) -> None:
+        backoff = 1.0
+        while not self._stop_event.is_set():
+            try:
+                if self._consume():
+                    backoff = 1.0
+            except (httpx.HTTPError, OSError) as exc:
+                logger.info("Event stream unavailable: %s", exc)
+            except Exception:  # noqa: BLE001 - keep the listener alive
+                if not self._stop_event.is_set():
+                    logger.exception("Event stream failed")
+            finally:
+                self._response = None
+            if self._stop_event.is_set():
+                break
+            self.connection_changed.emit(False)
+            self.poll_requested.emit()
+            delay = min(backoff, self._poll_interval)
+            self._stop_event.wait(delay * random.uniform(0.8, 1.2))
+            backoff = min(backoff * 2, self._poll_interval)
+
+    def _consume(self) -> bool:
+        """Read the stream until it ends; return True if it was opened."""
+        headers = {"Accept": "text/event-stream", **self._get_auth_header()}
+        if self._last_event_id:
+            headers["Last-Event-ID"] = self._last_event_id
+        parser = SSEParser()
+        with httpx.Client(timeout=self._timeout) as client:
+            with client.stream("GET", self._url, headers=headers) as response:
+                response.raise_for_status()
+                self._response = response
+                self.connection_changed.emit(True)
+                for line in response.iter_lines():
+                    if self._stop_event.is_set():
+                        break
+                    message = parser.feed(line)
+                    if message is None:
+                        continue
+                    if parser.last_event_id:
+                        self._last_event_id = parser.last_event_id
+                    self.event_received.emit(message.event, message.data)
+        return True
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+import time
+from importlib import import_module
+from typing import Any
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -11,21 +14,33 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QStatusBar,
     QTabWidget,
+    QWidget,
 )
 
-from core.app_context import AppContext, get_app_context
+from core.app_context import AppContext, Snapshot, get_app_context
+from core.live_updates import parse_event
 from i18n import _
-from ui.tabs.clients_tab import ClientsTab
-from ui.tabs.deals_tab import DealsTab
-from ui.tabs.finance_tab import FinanceTab
+from ui.base_table import BaseTableTab
+from ui.event_stream import EventStreamListener
 from ui.tabs.home_tab import HomeTab
-from ui.tabs.policies_tab import PoliciesTab
-from ui.tabs.tasks_tab import TasksTab
+from ui.worker import Worker, WorkerPool, cancel_check
 
 logger = logging.getLogger(__name__)
 
+# Table tabs built on first activation: attribute name, module, class, title
+_LAZY_TABS: tuple[tuple[str, str, str, str], ...] = (
+    ("clients_tab", "ui.tabs.clients_tab", "ClientsTab", "Clients"),
+    ("deals_tab", "ui.tabs.deals_tab", "DealsTab", "Deals"),
+    ("policies_tab", "ui.tabs.policies_tab", "PoliciesTab", "Policies"),
+    ("finance_tab", "ui.tabs.finance_tab", "FinanceTab", "Finance"),
+    ("tasks_tab", "ui.tabs.tasks_tab", "TasksTab", "Tasks"),
+)
+
 
 class MainWindow(QMainWindow):
+    # Emitted once, when the first tab (or dashboard) has shown server data
+    first_data_loaded = Signal()
+
     def __init__(self, *, context: AppContext | None = None, parent=None) -> None:
         super().__init__(parent)
         self._context = context or get_app_context()
@@ -40,8 +55,12 @@ class MainWindow(QMainWindow):
         self.tab_widget = QTabWidget(self)
         self.setCentralWidget(self.tab_widget)
 
+        self._worker_pool = WorkerPool()
+
         self._init_menu_bar()
         self._init_tabs()
+        self._start_reconcile()
+        self._event_stream = self._start_event_stream()
 
     def _init_menu_bar(self) -> None:
         menu_bar = QMenuBar(self)
@@ -62,30 +81,50 @@ class MainWindow(QMainWindow):
 
     def _init_tabs(self) -> None:
         self.home_tab = HomeTab(context=self._context, parent=self)
-        self.clients_tab = ClientsTab(context=self._context, parent=self)
-        self.deals_tab = DealsTab(context=self._context, parent=self)
-        self.policies_tab = PoliciesTab(context=self._context, parent=self)
-        self.finance_tab = FinanceTab(context=self._context, parent=self)
-        self.tasks_tab = TasksTab(context=self._context, parent=self)
-
+        self.home_tab.stats_loaded.connect(self._emit_first_data)  # type: ignore[arg-type]
         self.tab_widget.addTab(self.home_tab, _("Dashboard"))
-        self.tab_widget.addTab(self.clients_tab, _("Clients"))
-        self.tab_widget.addTab(self.deals_tab, _("Deals"))
-        self.tab_widget.addTab(self.policies_tab, _("Policies"))
-        self.tab_widget.addTab(self.finance_tab, _("Finance"))
-        self.tab_widget.addTab(self.tasks_tab, _("Tasks"))
-
-        for tab in (
-            self.clients_tab,
-            self.deals_tab,
-            self.policies_tab,
-            self.finance_tab,
-            self.tasks_tab,
-        ):
-            tab.data_loaded.connect(self._on_tab_data_loaded)
+
+        # Placeholders keep the tab bar complete; real tabs replace them on activation.
+        self._table_tab_widgets: dict[str, BaseTableTab] = {}
+        for _attr, _module, _class, title in _LAZY_TABS:
+            self.tab_widget.addTab(QWidget(self), _(title))
+        self._first_data_emitted = False
 
         self.tab_widget.currentChanged.connect(self._on_tab_changed)  # type: ignore[arg-type]
 
+    def _ensure_tab(self, index: int) -> QWidget | None:
+        """Return the tab at ``index``, constructing it on first activation."""
+        lazy_index = index - 1
+        if not 0 <= lazy_index < len(_LAZY_TABS):
+            return self.tab_widget.widget(index)
+        attr, module_name, class_name, title = _LAZY_TABS[lazy_index]
+        tab = self._table_tab_widgets.get(attr)
+        if tab is not None:
+            return tab
+
+        started = time.perf_counter()
+        tab_class = getattr(import_module(module_name), class_name)
+        tab = tab_class(context=self._context, parent=self)
+        tab.data_loaded.connect(self._on_tab_data_loaded)
+        self._table_tab_widgets[attr] = tab
+        setattr(self, attr, tab)
+
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, _(title))
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        logger.debug("Built %s in %.0f ms", class_name, (time.perf_counter() - started) * 1000)
+        return tab
+
+    def _table_tabs(self) -> tuple[BaseTableTab, ...]:
+        """Table tabs constructed so far."""
+        return tuple(self._table_tab_widgets.values())
+
     def refresh_current_tab(self) -> None:
         widget = self.tab_widget.currentWidget()
         if hasattr(widget, "load_data"):
@@ -95,12 +134,63 @@ class MainWindow(QMainWindow):
                 logger.exception("Refresh error: %s", exc)
                 QMessageBox.critical(self, _("Error"), str(exc))
 
+    def _start_reconcile(self) -> None:
+        """Bring the local replica up to date with the API in the background."""
+        if self._context.store is None:
+            return
+        worker = Worker(lambda: self._context.reconcile(cancelled=cancel_check()))
+        worker.finished.connect(self._on_reconciled)  # type: ignore[arg-type]
+        worker.error.connect(self._on_reconcile_error)  # type: ignore[arg-type]
+        self._worker_pool.start("reconcile", worker)
+
+    def _start_event_stream(self) -> EventStreamListener | None:
+        """Subscribe to CRM events so open tabs are patched instead of reloaded."""
+        url = self._context.settings.stream_url
+        if not url:
+            return None
+        listener = EventStreamListener(
+            url,
+            get_auth_header=self._context.auth_service.get_auth_header,
+            timeout=self._context.settings.api_timeout,
+            poll_interval=self._context.settings.stream_poll_interval,
+            parent=self,
+        )
+        listener.event_received.connect(self._on_stream_event)  # type: ignore[arg-type]
+        listener.poll_requested.connect(self._on_poll_requested)  # type: ignore[arg-type]
+        listener.start()
+        return listener
+
     # ----- signals ----------------------------------------------------------
+    def _on_stream_event(self, event: str, data: str) -> None:
+        update = parse_event(event, data, self._context.cache)
+        if update is None:
+            return
+        self._context.apply_live_update(update)
+        for tab in self._table_tabs():
+            tab.apply_live_update(update)
+
+    def _on_poll_requested(self) -> None:
+        # Live updates are down: reload what the user is looking at.
+        self._on_tab_changed(self.tab_widget.currentIndex())
+
+    def _on_reconciled(self, snapshot: Any) -> None:
+        if isinstance(snapshot, Snapshot):
+            self._context.apply_snapshot(snapshot)
+
+    def _on_reconcile_error(self, error_message: str) -> None:
+        logger.warning("Local store reconciliation failed, working offline: %s", error_message)
+
     def _on_tab_data_loaded(self, count: int) -> None:
         self.status_bar.showMessage(_("Rows loaded: {}").format(count), 5000)
+        self._emit_first_data()
+
+    def _emit_first_data(self) -> None:
+        if not self._first_data_emitted:
+            self._first_data_emitted = True
+            self.first_data_loaded.emit()
 
     def _on_tab_changed(self, index: int) -> None:
-        widget = self.tab_widget.widget(index)
+        widget = self._ensure_tab(index)
         if widget is self.home_tab:
             self.home_tab.refresh_stats()
         elif hasattr(widget, "load_data"):
@@ -109,6 +199,9 @@ class MainWindow(QMainWindow):
     # ----- lifecycle --------------------------------------------------------
     def closeEvent(self, event) -> None:  # type: ignore[override]
         try:
+            if self._event_stream is not None:
+                self._event_stream.stop()
+            self._worker_pool.cleanup()
             self._context.close()
         finally:
             super().closeEvent(event)
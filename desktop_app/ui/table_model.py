@@ -0,0 +1,280 @@
+"""Lightweight table model for large tab datasets."""
+
+from __future__ import annotations
+
+import logging
+import math
+from datetime import datetime
+from typing import Any, Iterable, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt, Signal
+
+logger = logging.getLogger(__name__)
+
+_Index = QModelIndex | QPersistentModelIndex
+
+# Role returning the typed value a cell is sorted by
+SORT_KEY_ROLE = Qt.ItemDataRole.UserRole
+
+
+def sort_key(text: str) -> tuple[int, Any]:
+    """Typed sort key of a display string: empty < numbers < dates < text.
+
+    Money columns are formatted with thousands separators and dates as ISO
+    strings, so both are parsed back instead of being compared as text.
+    """
+    if not text:
+        return (0, 0)
+    try:
+        number = float(text.replace(",", "").replace("\u00a0", "").replace(" ", ""))
+    except ValueError:
+        pass
+    else:
+        if math.isfinite(number):  # "nan" and "inf" are words here
+            return (1, number)
+    try:
+        return (2, datetime.fromisoformat(text).timestamp())
+    except ValueError:
+        pass
+    return (3, text.casefold())
+
+
+class ColumnTableModel(QAbstractTableModel):
+    """Read-only table model backed by one list of strings per column.
+
+    Unlike ``QStandardItemModel`` no per-cell Qt objects are created, so the
+    memory cost of a row is a handful of Python string references. Rows are
+    exposed to the view in chunks of ``batch_size`` through
+    ``canFetchMore``/``fetchMore``; once all locally held rows are exposed and
+    ``has_more_remote`` is set, ``remote_fetch_requested`` asks the owner to
+    load the next server page and hand it over via :meth:`append_rows`.
+
+    Search (:meth:`set_filter_text`) and :meth:`sort` work on every held
+    row, not only the exposed ones: they build a list of source rows in
+    display order and paging continues over that list. Row arguments of
+    the data management methods are source rows; :meth:`source_row` maps
+    a view row back.
+
+    Signals:
+        remote_fetch_requested: Emitted with the offset of the next server page
+    """
+
+    remote_fetch_requested = Signal(int)
+
+    def __init__(self, headers: Sequence[str], *, batch_size: int = 500, parent=None) -> None:
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._batch_size = max(batch_size, 1)
+        self._columns: list[list[str]] = [[] for _ in self._headers]
+        self._total = 0
+        self._exposed = 0
+        self._has_more_remote = False
+        self._remote_pending = False
+        # Source rows in display order while a filter or sort is active
+        self._view: list[int] | None = None
+        self._filter_text = ""
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    # ----- Qt model API -----------------------------------------------------
+    def rowCount(self, parent: _Index = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else self._exposed
+
+    def columnCount(self, parent: _Index = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: _Index, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or index.row() >= self._exposed:
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self._columns[index.column()][self.source_row(index.row())]
+        if role == SORT_KEY_ROLE:
+            return sort_key(self._columns[index.column()][self.source_row(index.row())])
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section] if 0 <= section < len(self._headers) else None
+        return section + 1
+
+    def flags(self, index: _Index) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def canFetchMore(self, parent: _Index = QModelIndex()) -> bool:  # noqa: B008
+        if parent.isValid():
+            return False
+        if self._exposed < self._visible_rows():
+            return True
+        return self._has_more_remote and not self._remote_pending
+
+    def fetchMore(self, parent: _Index = QModelIndex()) -> None:  # noqa: B008
+        if parent.isValid():
+            return
+        visible = self._visible_rows()
+        if self._exposed < visible:
+            self._expose(min(visible, self._exposed + self._batch_size))
+            return
+        if self._has_more_remote and not self._remote_pending:
+            self._remote_pending = True
+            self.remote_fetch_requested.emit(self._total)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Sort all held rows by ``column``; ``-1`` restores the source order."""
+        self._sort_column = column if 0 <= column < len(self._headers) else -1
+        self._sort_order = order
+        self._reset_view()
+
+    # ----- search -----------------------------------------------------------
+    def set_filter_text(self, text: str) -> None:
+        """Show only rows with a cell containing ``text`` (case-insensitive)."""
+        text = text.strip().casefold()
+        if text == self._filter_text:
+            return
+        self._filter_text = text
+        self._reset_view()
+
+    def source_row(self, row: int) -> int:
+        """Source row displayed at view ``row``."""
+        return row if self._view is None else self._view[row]
+
+    # ----- data management --------------------------------------------------
+    def set_rows(self, rows: Iterable[Sequence[Any]], *, has_more_remote: bool = False) -> None:
+        """Replace the model contents with ``rows``."""
+        self.beginResetModel()
+        self._columns = [[] for _ in self._headers]
+        self._total = 0
+        self._exposed = 0
+        self._append_to_columns(rows)
+        self._view = self._build_view()
+        self._exposed = min(self._visible_rows(), self._batch_size)
+        self._has_more_remote = has_more_remote
+        self._remote_pending = False
+        self.endResetModel()
+
+    def append_rows(self, rows: Iterable[Sequence[Any]], *, has_more_remote: bool = False) -> None:
+        """Add a server page to the end of the model."""
+        first = self._total
+        self._append_to_columns(rows)
+        self._has_more_remote = has_more_remote
+        self._remote_pending = False
+        if self._view is not None and self._sort_column >= 0:
+            # New rows land anywhere in the sorted order.
+            self._reset_view(exposed=self._exposed + self._batch_size)
+            return
+        if self._view is not None:
+            self._view.extend(row for row in range(first, self._total) if self._matches(row))
+        self._expose(min(self._visible_rows(), self._exposed + self._batch_size))
+
+    def update_row(self, row: int, values: Sequence[Any]) -> None:
+        """Replace the values of one row in place.
+
+        The row keeps its position until the next search or sort.
+        """
+        for column, value in zip(self._columns, self._normalize(values)):
+            column[row] = value
+        position = self._view_position(row)
+        if position is not None and position < self._exposed:
+            self.dataChanged.emit(self.index(position, 0), self.index(position, len(self._headers) - 1))
+
+    def insert_row(self, values: Sequence[Any]) -> None:
+        """Append one row; it becomes visible once all earlier rows are exposed."""
+        fully_exposed = self._exposed == self._visible_rows()
+        self._append_to_columns([values])
+        if self._view is not None:
+            if not self._matches(self._total - 1):
+                return
+            self._view.append(self._total - 1)
+        if fully_exposed:
+            self._expose(self._visible_rows())
+
+    def remove_row(self, row: int) -> None:
+        position = self._view_position(row)
+        visible = position is not None and position < self._exposed
+        if visible:
+            self.beginRemoveRows(QModelIndex(), position, position)
+        for column in self._columns:
+            del column[row]
+        self._total -= 1
+        if self._view is not None:
+            self._view = [source - 1 if source > row else source for source in self._view if source != row]
+        if visible:
+            self._exposed -= 1
+            self.endRemoveRows()
+
+    def cancel_remote_fetch(self) -> None:
+        """Allow a failed server page to be requested again."""
+        self._remote_pending = False
+
+    def total_rows(self) -> int:
+        """Number of rows held by the model, including not yet exposed and filtered out ones."""
+        return self._total
+
+    def row_values(self, row: int) -> list[str]:
+        if row < 0 or row >= self._total:
+            return []
+        return [column[row] for column in self._columns]
+
+    # ----- internals --------------------------------------------------------
+    def _visible_rows(self) -> int:
+        return self._total if self._view is None else len(self._view)
+
+    def _view_position(self, row: int) -> int | None:
+        if self._view is None:
+            return row
+        try:
+            return self._view.index(row)
+        except ValueError:
+            return None
+
+    def _matches(self, row: int) -> bool:
+        text = self._filter_text
+        return not text or any(text in column[row].casefold() for column in self._columns)
+
+    def _build_view(self) -> list[int] | None:
+        if not self._filter_text and self._sort_column < 0:
+            return None
+        rows = [row for row in range(self._total) if self._matches(row)]
+        if self._sort_column >= 0:
+            column = self._columns[self._sort_column]
+            rows.sort(
+                key=lambda row: sort_key(column[row]),
+                reverse=self._sort_order == Qt.SortOrder.DescendingOrder,
+            )
+        return rows
+
+    def _reset_view(self, *, exposed: int = 0) -> None:
+        self.beginResetModel()
+        self._view = self._build_view()
+        self._exposed = min(self._visible_rows(), max(exposed, self._batch_size))
+        self.endResetModel()
+
+    def _append_to_columns(self, rows: Iterable[Sequence[Any]]) -> None:
+        columns = self._columns
+        for row in rows:
+            for column, value in zip(columns, self._normalize(row)):
+                column.append(value)
+            self._total += 1
+
+    def _normalize(self, row: Sequence[Any]) -> list[str]:
+        width = len(self._headers)
+        values = ["" if value is None else str(value) for value in row]
+        if len(values) != width:
+            logger.warning("Row has %d values, expected %d", len(values), width)
+            values = (values + [""] * width)[:width]
+        return values
+
+    def _expose(self, new_exposed: int) -> None:
+        if new_exposed <= self._exposed:
+            return
+        self.beginInsertRows(QModelIndex(), self._exposed, new_exposed - 1)
+        self._exposed = new_exposed
+        self.endInsertRows()
@@ -9,6 +9,7 @@ from PySide6.QtWidgets import QDialog, QMessageBox
 
 from api.client import APIClientError
 from core.app_context import AppContext
+from core.live_updates import LiveUpdate
 from models import Client
 from ui.base_table import BaseTableTab
 from ui.dialogs.client_dialog import ClientDialog
@@ -31,16 +32,16 @@ class ClientsTab(BaseTableTab):
 
     def load_data(self) -> None:
         """Load clients from API in background thread."""
-        if self._worker_pool.is_running("load_clients"):
-            logger.debug("Clients load already in progress")
-            return
+        # Show the replica straight away; the API response replaces it
+        if self.is_empty():
+            self._show_cached()
 
         self.data_loading.emit(True)
 
         worker = Worker(self._context.api.fetch_clients)
         worker.finished.connect(self._on_clients_loaded)  # type: ignore[arg-type]
         worker.error.connect(self._on_load_error)  # type: ignore[arg-type]
-        self._worker_pool.start("load_clients", worker)
+        self._worker_pool.start("load_clients", worker, coalesce=True)
 
     def _on_clients_loaded(self, clients: Any) -> None:
         """Handle successful clients load.
@@ -57,6 +58,19 @@ class ClientsTab(BaseTableTab):
         self._context.update_clients(clients)
         self.populate(self._to_rows(clients))
 
+    def _show_cached(self) -> bool:
+        """Populate the table from the context cache; return False if it is empty."""
+        cached_clients = list(self._context.cache.clients.values())
+        if not cached_clients:
+            return False
+        self._clients = cached_clients
+        self.populate(self._to_rows(cached_clients))
+        return True
+
+    def apply_live_update(self, update: LiveUpdate) -> None:
+        if update.kind == "clients":
+            self.patch_rows(self._clients, update, self._to_rows)
+
     def _on_load_error(self, error_message: str) -> None:
         """Handle load error.
 
@@ -66,11 +80,8 @@ class ClientsTab(BaseTableTab):
         self.data_loading.emit(False)
 
         # Try to show cached data if available
-        cached_clients = list(self._context.cache.clients.values())
-        if cached_clients:
+        if self._show_cached():
             logger.warning("API error, showing cached data: %s", error_message)
-            self._clients = cached_clients
-            self.populate(self._to_rows(cached_clients))
             self.operation_error.emit(_("Showing cached data (network error: {})").format(error_message))
         else:
             # No cache available
@@ -10,10 +10,11 @@ from PySide6.QtWidgets import QMessageBox, QDialog
 
 from api.client import APIClientError
 from core.app_context import AppContext
+from core.live_updates import LiveUpdate
 from models import Client, Deal
 from ui.base_table import BaseTableTab
 from ui.dialogs.deal_dialog import DealDialog
-from ui.worker import Worker, WorkerPool
+from ui.worker import Worker, WorkerPool, cancel_check
 from i18n import _
 
 logger = logging.getLogger(__name__)
@@ -33,21 +34,21 @@ class DealsTab(BaseTableTab):
 
     def load_data(self) -> None:
         """Load deals and clients from API in background thread."""
-        if self._worker_pool.is_running("load_deals"):
-            logger.debug("Deals load already in progress")
-            return
+        # Show the replica straight away; the API response replaces it
+        if self.is_empty():
+            self._show_cached()
 
         self.data_loading.emit(True)
 
         def load_deals_task() -> tuple[list[Deal], list[Client]]:
-            deals = self._context.api.fetch_deals()
-            clients = self._context.api.fetch_clients()
+            api = self._context.api
+            deals, clients = api.fetch_many([api.fetch_deals, api.fetch_clients], cancelled=cancel_check())
             return deals, clients
 
         worker = Worker(load_deals_task)
         worker.finished.connect(self._on_deals_loaded)  # type: ignore[arg-type]
         worker.error.connect(self._on_load_error)  # type: ignore[arg-type]
-        self._worker_pool.start("load_deals", worker)
+        self._worker_pool.start("load_deals", worker, coalesce=True)
 
     def _on_deals_loaded(self, result: Any) -> None:
         """Handle successful deals load.
@@ -71,6 +72,20 @@ class DealsTab(BaseTableTab):
         self._context.update_clients(clients)
         self.populate(self._to_rows(deals))
 
+    def _show_cached(self) -> bool:
+        """Populate the table from the context cache; return False if it is empty."""
+        cached_deals = list(self._context.cache.deals.values())
+        if not cached_deals:
+            return False
+        self._deals = cached_deals
+        self._clients = list(self._context.cache.clients.values())
+        self.populate(self._to_rows(cached_deals))
+        return True
+
+    def apply_live_update(self, update: LiveUpdate) -> None:
+        if update.kind == "deals":
+            self.patch_rows(self._deals, update, self._to_rows)
+
     def _on_load_error(self, error_message: str) -> None:
         """Handle load error.
 
@@ -80,11 +95,8 @@ class DealsTab(BaseTableTab):
         self.data_loading.emit(False)
 
         # Try to show cached data if available
-        cached_deals = list(self._context.cache.deals.values())
-        if cached_deals:
+        if self._show_cached():
             logger.warning("API error, showing cached data: %s", error_message)
-            self._deals = cached_deals
-            self.populate(self._to_rows(cached_deals))
             self.operation_error.emit(_("Showing cached data (network error: {})").format(error_message))
         else:
             # No cache available
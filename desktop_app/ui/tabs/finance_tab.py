@@ -7,10 +7,11 @@ from PySide6.QtWidgets import QDialog, QMessageBox
 
 from api.client import APIClientError
 from core.app_context import AppContext
+from core.live_updates import LiveUpdate
 from models import Deal, Payment, Policy
 from ui.base_table import BaseTableTab
 from ui.dialogs.payment_dialog import PaymentDialog
-from ui.worker import Worker, WorkerPool
+from ui.worker import Worker, WorkerPool, cancel_check
 from i18n import _
 
 logger = logging.getLogger(__name__)
@@ -54,22 +55,23 @@ class FinanceTab(BaseTableTab):
 
     def load_data(self) -> None:
         """Load payments from API in background thread."""
-        if self._worker_pool.is_running("load_payments"):
-            logger.debug("Payments load already in progress")
-            return
+        # Show the replica straight away; the API response replaces it
+        if self.is_empty():
+            self._show_cached()
 
         self.data_loading.emit(True)
 
         def load_payments_task() -> tuple[list[Policy], list[Deal], list[Payment]]:
-            policies = self._context.api.fetch_policies()
-            deals = self._context.api.fetch_deals()
-            payments = self._context.api.fetch_payments_for_policies(policies)
+            api = self._context.api
+            cancelled = cancel_check()
+            policies, deals = api.fetch_many([api.fetch_policies, api.fetch_deals], cancelled=cancelled)
+            payments = api.fetch_payments_for_policies(policies, cancelled=cancelled)
             return policies, deals, payments
 
         worker = Worker(load_payments_task)
         worker.finished.connect(self._on_payments_loaded)  # type: ignore[arg-type]
         worker.error.connect(self._on_load_error)  # type: ignore[arg-type]
-        self._worker_pool.start("load_payments", worker)
+        self._worker_pool.start("load_payments", worker, coalesce=True)
 
     def _on_payments_loaded(self, result: Any) -> None:
         """Handle successful payments load.
@@ -93,8 +95,25 @@ class FinanceTab(BaseTableTab):
 
         self._context.update_policies(policies)
         self._context.update_deals(deals)
+        self._context.update_payments(payments)
         self.populate(self._to_rows(payments))
 
+    def _show_cached(self) -> bool:
+        """Populate the table from the context cache; return False if it is empty."""
+        # For finance tab, we show cached policies and their payments
+        cached_policies = list(self._context.cache.policies.values())
+        if not cached_policies:
+            return False
+        self._policies = cached_policies
+        self._deals = list(self._context.cache.deals.values())
+        self._payments = list(self._context.cache.payments.values())
+        self.populate(self._to_rows(self._payments))
+        return True
+
+    def apply_live_update(self, update: LiveUpdate) -> None:
+        if update.kind == "payments":
+            self.patch_rows(self._payments, update, self._to_rows)
+
     def _on_load_error(self, error_message: str) -> None:
         """Handle load error.
 
@@ -104,14 +123,8 @@ class FinanceTab(BaseTableTab):
         self.data_loading.emit(False)
 
         # Try to show cached data if available
-        # For finance tab, we show cached policies and their payments
-        cached_policies = list(self._context.cache.policies.values())
-        if cached_policies:
+        if self._show_cached():
             logger.warning("API error, showing cached data: %s", error_message)
-            self._policies = cached_policies
-            self._deals = list(self._context.cache.deals.values())
-            self._payments = []
-            self.populate(self._to_rows([]))
             self.operation_error.emit(_("Showing cached data (network error: {})").format(error_message))
         else:
             # No cache available
@@ -3,13 +3,13 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import QLabel, QPushButton, QVBoxLayout, QWidget
 
 from api.client import APIClientError
 from core.app_context import AppContext
 from models import StatCounters
-from ui.worker import Worker, WorkerPool
+from ui.worker import Worker, WorkerPool, cancel_check
 from i18n import _
 
 logger = logging.getLogger(__name__)
@@ -18,6 +18,7 @@ logger = logging.getLogger(__name__)
 class HomeTab(QWidget):
     # Signal to allow main window to refresh stats when tab becomes active
     stats_refreshing = Signal()
+    stats_loaded = Signal()
 
     def __init__(self, *, context: AppContext, parent=None) -> None:
         super().__init__(parent)
@@ -54,24 +55,32 @@ class HomeTab(QWidget):
         layout.addStretch(1)
         layout.addWidget(self.refresh_button, alignment=Qt.AlignmentFlag.AlignRight)
 
-        self.refresh_stats()
+        # Counts from the local replica first; the request starts after the first paint.
+        self._stats = self._cached_stats()
+        self._render()
+        QTimer.singleShot(0, self.refresh_stats)
+
+    def _cached_stats(self) -> StatCounters:
+        cache = self._context.cache
+        return StatCounters(
+            clients=len(cache.clients),
+            deals=len(cache.deals),
+            policies=len(cache.policies),
+            tasks=len(cache.tasks),
+        )
 
     def refresh_stats(self) -> None:
         """Load stats from API in background thread."""
-        if self._worker_pool.is_running("load_stats"):
-            logger.debug("Stats load already in progress")
-            return
-
         self.refresh_button.setEnabled(False)
         self.refresh_button.setText(_("Loading..."))
 
         def load_stats_task() -> StatCounters:
-            return self._context.api.fetch_stats()
+            return self._context.api.fetch_stats(cancelled=cancel_check())
 
         worker = Worker(load_stats_task)
         worker.finished.connect(self._on_stats_loaded)  # type: ignore[arg-type]
         worker.error.connect(self._on_stats_error)  # type: ignore[arg-type]
-        self._worker_pool.start("load_stats", worker)
+        self._worker_pool.start("load_stats", worker, coalesce=True)
 
     def _on_stats_loaded(self, stats: Any) -> None:
         """Handle successful stats load.
@@ -89,6 +98,7 @@ class HomeTab(QWidget):
             logger.error("Invalid stats type: %s", type(stats))
 
         self._render()
+        self.stats_loaded.emit()
 
     def _on_stats_error(self, error_message: str) -> None:
         """Handle stats load error.
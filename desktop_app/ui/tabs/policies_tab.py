@@ -7,10 +7,11 @@ from PySide6.QtWidgets import QDialog, QMessageBox
 
 from api.client import APIClientError
 from core.app_context import AppContext
+from core.live_updates import LiveUpdate
 from models import Client, Deal, Policy
 from ui.base_table import BaseTableTab
 from ui.dialogs.policy_dialog import PolicyDialog
-from ui.worker import Worker, WorkerPool
+from ui.worker import Worker, WorkerPool, cancel_check
 from i18n import _
 
 logger = logging.getLogger(__name__)
@@ -47,22 +48,24 @@ class PoliciesTab(BaseTableTab):
 
     def load_data(self) -> None:
         """Load policies from API in background thread."""
-        if self._worker_pool.is_running("load_policies"):
-            logger.debug("Policies load already in progress")
-            return
+        # Show the replica straight away; the API response replaces it
+        if self.is_empty():
+            self._show_cached()
 
         self.data_loading.emit(True)
 
         def load_policies_task() -> tuple[list[Policy], list, list]:
-            policies = self._context.api.fetch_policies()
-            clients = self._context.api.fetch_clients()
-            deals = self._context.api.fetch_deals()
+            api = self._context.api
+            policies, clients, deals = api.fetch_many(
+                [api.fetch_policies, api.fetch_clients, api.fetch_deals],
+                cancelled=cancel_check(),
+            )
             return policies, clients, deals
 
         worker = Worker(load_policies_task)
         worker.finished.connect(self._on_policies_loaded)  # type: ignore[arg-type]
         worker.error.connect(self._on_load_error)  # type: ignore[arg-type]
-        self._worker_pool.start("load_policies", worker)
+        self._worker_pool.start("load_policies", worker, coalesce=True)
 
     def _on_policies_loaded(self, result: Any) -> None:
         """Handle successful policies load.
@@ -89,6 +92,21 @@ class PoliciesTab(BaseTableTab):
         self._context.update_deals(deals)
         self.populate(self._to_rows(policies))
 
+    def _show_cached(self) -> bool:
+        """Populate the table from the context cache; return False if it is empty."""
+        cached_policies = list(self._context.cache.policies.values())
+        if not cached_policies:
+            return False
+        self._policies = cached_policies
+        self._clients = list(self._context.cache.clients.values())
+        self._deals = list(self._context.cache.deals.values())
+        self.populate(self._to_rows(cached_policies))
+        return True
+
+    def apply_live_update(self, update: LiveUpdate) -> None:
+        if update.kind == "policies":
+            self.patch_rows(self._policies, update, self._to_rows)
+
     def _on_load_error(self, error_message: str) -> None:
         """Handle load error.
 
@@ -98,13 +116,8 @@ class PoliciesTab(BaseTableTab):
         self.data_loading.emit(False)
 
         # Try to show cached data if available
-        cached_policies = list(self._context.cache.policies.values())
-        if cached_policies:
+        if self._show_cached():
             logger.warning("API error, showing cached data: %s", error_message)
-            self._policies = cached_policies
-            self._clients = list(self._context.cache.clients.values())
-            self._deals = list(self._context.cache.deals.values())
-            self.populate(self._to_rows(cached_policies))
             self.operation_error.emit(_("Showing cached data (network error: {})").format(error_message))
         else:
             # No cache available
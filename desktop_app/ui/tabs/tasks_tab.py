@@ -7,16 +7,20 @@ from PySide6.QtWidgets import QDialog, QMessageBox
 
 from api.client import APIClientError
 from core.app_context import AppContext
+from core.live_updates import LiveUpdate
 from models import Client, Deal, Policy, Task
 from ui.base_table import BaseTableTab
 from ui.dialogs.task_dialog import TaskDialog
-from ui.worker import Worker, WorkerPool
+from ui.worker import Worker, WorkerPool, cancel_check
 from i18n import _
 
 logger = logging.getLogger(__name__)
 
 
 class TasksTab(BaseTableTab):
+    # Tasks are the only collection the CRM API paginates (limit <= 200).
+    page_size = 200
+
     def __init__(self, *, context: AppContext, parent=None) -> None:
         super().__init__(
             columns=[_("ID"), _("Title"), _("Description"), _("Status"), _("Assignee"), _("Author"), _("Deal"), _("Policy"), _("Due"), _("Created"), _("Updated"), _("Deleted")],
@@ -29,47 +33,60 @@ class TasksTab(BaseTableTab):
         self._context = context
         self._worker_pool = WorkerPool()
         self._tasks: list[Task] = []
+        self._server_offset = 0
         self._clients: list[Client] = []
         self._deals: list[Deal] = []
         self._policies: list[Policy] = []
 
     def load_data(self) -> None:
         """Load tasks from API in background thread."""
-        if self._worker_pool.is_running("load_tasks"):
-            logger.debug("Tasks load already in progress")
-            return
+        # Show the replica straight away; the API response replaces it
+        if self.is_empty():
+            self._show_cached()
 
         self.data_loading.emit(True)
 
-        def load_tasks_task() -> tuple[list[Task], list[Deal], list[Policy], list[Client]]:
-            tasks = self._context.api.fetch_tasks()
-            deals = self._context.api.fetch_deals()
-            policies = self._context.api.fetch_policies()
-            clients = self._context.api.fetch_clients()
-            return tasks, deals, policies, clients
+        def load_tasks_task() -> tuple[tuple[list[Task], bool], list[Deal], list[Policy], list[Client]]:
+            api = self._context.api
+            page, deals, policies, clients = api.fetch_many(
+                [
+                    lambda: api.fetch_tasks_page(self.page_size),
+                    api.fetch_deals,
+                    api.fetch_policies,
+                    api.fetch_clients,
+                ],
+                cancelled=cancel_check(),
+            )
+            return page, deals, policies, clients
 
         worker = Worker(load_tasks_task)
         worker.finished.connect(self._on_tasks_loaded)  # type: ignore[arg-type]
         worker.error.connect(self._on_load_error)  # type: ignore[arg-type]
-        self._worker_pool.start("load_tasks", worker)
+        self._worker_pool.start("load_tasks", worker, coalesce=True)
 
     def _on_tasks_loaded(self, result: Any) -> None:
         """Handle successful tasks load.
 
         Args:
-            result: Tuple with tasks, deals, policies and clients
+            result: Tuple with the first tasks page, deals, policies and clients
         """
         self.data_loading.emit(False)
         if not isinstance(result, tuple) or len(result) != 4:
             self.operation_error.emit(_("Invalid response type"))
             return
 
-        tasks, deals, policies, clients = result
+        page, deals, policies, clients = result
+        if not isinstance(page, tuple) or len(page) != 2:
+            self.operation_error.emit(_("Invalid response type"))
+            return
+
+        tasks, has_more = page
         if not isinstance(tasks, list) or not isinstance(deals, list) or not isinstance(policies, list) or not isinstance(clients, list):
             self.operation_error.emit(_("Invalid response type"))
             return
 
         self._tasks = tasks
+        self._server_offset = self.page_size
         self._deals = deals
         self._policies = policies
         self._clients = clients
@@ -78,7 +95,56 @@ class TasksTab(BaseTableTab):
         self._context.update_deals(deals)
         self._context.update_policies(policies)
         self._context.update_clients(clients)
-        self.populate(self._to_rows(tasks))
+        self.populate(self._to_rows(tasks), has_more=has_more)
+
+    def load_more(self, offset: int) -> None:
+        """Load the next page of tasks when the table is scrolled to the end."""
+        if self._worker_pool.is_running("load_tasks") or self._worker_pool.is_running("load_more_tasks"):
+            self.cancel_page_load()
+            return
+
+        # Offset is counted in server records, cancelled tasks included.
+        server_offset = self._server_offset
+
+        def load_page_task() -> tuple[list[Task], bool]:
+            return self._context.api.fetch_tasks_page(self.page_size, server_offset)
+
+        worker = Worker(load_page_task)
+        worker.finished.connect(self._on_tasks_page_loaded)  # type: ignore[arg-type]
+        worker.error.connect(self._on_tasks_page_error)  # type: ignore[arg-type]
+        self._worker_pool.start("load_more_tasks", worker)
+
+    def _on_tasks_page_loaded(self, result: Any) -> None:
+        if not isinstance(result, tuple) or len(result) != 2:
+            self.cancel_page_load()
+            self.operation_error.emit(_("Invalid response type"))
+            return
+
+        tasks, has_more = result
+        self._server_offset += self.page_size
+        self._tasks.extend(tasks)
+        self._context.update_tasks(tasks)
+        self.append_page(self._to_rows(tasks), has_more=has_more)
+
+    def _on_tasks_page_error(self, error_message: str) -> None:
+        self.cancel_page_load()
+        self.operation_error.emit(error_message)
+
+    def _show_cached(self) -> bool:
+        """Populate the table from the context cache; return False if it is empty."""
+        cached_tasks = list(self._context.cache.tasks.values())
+        if not cached_tasks:
+            return False
+        self._tasks = cached_tasks
+        self._deals = list(self._context.cache.deals.values())
+        self._policies = list(self._context.cache.policies.values())
+        self._clients = list(self._context.cache.clients.values())
+        self.populate(self._to_rows(cached_tasks))
+        return True
+
+    def apply_live_update(self, update: LiveUpdate) -> None:
+        if update.kind == "tasks":
+            self.patch_rows(self._tasks, update, self._to_rows)
 
     def _on_load_error(self, error_message: str) -> None:
         """Handle load error.
@@ -89,14 +155,8 @@ class TasksTab(BaseTableTab):
         self.data_loading.emit(False)
 
         # Try to show cached data if available
-        cached_tasks = list(self._context.cache.tasks.values())
-        if cached_tasks:
+        if self._show_cached():
             logger.warning("API error, showing cached data: %s", error_message)
-            self._tasks = cached_tasks
-            self._deals = list(self._context.cache.deals.values())
-            self._policies = list(self._context.cache.policies.values())
-            self._clients = list(self._context.cache.clients.values())
-            self.populate(self._to_rows(cached_tasks))
             self.operation_error.emit(_("Showing cached data (network error: {})").format(error_message))
         else:
             # No cache available
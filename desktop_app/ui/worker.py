@@ -1,19 +1,101 @@
-"""Worker threads for background operations."""
+"""Background operations on a shared thread pool."""
 
 from __future__ import annotations
 
 import logging
-from typing import Any, Callable
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
 
 logger = logging.getLogger(__name__)
 
+# Upper bound of concurrently running operations across all tabs
+MAX_CONCURRENT_WORKERS = 4
+# Operations slower than this (queue wait + run) are logged at INFO level
+SLOW_OPERATION_SECONDS = 1.0
 
-class Worker(QThread):
-    """Worker thread for executing long-running operations.
+_thread_pool: QThreadPool | None = None
+_current = threading.local()
 
-    Executes a function in a separate thread and emits signals for result/error handling.
+
+def _shared_pool() -> QThreadPool:
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = QThreadPool()
+        _thread_pool.setMaxThreadCount(MAX_CONCURRENT_WORKERS)
+    return _thread_pool
+
+
+class CancellationToken:
+    """Cooperative cancellation flag shared between the UI and a worker."""
+
+    __slots__ = ("_event",)
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+def current_cancel_token() -> Optional[CancellationToken]:
+    """Token of the worker running in the calling thread, if any.
+
+    Long operations can poll it between steps and return early.
+    """
+    return getattr(_current, "token", None)
+
+
+def cancel_check() -> Callable[[], bool]:
+    """Callback telling whether the calling worker has been cancelled.
+
+    Passed as ``cancelled`` to the multi-request ``APIClient`` loads so a
+    superseded worker stops waiting for (and starting) further requests.
+    """
+    token = current_cancel_token()
+    if token is None:
+        return lambda: False
+    return lambda: token.cancelled
+
+
+@dataclass(slots=True)
+class WorkerTiming:
+    """Accumulated queue-wait and run time of one operation key."""
+
+    count: int = 0
+    wait_total: float = 0.0
+    run_total: float = 0.0
+    run_max: float = 0.0
+
+    def add(self, wait: float, run: float) -> None:
+        self.count += 1
+        self.wait_total += wait
+        self.run_total += run
+        self.run_max = max(self.run_max, run)
+
+
+_timings: dict[str, WorkerTiming] = {}
+_timings_lock = threading.Lock()
+
+
+def worker_timings() -> dict[str, WorkerTiming]:
+    """Snapshot of per-operation timings collected since start."""
+    with _timings_lock:
+        return {key: WorkerTiming(t.count, t.wait_total, t.run_total, t.run_max) for key, t in _timings.items()}
+
+
+class Worker(QObject):
+    """Operation executed on the shared thread pool.
+
+    Emits its signals on the UI thread. A cancelled worker emits nothing,
+    so results of a request superseded by a newer one are dropped.
 
     Signals:
         finished: Emitted when operation completes successfully with result
@@ -25,6 +107,10 @@ class Worker(QThread):
     error = Signal(str)  # Error message
     progress = Signal(int)  # Progress percentage
 
+    # Internal: delivered from the pool thread, re-checked on the UI thread
+    _succeeded = Signal(object)
+    _failed = Signal(str)
+
     def __init__(
         self,
         func: Callable[..., Any],
@@ -42,47 +128,118 @@ class Worker(QThread):
         self.func = func
         self.args = args
         self.kwargs = kwargs
+        self.token = CancellationToken()
+        self.key = getattr(func, "__name__", "worker")
+        self._done = threading.Event()
+        self._queued_at = 0.0
+        # Workers coalesced into this one; kept alive until the result is forwarded
+        self._joined: list[Worker] = []
+        self._succeeded.connect(self._deliver_result)
+        self._failed.connect(self._deliver_error)
+
+    def cancel(self) -> None:
+        self.token.cancel()
+
+    def is_running(self) -> bool:
+        """True from submission until the result has been produced."""
+        return self._queued_at > 0 and not self._done.is_set()
 
     def run(self) -> None:
-        """Execute function in thread (automatically called by start())."""
+        """Execute the function in the calling thread (called by the pool)."""
+        started = time.perf_counter()
+        wait = started - self._queued_at if self._queued_at else 0.0
+        if self.token.cancelled:
+            self._done.set()
+            return
+        _current.token = self.token
         try:
-            logger.debug("Worker starting: %s", self.func.__name__)
+            logger.debug("Worker starting: %s", self.key)
             result = self.func(*self.args, **self.kwargs)
-            self.finished.emit(result)
-            logger.debug("Worker finished: %s", self.func.__name__)
         except Exception as exc:
-            logger.exception("Worker error in %s: %s", self.func.__name__, exc)
-            self.error.emit(str(exc))
+            if self.token.cancelled:
+                logger.debug("Worker %s stopped after cancellation: %s", self.key, exc)
+            else:
+                logger.exception("Worker error in %s: %s", self.key, exc)
+            self._done.set()
+            self._emit(self._failed, str(exc))
+        else:
+            self._done.set()
+            self._emit(self._succeeded, result)
+        finally:
+            _current.token = None
+            self._record_timing(wait, time.perf_counter() - started)
+
+    def _emit(self, signal: Any, value: Any) -> None:
+        try:
+            signal.emit(value)
+        except RuntimeError:
+            # The receiver was destroyed (window closed) while the function ran.
+            logger.debug("Dropping result of %s: worker was deleted", self.key)
+
+    def _record_timing(self, wait: float, run: float) -> None:
+        with _timings_lock:
+            _timings.setdefault(self.key, WorkerTiming()).add(wait, run)
+        level = logging.INFO if wait + run >= SLOW_OPERATION_SECONDS else logging.DEBUG
+        logger.log(level, "Worker %s: queued %.0f ms, ran %.0f ms", self.key, wait * 1000, run * 1000)
+
+    @Slot(object)
+    def _deliver_result(self, result: Any) -> None:
+        if not self.token.cancelled:
+            self.finished.emit(result)
+
+    @Slot(str)
+    def _deliver_error(self, message: str) -> None:
+        if not self.token.cancelled:
+            self.error.emit(message)
+
+
+class _WorkerRunnable(QRunnable):
+    def __init__(self, worker: Worker) -> None:
+        super().__init__()
+        self._worker = worker
+        self.setAutoDelete(True)
+
+    def run(self) -> None:
+        self._worker.run()
 
 
 class WorkerPool:
-    """Simple worker pool to manage multiple threads.
+    """Keyed submission of workers to the shared thread pool.
 
-    Tracks active workers and prevents multiple concurrent operations on same resource.
+    At most one worker per key is tracked. ``start`` cancels a running
+    worker with the same key without blocking (its result is dropped);
+    ``start(..., coalesce=True)`` instead lets the new worker share the
+    result of the one already in flight.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, thread_pool: QThreadPool | None = None) -> None:
         """Initialize empty pool."""
+        self._thread_pool = thread_pool
         self._workers: dict[str, Worker] = {}
 
-    def start(self, key: str, worker: Worker) -> None:
-        """Start worker, replacing any existing worker with same key.
+    def start(self, key: str, worker: Worker, *, coalesce: bool = False) -> None:
+        """Submit worker, superseding or joining a running worker with the same key.
 
         Args:
             key: Unique identifier for this operation (e.g., 'load_clients')
-            worker: Worker thread to start
+            worker: Worker to run
+            coalesce: Reuse the in-flight worker's result instead of starting a new request
         """
-        # Clean up previous worker if exists
-        if key in self._workers:
-            old_worker = self._workers[key]
-            if old_worker.isRunning():
-                old_worker.quit()
-                old_worker.wait()
+        current = self._workers.get(key)
+        if current is not None and current.is_running():
+            if coalesce:
+                current._joined.append(worker)
+                current.finished.connect(worker.finished.emit)
+                current.error.connect(worker.error.emit)
+                return
+            current.cancel()
 
+        worker.key = key
         self._workers[key] = worker
-        worker.finished.connect(lambda: self._on_finished(key))
-        worker.error.connect(lambda: self._on_finished(key))
-        worker.start()
+        worker.finished.connect(lambda _result, w=worker: self._release(key, w))
+        worker.error.connect(lambda _message, w=worker: self._release(key, w))
+        worker._queued_at = time.perf_counter()
+        (self._thread_pool or _shared_pool()).start(_WorkerRunnable(worker))
 
     def is_running(self, key: str) -> bool:
         """Check if worker with given key is running.
@@ -93,27 +250,21 @@ class WorkerPool:
         Returns:
             True if worker is running, False otherwise
         """
-        if key not in self._workers:
-            return False
-        return self._workers[key].isRunning()
+        worker = self._workers.get(key)
+        return worker is not None and worker.is_running()
 
-    def _on_finished(self, key: str) -> None:
-        """Cleanup when worker finishes.
+    def cancel(self, key: str) -> None:
+        worker = self._workers.pop(key, None)
+        if worker is not None:
+            worker.cancel()
 
-        Args:
-            key: Operation identifier
-        """
-        if key in self._workers:
-            worker = self._workers[key]
-            worker.quit()
-            worker.wait()
-            # Keep for 1 second reference, then remove
-            # In practice would use deleteLater, but for simplicity just remove
+    def _release(self, key: str, worker: Worker) -> None:
+        """Forget a finished worker unless it was already replaced."""
+        if self._workers.get(key) is worker:
+            del self._workers[key]
 
     def cleanup(self) -> None:
-        """Stop and cleanup all workers."""
-        for worker in list(self._workers.values()):
-            if worker.isRunning():
-                worker.quit()
-                worker.wait()
+        """Cancel all workers; running functions finish but their results are dropped."""
+        for worker in self._workers.values():
+            worker.cancel()
         self._workers.clear()